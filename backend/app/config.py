@@ -3,6 +3,7 @@ Application configuration using Pydantic Settings
 """
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Dict, Optional
 
 
 class Settings(BaseSettings):
@@ -15,12 +16,66 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "dev-secret-key-change-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # Key rotation: JSON object of key id -> secret; new tokens are signed with
+    # JWT_ACTIVE_KID. Tokens without a kid header are verified with SECRET_KEY,
+    # but only while JWT_SIGNING_KEYS is empty.
+    JWT_SIGNING_KEYS: Dict[str, str] = {}
+    JWT_ACTIVE_KID: Optional[str] = None
+    # Verified tokens are cached briefly so repeat requests skip signature checks
+    TOKEN_CACHE_MAX_ENTRIES: int = 10000
+    TOKEN_CACHE_TTL_SECONDS: int = 60
+    # Revoked token ids are synced from the database into a bloom filter this often
+    TOKEN_REVOCATION_SYNC_SECONDS: int = 30
+    # Refresh tokens extend a session without re-entering the password
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 30
     
     # Application
     DEBUG: bool = True
     APP_NAME: str = "ViralPrompt"
     APP_VERSION: str = "1.0.0"
     
+    # Response cache (anonymous public reads)
+    CACHE_ENABLED: bool = True
+    CACHE_TTL_SECONDS: int = 10
+    CACHE_MAX_ENTRIES: int = 1024
+    CACHE_REDIS_URL: Optional[str] = None
+    
+    # Feed snapshot rendered into the home, trending and prompt library pages
+    FEED_SNAPSHOT_SIZE: int = 24
+    FEED_SNAPSHOT_REFRESH_SECONDS: int = 30
+    
+    # Collection cover mosaics (first item thumbnails per collection)
+    COLLECTION_COVER_SIZE: int = 4
+    COLLECTION_COVER_TTL_SECONDS: int = 300
+    
+    # Per-request SQL instrumentation (requests over either threshold are logged)
+    SLOW_REQUEST_QUERY_COUNT: int = 20
+    SLOW_REQUEST_DB_MS: int = 200
+    
+    # Prometheus metrics (/metrics); with several workers point METRICS_MULTIPROC_DIR
+    # at a shared directory that is emptied before they start
+    METRICS_MULTIPROC_DIR: Optional[str] = None
+    METRICS_FLUSH_SECONDS: float = 5
+    EVENT_LOOP_LAG_INTERVAL_SECONDS: float = 0.5
+    
+    # Event-loop stall watchdog (logs the blocking stack of stalls over the threshold)
+    LOOP_WATCHDOG_ENABLED: bool = False
+    LOOP_STALL_THRESHOLD_MS: int = 100
+    
+    # Readiness probe (/health/ready)
+    READINESS_CACHE_SECONDS: float = 2
+    READINESS_DB_TIMEOUT_SECONDS: float = 1
+    READINESS_MAX_POOL_SATURATION: float = 0.9
+    READINESS_MAX_FEED_SNAPSHOT_AGE_SECONDS: int = 120
+    
+    # Startup warm-up (pool connections, templates, hot queries and caches)
+    WARMUP_ENABLED: bool = True
+    WARMUP_POOL_CONNECTIONS: int = 5
+    WARMUP_TIMEOUT_SECONDS: float = 30
+    # Base URL requests reach the app with (scheme and Host, e.g. https://viralprompt.ai);
+    # rendered pages are cached per base URL, so pages are only warmed when it is set
+    WARMUP_BASE_URL: Optional[str] = None
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -6,6 +6,7 @@ from sqlalchemy.orm import DeclarativeBase
 from typing import AsyncGenerator
 
 from .config import get_settings
+from .utils.query_metrics import install_query_hooks
 
 settings = get_settings()
 
@@ -16,6 +17,9 @@ engine = create_async_engine(
     future=True
 )
 
+# Attribute statement counts and DB time to the request that issued them
+install_query_hooks(engine)
+
 # Create async session factory
 async_session_maker = async_sessionmaker(
     engine,
@@ -3,21 +3,34 @@ ViralPrompt FastAPI Application
 
 Main entry point for the backend application.
 """
-from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
+from fastapi import FastAPI, Response, status
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
 from .config import get_settings
-from .database import init_db
+from .database import engine, init_db
+from .services.feed_snapshot import feed_snapshot_service
+from .services.health import readiness_probe
+from .services.token_revocation import token_revocation_service
+from .services.warmup import warmup_service
+from .utils.assets import PrecompressedStaticFiles
+from .utils.cache import response_cache
+from .utils.loop_monitor import loop_watchdog
+from .utils.metrics import PrometheusMiddleware, metrics_service, pool_collector, registry
+from .utils.query_metrics import QueryMetricsMiddleware, route_query_metrics
+from .utils.singleflight import singleflight
 from .routers import (
     pages_router,
     auth_router,
     users_router,
     prompts_router,
     content_router,
-    collections_router
+    collections_router,
+    comments_router,
+    admin_router
 )
+from .routers.pages import templates
 
 settings = get_settings()
 
@@ -29,9 +42,23 @@ async def lifespan(app: FastAPI):
     print(f"🚀 Starting {settings.APP_NAME} v{settings.APP_VERSION}")
     # Uncomment to auto-create tables (for development)
     # await init_db()
+    feed_snapshot_service.start()
+    token_revocation_service.start()
+    response_cache.start()
+    metrics_service.start()
+    if settings.LOOP_WATCHDOG_ENABLED:
+        loop_watchdog.start()
+    if settings.WARMUP_ENABLED:
+        warmup_service.start(app, templates)
     yield
     # Shutdown
     print("👋 Shutting down...")
+    await warmup_service.stop()
+    await feed_snapshot_service.stop()
+    await token_revocation_service.stop()
+    await response_cache.close()
+    await metrics_service.stop()
+    await loop_watchdog.stop()
 
 
 # Create FastAPI application
@@ -53,8 +80,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Mount static files
-app.mount("/static", StaticFiles(directory="static"), name="static")
+# Per-request SQL statement count and DB time (Server-Timing in debug)
+app.add_middleware(QueryMetricsMiddleware)
+
+# Prometheus request metrics (outermost, so latency covers every other middleware)
+app.add_middleware(PrometheusMiddleware)
+registry.add_collector(pool_collector(engine))
+
+# Mount static files (fingerprinted assets under /static/dist are served
+# precompressed with immutable caching; run `python -m app.utils.assets`)
+app.mount("/static", PrecompressedStaticFiles(directory="static"), name="static")
 
 # Include routers
 # API routes
@@ -63,6 +98,8 @@ app.include_router(users_router)
 app.include_router(prompts_router)
 app.include_router(content_router)
 app.include_router(collections_router)
+app.include_router(comments_router)
+app.include_router(admin_router)
 
 # Page routes (must be last to avoid conflicts)
 app.include_router(pages_router)
@@ -78,6 +115,44 @@ async def health_check():
     }
 
 
+@app.get("/health/live", include_in_schema=False)
+async def liveness():
+    """Liveness probe: the worker's event loop is answering"""
+    return {"status": "alive"}
+
+
+@app.get("/health/ready", include_in_schema=False)
+async def readiness():
+    """Readiness probe: 503 while a dependency check fails (cached briefly)"""
+    report = await readiness_probe.report()
+    return JSONResponse(
+        report.to_dict(),
+        status_code=status.HTTP_200_OK if report.ready else status.HTTP_503_SERVICE_UNAVAILABLE
+    )
+
+
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics():
+    """Prometheus text exposition, merged across workers in multiprocess mode"""
+    return Response(registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@app.get("/metrics/singleflight", include_in_schema=False)
+async def singleflight_metrics():
+    """Per-key request coalescing counters for this worker"""
+    return {
+        "in_flight": singleflight.in_flight(),
+        "keys": singleflight.stats()
+    }
+
+
+@app.get("/metrics/queries", include_in_schema=False)
+async def query_metrics():
+    """Per-route histograms of SQL statement count, DB time and request time for this worker"""
+    return route_query_metrics.snapshot()
+
+
+# Development server; in production run `gunicorn -c gunicorn.conf.py`
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
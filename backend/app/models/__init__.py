@@ -1,12 +1,12 @@
 # Models package
-from .user import User, UserFollower, UserSettings
+from .user import User, UserFollower, UserSettings, RevokedToken, RefreshToken
 from .prompt import Prompt, PromptCategory, PromptTag, PromptTagRelation, PromptLike, PromptSave
 from .content import Content, ContentTag, ContentLike, ContentView, Comment
 from .collection import Collection, CollectionItem
 from .analytics import GenerationJob, CreditTransaction, TrendingContent, TrendingHashtag, UserAnalytics, Notification
 
 __all__ = [
-    "User", "UserFollower", "UserSettings",
+    "User", "UserFollower", "UserSettings", "RevokedToken", "RefreshToken",
     "Prompt", "PromptCategory", "PromptTag", "PromptTagRelation", "PromptLike", "PromptSave",
     "Content", "ContentTag", "ContentLike", "ContentView", "Comment",
     "Collection", "CollectionItem",
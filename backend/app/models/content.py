@@ -1,6 +1,7 @@
 """
 Content-related SQLAlchemy models
 """
+import time
 import uuid
 from datetime import datetime
 from sqlalchemy import Column, String, Boolean, Integer, Text, DateTime, ForeignKey, BigInteger
@@ -77,6 +78,16 @@ class ContentView(Base):
     content = relationship("Content", back_populates="views")
 
 
+def comment_path_segment(comment_id: uuid.UUID) -> str:
+    """Materialized-path segment for a comment
+
+    14 hex digits of microseconds since the epoch followed by 6 hex digits of
+    the id, so siblings sort chronologically and every segment has the same
+    length. db/migrations/002 backfills existing rows with the same format.
+    """
+    return f"{time.time_ns() // 1000:014x}{comment_id.hex[:6]}"
+
+
 class Comment(Base):
     """Comment model"""
     __tablename__ = "comments"
@@ -85,6 +96,11 @@ class Comment(Base):
     content_id = Column(UUID(as_uuid=True), ForeignKey("content.id", ondelete="CASCADE"))
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"))
     parent_id = Column(UUID(as_uuid=True), ForeignKey("comments.id", ondelete="CASCADE"))
+    # Materialized path: dot-separated segments from the top-level comment down
+    # to this one. Byte ("C") collation makes a subtree a contiguous index range.
+    root_id = Column(UUID(as_uuid=True), nullable=False)
+    path = Column(Text(collation="C"), nullable=False)
+    depth = Column(Integer, default=0, nullable=False)
     body = Column(Text, nullable=False)
     like_count = Column(Integer, default=0)
     is_edited = Column(Boolean, default=False)
@@ -27,6 +27,8 @@ class User(Base):
     is_premium = Column(Boolean, default=False)
     credits_balance = Column(Integer, default=50)
     role = Column(String(20), default="user")
+    follower_count = Column(Integer, default=0, nullable=False)
+    following_count = Column(Integer, default=0, nullable=False)
     email_verified_at = Column(DateTime)
     last_login_at = Column(DateTime)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -64,3 +66,25 @@ class UserSettings(Base):
     
     # Relationships
     user = relationship("User", back_populates="settings")
+
+
+class RevokedToken(Base):
+    """Access token revoked before its expiry (e.g. on logout)"""
+    __tablename__ = "revoked_tokens"
+    
+    jti = Column(String(64), primary_key=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"))
+    expires_at = Column(DateTime, nullable=False, index=True)
+    revoked_at = Column(DateTime, default=datetime.utcnow)
+
+
+class RefreshToken(Base):
+    """Refresh token, stored by keyed hash; each use replaces it with a new one in the same family"""
+    __tablename__ = "refresh_tokens"
+    
+    token_hash = Column(String(64), primary_key=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    family_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    expires_at = Column(DateTime, nullable=False, index=True)
+    used_at = Column(DateTime)
+    created_at = Column(DateTime, default=datetime.utcnow)
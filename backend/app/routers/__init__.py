@@ -5,6 +5,8 @@ from .users import router as users_router
 from .prompts import router as prompts_router
 from .content import router as content_router
 from .collections import router as collections_router
+from .comments import router as comments_router
+from .admin import router as admin_router
 
 __all__ = [
     "pages_router",
@@ -12,5 +14,7 @@ __all__ = [
     "users_router",
     "prompts_router",
     "content_router",
-    "collections_router"
+    "collections_router",
+    "comments_router",
+    "admin_router"
 ]
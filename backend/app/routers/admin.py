@@ -0,0 +1,41 @@
+"""
+Admin diagnostics routes
+"""
+import asyncio
+import threading
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import PlainTextResponse
+
+from ..models.user import User
+from ..utils.loop_monitor import collapse, sample_stacks
+from .users import require_admin
+
+router = APIRouter(prefix="/api/admin", tags=["Admin"])
+
+# One profile per worker at a time; sampling has a cost of its own
+profile_lock = asyncio.Lock()
+
+
+@router.get("/profile", response_class=PlainTextResponse)
+async def profile_worker(
+    seconds: float = Query(10, gt=0, le=60),
+    interval_ms: float = Query(5, ge=1, le=100),
+    all_threads: bool = False,
+    current_user: User = Depends(require_admin)
+):
+    """Sample this worker for a few seconds and return collapsed stacks for a flamegraph
+    
+    Only the event-loop thread is sampled unless all_threads is set. The
+    worker keeps serving requests while the profile runs.
+    """
+    if profile_lock.locked():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A profile is already running on this worker"
+        )
+    
+    async with profile_lock:
+        loop_thread_id = None if all_threads else threading.get_ident()
+        stacks = await asyncio.to_thread(sample_stacks, seconds, interval_ms / 1000, loop_thread_id)
+    
+    return PlainTextResponse(collapse(stacks))
@@ -4,12 +4,17 @@ Authentication routes
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from datetime import timedelta
+from datetime import datetime, timedelta
+from typing import Optional
+from uuid import UUID
 
 from ..database import get_db
 from ..models.user import User, UserSettings
-from ..schemas.user import UserCreate, UserLogin, UserResponse, Token
-from ..utils.security import get_password_hash, verify_password, create_access_token
+from ..schemas.user import UserCreate, UserLogin, UserResponse, Token, RefreshTokenRequest
+from ..services.refresh_tokens import issue_refresh_token, rotate_refresh_token, revoke_refresh_token
+from ..services.token_revocation import token_revocation_service
+from ..utils.security import get_password_hash, verify_password, create_access_token, decode_access_token
+from .users import oauth2_scheme
 from ..config import get_settings
 
 router = APIRouter(prefix="/api/auth", tags=["Authentication"])
@@ -59,7 +64,7 @@ async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
 
 @router.post("/login", response_model=Token)
 async def login(credentials: UserLogin, db: AsyncSession = Depends(get_db)):
-    """Login and get access token"""
+    """Login and get access and refresh tokens"""
     # Find user by email
     result = await db.execute(select(User).where(User.email == credentials.email))
     user = result.scalar_one_or_none()
@@ -76,11 +81,53 @@ async def login(credentials: UserLogin, db: AsyncSession = Depends(get_db)):
         data={"sub": str(user.id)},
         expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     )
+    refresh_token = await issue_refresh_token(db, user.id)
     
-    return Token(access_token=access_token, token_type="bearer")
+    return Token(access_token=access_token, token_type="bearer", refresh_token=refresh_token)
+
+
+@router.post("/refresh", response_model=Token)
+async def refresh(data: RefreshTokenRequest, db: AsyncSession = Depends(get_db)):
+    """Exchange a refresh token for a new access token and refresh token"""
+    rotated = await rotate_refresh_token(db, data.refresh_token)
+    
+    if not rotated:
+        # Keep the family revocation a reused token triggers
+        await db.commit()
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired refresh token",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    
+    user_id, refresh_token = rotated
+    access_token = create_access_token(
+        data={"sub": str(user_id)},
+        expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    )
+    
+    return Token(access_token=access_token, token_type="bearer", refresh_token=refresh_token)
 
 
 @router.post("/logout")
-async def logout():
-    """Logout user (client should discard token)"""
+async def logout(
+    data: Optional[RefreshTokenRequest] = None,
+    token: Optional[str] = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db)
+):
+    """Logout user, revoking the presented access token and refresh token"""
+    if data:
+        await revoke_refresh_token(db, data.refresh_token)
+    
+    payload = decode_access_token(token) if token else None
+    
+    # Tokens issued before jti was added can't be revoked; they simply expire
+    if payload and payload.get("jti"):
+        await token_revocation_service.revoke(
+            db,
+            payload["jti"],
+            UUID(payload["sub"]) if payload.get("sub") else None,
+            datetime.utcfromtimestamp(payload["exp"])
+        )
+    
     return {"message": "Successfully logged out"}
@@ -3,21 +3,75 @@ Collections API routes
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from typing import Optional
+from sqlalchemy import select, func, insert, update, delete, tuple_
+from typing import Optional, List, Tuple
 from uuid import UUID
 
 from ..database import get_db
 from ..models.collection import Collection, CollectionItem
+from ..models.content import Content
+from ..models.prompt import Prompt
 from ..models.user import User
+from ..services.collection_covers import collection_cover_cache
 from ..schemas.collection import (
     CollectionCreate, CollectionUpdate, CollectionResponse,
-    CollectionListResponse, CollectionItemCreate
+    CollectionListResponse, CollectionSummary, CollectionItemCreate, CollectionItemResponse,
+    CollectionItemPage, CollectionItemsBulkUpdate, CollectionItemsBulkResult
 )
+from ..utils.serialization import model_response
 from .users import get_current_user, require_auth
 
 router = APIRouter(prefix="/api/collections", tags=["Collections"])
 
+# Spacing between consecutive display_order values. Moving an item takes the
+# midpoint of its new neighbours, so reorders touch one row until a gap runs out.
+ORDER_GAP = 1024
+
+
+def encode_item_cursor(display_order: int, item_id: UUID) -> str:
+    """Opaque keyset cursor for collection item pages"""
+    return f"{display_order}:{item_id}"
+
+
+def decode_item_cursor(cursor: str) -> Tuple[int, UUID]:
+    try:
+        display_order, item_id = cursor.split(":", 1)
+        return int(display_order), UUID(item_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def place_after(ordered: List[List], index: int) -> Optional[int]:
+    """display_order for a slot after ordered[index] (-1 for the front)
+
+    Returns None when the neighbours are adjacent and the list needs renumbering.
+    """
+    lower = ordered[index][1] if index >= 0 else None
+    upper = ordered[index + 1][1] if index + 1 < len(ordered) else None
+    if lower is None and upper is None:
+        return ORDER_GAP
+    if lower is None:
+        return upper - ORDER_GAP
+    if upper is None:
+        return lower + ORDER_GAP
+    if upper - lower > 1:
+        return (lower + upper) // 2
+    return None
+
+
+async def summarize_collections(db: AsyncSession, collections: List[Collection]) -> List[CollectionSummary]:
+    """Attach cover mosaic thumbnails to a page of collections"""
+    covers = await collection_cover_cache.get_many(db, [collection.id for collection in collections])
+    summaries = []
+    for collection in collections:
+        summary = CollectionSummary.model_validate(collection)
+        summary.preview_thumbnails = list(covers.get(collection.id, ()))
+        summaries.append(summary)
+    return summaries
+
 
 @router.get("", response_model=CollectionListResponse)
 async def list_collections(
@@ -44,12 +98,12 @@ async def list_collections(
     result = await db.execute(query)
     collections = result.scalars().all()
     
-    return CollectionListResponse(
-        items=collections,
+    return model_response(CollectionListResponse(
+        items=await summarize_collections(db, collections),
         total=total,
         page=page,
         page_size=page_size
-    )
+    ))
 
 
 @router.get("/me", response_model=CollectionListResponse)
@@ -74,12 +128,12 @@ async def my_collections(
     result = await db.execute(query)
     collections = result.scalars().all()
     
-    return CollectionListResponse(
-        items=collections,
+    return model_response(CollectionListResponse(
+        items=await summarize_collections(db, collections),
         total=total,
         page=page,
         page_size=page_size
-    )
+    ))
 
 
 @router.post("", response_model=CollectionResponse, status_code=status.HTTP_201_CREATED)
@@ -184,6 +238,7 @@ async def delete_collection(
     
     await db.delete(collection)
     await db.commit()
+    collection_cover_cache.invalidate(collection_id)
 
 
 @router.post("/{collection_id}/items", status_code=status.HTTP_201_CREATED)
@@ -215,15 +270,34 @@ async def add_item_to_collection(
             detail="Must provide either content_id or prompt_id"
         )
     
+    if item_data.content_id and item_data.prompt_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Provide only one of content_id or prompt_id"
+        )
+    
+    # Append after the current last item, leaving a gap for later reorders
+    result = await db.execute(
+        select(func.max(CollectionItem.display_order))
+        .where(CollectionItem.collection_id == collection_id)
+    )
+    last_order = result.scalar()
+    
     new_item = CollectionItem(
         collection_id=collection_id,
+        display_order=ORDER_GAP if last_order is None else last_order + ORDER_GAP,
         **item_data.model_dump()
     )
     
     db.add(new_item)
-    collection.item_count += 1
+    await db.execute(
+        update(Collection)
+        .where(Collection.id == collection_id)
+        .values(item_count=Collection.item_count + 1)
+    )
     
     await db.commit()
+    collection_cover_cache.invalidate(collection_id)
     
     return {"message": "Item added to collection"}
 
@@ -251,7 +325,12 @@ async def remove_item_from_collection(
             detail="Not authorized to modify this collection"
         )
     
-    result = await db.execute(select(CollectionItem).where(CollectionItem.id == item_id))
+    result = await db.execute(
+        select(CollectionItem).where(
+            CollectionItem.id == item_id,
+            CollectionItem.collection_id == collection_id
+        )
+    )
     item = result.scalar_one_or_none()
     
     if not item:
@@ -261,6 +340,198 @@ async def remove_item_from_collection(
         )
     
     await db.delete(item)
-    collection.item_count = max(0, collection.item_count - 1)
+    await db.execute(
+        update(Collection)
+        .where(Collection.id == collection_id)
+        .values(item_count=func.greatest(Collection.item_count - 1, 0))
+    )
+    
+    await db.commit()
+    collection_cover_cache.invalidate(collection_id)
+
+
+@router.get("/{collection_id}/items", response_model=CollectionItemPage)
+async def list_collection_items(
+    collection_id: UUID,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    current_user: Optional[User] = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """List a collection's items in display order with keyset pagination"""
+    result = await db.execute(select(Collection).where(Collection.id == collection_id))
+    collection = result.scalar_one_or_none()
+    
+    if not collection:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Collection not found"
+        )
+    
+    if not collection.is_public:
+        if not current_user or collection.user_id != current_user.id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Collection is private"
+            )
+    
+    query = select(CollectionItem).where(CollectionItem.collection_id == collection_id)
+    if cursor:
+        query = query.where(
+            tuple_(CollectionItem.display_order, CollectionItem.id) > decode_item_cursor(cursor)
+        )
+    
+    # Fetch one extra row to know whether another page follows
+    query = query.order_by(CollectionItem.display_order, CollectionItem.id).limit(limit + 1)
+    result = await db.execute(query)
+    items = result.scalars().all()
+    
+    has_more = len(items) > limit
+    items = items[:limit]
+    
+    # Hydrate referenced content and prompts with one IN query each
+    content_ids = [item.content_id for item in items if item.content_id]
+    prompt_ids = [item.prompt_id for item in items if item.prompt_id]
+    
+    content_by_id = {}
+    if content_ids:
+        result = await db.execute(select(Content).where(Content.id.in_(content_ids)))
+        content_by_id = {content.id: content for content in result.scalars()}
+    
+    prompts_by_id = {}
+    if prompt_ids:
+        result = await db.execute(select(Prompt).where(Prompt.id.in_(prompt_ids)))
+        prompts_by_id = {prompt.id: prompt for prompt in result.scalars()}
+    
+    return model_response(CollectionItemPage(
+        items=[
+            CollectionItemResponse(
+                id=item.id,
+                display_order=item.display_order,
+                added_at=item.added_at,
+                content=content_by_id.get(item.content_id),
+                prompt=prompts_by_id.get(item.prompt_id)
+            )
+            for item in items
+        ],
+        next_cursor=encode_item_cursor(items[-1].display_order, items[-1].id) if has_more else None
+    ))
+
+
+@router.patch("/{collection_id}/items", response_model=CollectionItemsBulkResult)
+async def bulk_update_collection_items(
+    collection_id: UUID,
+    changes: CollectionItemsBulkUpdate,
+    current_user: User = Depends(require_auth),
+    db: AsyncSession = Depends(get_db)
+):
+    """Add, remove and reorder many items in one transaction"""
+    # Lock the collection so concurrent bulk edits apply one after another
+    result = await db.execute(
+        select(Collection).where(Collection.id == collection_id).with_for_update()
+    )
+    collection = result.scalar_one_or_none()
+    
+    if not collection:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Collection not found"
+        )
+    
+    if collection.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to modify this collection"
+        )
+    
+    for item_data in changes.add:
+        if bool(item_data.content_id) == bool(item_data.prompt_id):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Each added item needs exactly one of content_id or prompt_id"
+            )
+    
+    # Current order as [id, display_order] pairs
+    result = await db.execute(
+        select(CollectionItem.id, CollectionItem.display_order)
+        .where(CollectionItem.collection_id == collection_id)
+        .order_by(CollectionItem.display_order, CollectionItem.id)
+    )
+    ordered = [[item_id, display_order] for item_id, display_order in result.all()]
+    
+    removed_ids = set(changes.remove) & {item_id for item_id, _ in ordered}
+    ordered = [entry for entry in ordered if entry[0] not in removed_ids]
+    
+    changed = set()
+    for move in changes.move:
+        ids = [item_id for item_id, _ in ordered]
+        if move.item_id not in ids or (move.after_item_id and move.after_item_id not in ids):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Moved items must belong to the collection"
+            )
+        if move.item_id == move.after_item_id:
+            continue
+        
+        entry = ordered.pop(ids.index(move.item_id))
+        index = -1
+        if move.after_item_id:
+            index = next(i for i, (item_id, _) in enumerate(ordered) if item_id == move.after_item_id)
+        new_order = place_after(ordered, index)
+        if new_order is None:
+            # Gap exhausted: renumber everything once, then place the item
+            for position, existing in enumerate(ordered, start=1):
+                existing[1] = position * ORDER_GAP
+            changed.update(existing[0] for existing in ordered)
+            new_order = place_after(ordered, index)
+        entry[1] = new_order
+        ordered.insert(index + 1, entry)
+        changed.add(entry[0])
+    
+    if removed_ids:
+        await db.execute(
+            delete(CollectionItem).where(
+                CollectionItem.collection_id == collection_id,
+                CollectionItem.id.in_(removed_ids)
+            )
+        )
+    
+    if changed:
+        await db.execute(
+            update(CollectionItem),
+            [{"id": item_id, "display_order": display_order}
+             for item_id, display_order in ordered if item_id in changed]
+        )
+    
+    if changes.add:
+        next_order = (ordered[-1][1] if ordered else 0) + ORDER_GAP
+        await db.execute(
+            insert(CollectionItem),
+            [
+                {
+                    "collection_id": collection_id,
+                    "content_id": item_data.content_id,
+                    "prompt_id": item_data.prompt_id,
+                    "display_order": next_order + offset * ORDER_GAP
+                }
+                for offset, item_data in enumerate(changes.add)
+            ]
+        )
+    
+    result = await db.execute(
+        update(Collection)
+        .where(Collection.id == collection_id)
+        .values(item_count=func.greatest(Collection.item_count + len(changes.add) - len(removed_ids), 0))
+        .returning(Collection.item_count)
+    )
+    item_count = result.scalar_one()
     
     await db.commit()
+    collection_cover_cache.invalidate(collection_id)
+    
+    return CollectionItemsBulkResult(
+        added=len(changes.add),
+        removed=len(removed_ids),
+        moved=len(changes.move),
+        item_count=item_count
+    )
@@ -0,0 +1,247 @@
+"""
+Threaded comments API routes
+
+Comments store a materialized path (see models.content.comment_path_segment),
+so a whole subtree, or a page of top-level comments with their first replies,
+is fetched with a single indexed query instead of one query per level.
+"""
+import uuid
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, update, delete
+from sqlalchemy.orm import aliased
+from typing import Dict
+from uuid import UUID
+
+from ..database import get_db
+from ..models.content import Content, Comment, comment_path_segment
+from ..models.user import User
+from ..schemas.content import (
+    CommentCreate, CommentResponse, CommentThread,
+    CommentThreadListResponse, CommentListResponse
+)
+from ..utils.serialization import model_response
+from .users import require_auth
+
+router = APIRouter(prefix="/api/content/{content_id}/comments", tags=["Comments"])
+
+# Deepest reply level accepted (top-level comments are depth 0)
+MAX_COMMENT_DEPTH = 8
+
+# Sorts after the "." separator and every hex digit, so [path, path + "/")
+# covers a comment and all of its descendants
+PATH_RANGE_END = "/"
+
+
+@router.get("", response_model=CommentThreadListResponse)
+async def list_comment_threads(
+    content_id: UUID,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    replies_per_thread: int = Query(3, ge=0, le=20),
+    db: AsyncSession = Depends(get_db)
+):
+    """List top-level comments, newest first, each with its first replies"""
+    top_level = select(Comment.id).where(
+        Comment.content_id == content_id,
+        Comment.parent_id.is_(None)
+    )
+
+    # Get total count
+    count_query = select(func.count()).select_from(top_level.subquery())
+    total_result = await db.execute(count_query)
+    total = total_result.scalar() or 0
+
+    # One query: rank every comment in the page's threads by path and keep the
+    # top-level comment plus its first replies_per_thread replies
+    roots = (
+        top_level
+        .order_by(Comment.created_at.desc(), Comment.id.desc())
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+        .subquery()
+    )
+    ranked = (
+        select(
+            Comment,
+            func.row_number().over(partition_by=Comment.root_id, order_by=Comment.path).label("position"),
+            func.count().over(partition_by=Comment.root_id).label("thread_size")
+        )
+        .where(Comment.root_id.in_(select(roots.c.id)))
+        .subquery()
+    )
+    thread_comment = aliased(Comment, ranked)
+    result = await db.execute(
+        select(thread_comment, ranked.c.thread_size)
+        .where(ranked.c.position <= replies_per_thread + 1)
+        .order_by(ranked.c.path)
+    )
+
+    threads: Dict[UUID, CommentThread] = {}
+    for comment, thread_size in result.all():
+        if comment.parent_id is None:
+            threads[comment.id] = CommentThread(
+                comment=CommentResponse.model_validate(comment),
+                replies=[],
+                reply_count=thread_size - 1
+            )
+        else:
+            threads[comment.root_id].replies.append(CommentResponse.model_validate(comment))
+
+    items = sorted(
+        threads.values(),
+        key=lambda thread: (thread.comment.created_at, thread.comment.id),
+        reverse=True
+    )
+
+    return model_response(CommentThreadListResponse(
+        items=items,
+        total=total,
+        page=page,
+        page_size=page_size
+    ))
+
+
+@router.get("/{comment_id}/thread", response_model=CommentListResponse)
+async def get_comment_thread(
+    content_id: UUID,
+    comment_id: UUID,
+    db: AsyncSession = Depends(get_db)
+):
+    """Get a comment and all of its replies in depth-first order"""
+    prefix = (
+        select(Comment.path)
+        .where(Comment.id == comment_id, Comment.content_id == content_id)
+        .scalar_subquery()
+    )
+    result = await db.execute(
+        select(Comment)
+        .where(
+            Comment.content_id == content_id,
+            Comment.path >= prefix,
+            Comment.path < prefix.concat(PATH_RANGE_END)
+        )
+        .order_by(Comment.path)
+    )
+    comments = result.scalars().all()
+
+    if not comments:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Comment not found"
+        )
+
+    return model_response(CommentListResponse(items=comments))
+
+
+@router.post("", response_model=CommentResponse, status_code=status.HTTP_201_CREATED)
+async def create_comment(
+    content_id: UUID,
+    comment_data: CommentCreate,
+    current_user: User = Depends(require_auth),
+    db: AsyncSession = Depends(get_db)
+):
+    """Add a comment or reply to content"""
+    result = await db.execute(select(Content.id).where(Content.id == content_id))
+    if not result.scalar_one_or_none():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Content not found"
+        )
+
+    comment_id = uuid.uuid4()
+    segment = comment_path_segment(comment_id)
+
+    if comment_data.parent_id:
+        result = await db.execute(
+            select(Comment).where(
+                Comment.id == comment_data.parent_id,
+                Comment.content_id == content_id
+            )
+        )
+        parent = result.scalar_one_or_none()
+
+        if not parent:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Parent comment not found"
+            )
+
+        if parent.depth >= MAX_COMMENT_DEPTH:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Maximum reply depth reached"
+            )
+
+        root_id, path, depth = parent.root_id, f"{parent.path}.{segment}", parent.depth + 1
+    else:
+        root_id, path, depth = comment_id, segment, 0
+
+    new_comment = Comment(
+        id=comment_id,
+        content_id=content_id,
+        user_id=current_user.id,
+        parent_id=comment_data.parent_id,
+        root_id=root_id,
+        path=path,
+        depth=depth,
+        body=comment_data.body
+    )
+    db.add(new_comment)
+
+    # Increment in SQL so concurrent comments can't lose updates
+    await db.execute(
+        update(Content)
+        .where(Content.id == content_id)
+        .values(comment_count=Content.comment_count + 1)
+    )
+
+    await db.commit()
+    await db.refresh(new_comment)
+
+    return new_comment
+
+
+@router.delete("/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_comment(
+    content_id: UUID,
+    comment_id: UUID,
+    current_user: User = Depends(require_auth),
+    db: AsyncSession = Depends(get_db)
+):
+    """Delete a comment and all of its replies"""
+    result = await db.execute(
+        select(Comment).where(Comment.id == comment_id, Comment.content_id == content_id)
+    )
+    comment = result.scalar_one_or_none()
+
+    if not comment:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Comment not found"
+        )
+
+    if comment.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to delete this comment"
+        )
+
+    result = await db.execute(
+        delete(Comment)
+        .where(
+            Comment.root_id == comment.root_id,
+            Comment.path >= comment.path,
+            Comment.path < comment.path + PATH_RANGE_END
+        )
+        .returning(Comment.id)
+    )
+    removed = len(result.all())
+
+    await db.execute(
+        update(Content)
+        .where(Content.id == content_id)
+        .values(comment_count=func.greatest(Content.comment_count - removed, 0))
+    )
+
+    await db.commit()
@@ -1,30 +1,93 @@
 """
 Content API routes
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from typing import Optional
+from sqlalchemy import select, func, Select
+from sqlalchemy.orm import joinedload
+from typing import Optional, Any, Dict, List, Sequence
 from uuid import UUID
 
-from ..database import get_db
+from ..database import get_db, async_session_maker
 from ..models.content import Content, ContentLike, ContentView
 from ..models.user import User
-from ..schemas.content import ContentCreate, ContentUpdate, ContentResponse, ContentListResponse
+from ..schemas.content import ContentCreate, ContentUpdate, ContentResponse, ContentListItem, ContentListResponse
+from ..services.viewer_state import load_content_viewer_state, annotate_viewer_state
+from ..utils.cache import response_cache
+from ..utils.fieldsets import Projection, parse_fields
+from ..utils.singleflight import singleflight
 from .users import get_current_user, require_auth
 
 router = APIRouter(prefix="/api/content", tags=["Content"])
 
+# Cache tag shared by every cached content listing
+CONTENT_CACHE_TAG = "content"
+
+# Columns list endpoints can project with `fields=` (see utils.fieldsets)
+CONTENT_FIELDS = Projection(
+    fields={
+        "id": Content.id,
+        "user_id": Content.user_id,
+        "title": Content.title,
+        "description": Content.description,
+        "type": Content.type,
+        "media_url": Content.media_url,
+        "thumbnail_url": Content.thumbnail_url,
+        "duration_seconds": Content.duration_seconds,
+        "width": Content.width,
+        "height": Content.height,
+        "is_ai_generated": Content.is_ai_generated,
+        "ai_model": Content.ai_model,
+        "is_featured": Content.is_featured,
+        "view_count": Content.view_count,
+        "like_count": Content.like_count,
+        "share_count": Content.share_count,
+        "comment_count": Content.comment_count,
+        "created_at": Content.created_at,
+        "author": {
+            "id": User.id,
+            "username": User.username,
+            "display_name": User.display_name,
+            "avatar_url": User.avatar_url,
+            "is_verified": User.is_verified
+        }
+    },
+    card=(
+        "title", "type", "thumbnail_url", "duration_seconds", "is_ai_generated",
+        "view_count", "like_count", "comment_count", "author"
+    )
+)
+
+
+def project_content(query: Select, names: Sequence[str]) -> Select:
+    """Turn an entity query on Content into a projection of the named fields"""
+    query = query.with_only_columns(*CONTENT_FIELDS.columns(names))
+    if "author" in names:
+        query = query.outerjoin(User, User.id == Content.user_id)
+    return query
+
 
 @router.get("", response_model=ContentListResponse)
 async def list_content(
+    request: Request,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     type: Optional[str] = None,
     user_id: Optional[UUID] = None,
+    fields: Optional[str] = None,
+    current_user: Optional[User] = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """List content with optional filters"""
+    """List content with optional filters
+
+    Pass `fields=card` (or a comma-separated field list) for a column-projected
+    response with only those fields per item.
+    """
+    cached = await response_cache.get(request)
+    if cached is not None:
+        return cached
+    
+    names = parse_fields(CONTENT_FIELDS, fields)
     query = select(Content).where(Content.is_public == True)
     
     if type:
@@ -41,44 +104,109 @@ async def list_content(
     query = query.order_by(Content.created_at.desc())
     query = query.offset((page - 1) * page_size).limit(page_size)
     
+    if names:
+        result = await db.execute(project_content(query, names))
+        return await respond_with_cards(
+            request, db, current_user, CONTENT_FIELDS.to_dicts(result.all(), names), total, page, page_size
+        )
+    
+    query = query.options(joinedload(Content.user))
+    
     result = await db.execute(query)
     content = result.scalars().all()
     
-    return ContentListResponse(
+    response = ContentListResponse(
         items=content,
         total=total,
         page=page,
         page_size=page_size
     )
+    
+    # Signed-in callers get liked/saved flags (their responses are never cached)
+    viewer_state = await load_content_viewer_state(db, current_user, [item.id for item in response.items])
+    annotate_viewer_state(response.items, viewer_state)
+    
+    return await response_cache.put(request, response, tags=(CONTENT_CACHE_TAG,))
 
 
 @router.get("/trending", response_model=ContentListResponse)
 async def trending_content(
+    request: Request,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    fields: Optional[str] = None,
+    current_user: Optional[User] = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """Get trending content"""
-    query = select(Content).where(Content.is_public == True)
-    query = query.order_by(Content.view_count.desc(), Content.like_count.desc())
+    """Get trending content (supports `fields=` like the content list)"""
+    cached = await response_cache.get(request)
+    if cached is not None:
+        return cached
     
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+    names = parse_fields(CONTENT_FIELDS, fields)
     
-    # Get paginated results
-    query = query.offset((page - 1) * page_size).limit(page_size)
+    # The shared fetch outlives any one caller's request, so it uses its own
+    # session and returns plain data rather than ORM objects
+    async def fetch_trending():
+        async with async_session_maker() as session:
+            query = select(Content).where(Content.is_public == True)
+            query = query.order_by(Content.view_count.desc(), Content.like_count.desc())
+            
+            # Get total count
+            count_query = select(func.count()).select_from(query.subquery())
+            total_result = await session.execute(count_query)
+            total = total_result.scalar() or 0
+            
+            # Get paginated results
+            query = query.offset((page - 1) * page_size).limit(page_size)
+            
+            if names:
+                result = await session.execute(project_content(query, names))
+                return total, CONTENT_FIELDS.to_dicts(result.all(), names)
+            
+            query = query.options(joinedload(Content.user))
+            
+            result = await session.execute(query)
+            return total, [ContentListItem.model_validate(item) for item in result.scalars()]
     
-    result = await db.execute(query)
-    content = result.scalars().all()
+    # Concurrent identical requests share one in-flight query
+    total, content = await singleflight.do(f"trending:{page}:{page_size}:{names}", fetch_trending)
     
-    return ContentListResponse(
-        items=content,
+    if names:
+        return await respond_with_cards(request, db, current_user, content, total, page, page_size)
+    
+    # Items are shared with coalesced callers: annotate copies
+    response = ContentListResponse(
+        items=[item.model_copy() for item in content],
         total=total,
         page=page,
         page_size=page_size
     )
+    
+    # Signed-in callers get liked/saved flags (their responses are never cached)
+    viewer_state = await load_content_viewer_state(db, current_user, [item.id for item in response.items])
+    annotate_viewer_state(response.items, viewer_state)
+    
+    return await response_cache.put(request, response, tags=(CONTENT_CACHE_TAG,))
+
+
+async def respond_with_cards(
+    request: Request,
+    db: AsyncSession,
+    current_user: Optional[User],
+    items: List[Dict[str, Any]],
+    total: int,
+    page: int,
+    page_size: int
+) -> Response:
+    """Respond with projected rows, annotated for signed-in callers and cached otherwise"""
+    # Rows may be shared with coalesced callers (singleflight): annotate copies
+    items = [dict(item) for item in items]
+    viewer_state = await load_content_viewer_state(db, current_user, [item["id"] for item in items])
+    annotate_viewer_state(items, viewer_state)
+    
+    payload = {"items": items, "total": total, "page": page, "page_size": page_size}
+    return await response_cache.put(request, payload, tags=(CONTENT_CACHE_TAG,))
 
 
 @router.post("", response_model=ContentResponse, status_code=status.HTTP_201_CREATED)
@@ -96,15 +224,22 @@ async def create_content(
     db.add(new_content)
     await db.commit()
     await db.refresh(new_content)
+    await response_cache.invalidate(CONTENT_CACHE_TAG)
     
     return new_content
 
 
 @router.get("/{content_id}", response_model=ContentResponse)
-async def get_content(content_id: UUID, db: AsyncSession = Depends(get_db)):
+async def get_content(content_id: UUID):
     """Get specific content"""
-    result = await db.execute(select(Content).where(Content.id == content_id))
-    content = result.scalar_one_or_none()
+    # Shared with coalesced callers: own session, plain data
+    async def fetch_content():
+        async with async_session_maker() as session:
+            result = await session.execute(select(Content).where(Content.id == content_id))
+            content = result.scalar_one_or_none()
+            return ContentResponse.model_validate(content) if content else None
+    
+    content = await singleflight.do(f"content:{content_id}", fetch_content)
     
     if not content:
         raise HTTPException(
@@ -143,6 +278,7 @@ async def update_content(
     
     await db.commit()
     await db.refresh(content)
+    await response_cache.invalidate(CONTENT_CACHE_TAG)
     
     return content
 
@@ -171,6 +307,7 @@ async def delete_content(
     
     await db.delete(content)
     await db.commit()
+    await response_cache.invalidate(CONTENT_CACHE_TAG)
 
 
 @router.post("/{content_id}/like", status_code=status.HTTP_201_CREATED)
@@ -208,6 +345,7 @@ async def like_content(
     
     content.like_count += 1
     await db.commit()
+    await response_cache.invalidate(CONTENT_CACHE_TAG)
     
     return {"message": "Liked successfully"}
 
@@ -3,145 +3,118 @@ Template rendering routes for all pages
 """
 from fastapi import APIRouter, Request
 from fastapi.templating import Jinja2Templates
+from typing import Any, Callable, Dict
+
+from ..config import get_settings
+from ..services.feed_snapshot import FeedSnapshot, feed_snapshot_service
+from ..utils.assets import asset_url
+from ..utils.page_cache import PageCache, FragmentCache
+
+TEMPLATES_DIR = "templates"
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
-
-
-# Sample data for templates
-SAMPLE_CONTENT = [
-    {
-        "id": 1,
-        "title": "Majestic Mountain Sunset",
-        "description": "Breathtaking view of sunset over the peaks",
-        "image": "https://images.unsplash.com/photo-1682687220742-aba13b6e50ba?w=400&h=600&fit=crop",
-        "type": "images",
-        "author": "@naturelover",
-        "author_avatar": "https://i.pravatar.cc/40?img=1",
-        "likes": "2.4k"
-    },
-    {
-        "id": 2,
-        "title": "Dance Challenge Viral Hit",
-        "description": "This dance move is breaking the internet! 🔥",
-        "image": None,
-        "gradient": "linear-gradient(135deg, #667eea 0%, #764ba2 100%)",
-        "type": "reels",
-        "platform": "tiktok",
-        "duration": "0:45",
-        "author": "@danceking",
-        "author_avatar": "https://i.pravatar.cc/40?img=2",
-        "views": "1.2M"
-    },
-    {
-        "id": 3,
-        "title": "Cyberpunk Dreams",
-        "description": "AI-generated futuristic cityscape",
-        "image": "https://images.unsplash.com/photo-1686191128892-3b37add4b844?w=400&h=400&fit=crop",
-        "type": "ai",
-        "author": "@ai_artist",
-        "author_avatar": "https://i.pravatar.cc/40?img=3",
-        "likes": "5.7k"
-    },
-    {
-        "id": 4,
-        "title": "Turquoise Paradise",
-        "description": "Crystal clear ocean waves at sunrise",
-        "image": "https://images.unsplash.com/photo-1518837695005-2083093ee35b?w=400&h=500&fit=crop",
-        "type": "images",
-        "author": "@oceanvibes",
-        "author_avatar": "https://i.pravatar.cc/40?img=4",
-        "likes": "8.9k"
-    },
-]
-
-SAMPLE_CATEGORIES = [
-    {"name": "AI Art", "icon": "bi-stars", "count": "12.4K", "image": "https://images.unsplash.com/photo-1686191128892-3b37add4b844?w=400"},
-    {"name": "Nature", "icon": "bi-tree", "count": "8.9K", "image": "https://images.unsplash.com/photo-1682687220742-aba13b6e50ba?w=400"},
-    {"name": "Travel", "icon": "bi-airplane", "count": "15.2K", "image": "https://images.unsplash.com/photo-1493246507139-91e8fad9978e?w=400"},
-    {"name": "Ocean", "icon": "bi-water", "count": "6.7K", "image": "https://images.unsplash.com/photo-1518837695005-2083093ee35b?w=400"},
-]
-
-SAMPLE_PROMPTS = [
-    {
-        "id": 1,
-        "title": "Cinematic Portrait Photography",
-        "description": "Create stunning portrait photos with dramatic lighting",
-        "category": "Photography",
-        "type": "image",
-        "use_count": 1234,
-        "like_count": 567,
-        "author": "@portrait_master"
-    },
-    {
-        "id": 2,
-        "title": "Viral TikTok Hook",
-        "description": "Generate attention-grabbing video hooks",
-        "category": "Video",
-        "type": "video",
-        "use_count": 2345,
-        "like_count": 890,
-        "author": "@viral_creator"
-    },
-]
+templates = Jinja2Templates(directory=TEMPLATES_DIR)
+
+# Request-independent pages are rendered once per template version and served as
+# precompressed bytes; data-driven pages cache their fragments with a TTL.
+page_cache = PageCache(templates)
+fragment_cache = FragmentCache(templates)
+
+
+def compact_number(value: int) -> str:
+    """Format a count the way cards display it, e.g. 2.4K or 1.2M"""
+    for threshold, suffix in ((1_000_000_000, "B"), (1_000_000, "M"), (1_000, "K")):
+        if value >= threshold:
+            return f"{value / threshold:.1f}".rstrip("0").rstrip(".") + suffix
+    return str(value)
+
+
+templates.env.filters["compact"] = compact_number
+templates.env.globals["asset_url"] = asset_url
+
+
+async def render_feed_page(
+    request: Request,
+    name: str,
+    page_title: str,
+    grid_var: str,
+    partial: str,
+    grid_context: Callable[[FeedSnapshot], Dict[str, Any]]
+):
+    """Render a page whose grid comes from the in-memory feed snapshot
+
+    The grid fragment is rendered once per snapshot version and the page is
+    cached under that version. Until the first snapshot is built the page
+    keeps its static placeholder grid.
+    """
+    snapshot = feed_snapshot_service.current
+    context = {"page_title": page_title}
+    if snapshot.is_ready:
+        context[grid_var] = fragment_cache.render(
+            partial,
+            key=snapshot.version,
+            ttl_seconds=get_settings().FEED_SNAPSHOT_REFRESH_SECONDS,
+            context_factory=lambda: grid_context(snapshot)
+        )
+    return await page_cache.render(request, name, context, version=snapshot.version)
 
 
 @router.get("/")
 async def home(request: Request):
     """Render the home page"""
-    return templates.TemplateResponse(
-        request=request,
+    return await render_feed_page(
+        request,
         name="index.html",
-        context={
-            "content": SAMPLE_CONTENT,
-            "page_title": "Viral Prompt | Discover Amazing Content"
-        }
+        page_title="Viral Prompt | Discover Amazing Content",
+        grid_var="content_grid",
+        partial="partials/content_grid.html",
+        grid_context=lambda snapshot: {"content": snapshot.latest}
     )
 
 
 @router.get("/explore")
 async def explore(request: Request):
     """Render the explore page"""
-    return templates.TemplateResponse(
-        request=request,
+    return await render_feed_page(
+        request,
         name="explore.html",
-        context={
-            "categories": SAMPLE_CATEGORIES,
-            "page_title": "Explore | Viral Prompt"
-        }
+        page_title="Explore | Viral Prompt",
+        grid_var="category_grid",
+        partial="partials/category_grid.html",
+        grid_context=lambda snapshot: {"categories": snapshot.categories}
     )
 
 
 @router.get("/trending")
 async def trending(request: Request):
     """Render the trending page"""
-    return templates.TemplateResponse(
-        request=request,
+    return await render_feed_page(
+        request,
         name="trending.html",
-        context={
-            "content": SAMPLE_CONTENT,
-            "page_title": "Trending | Viral Prompt"
-        }
+        page_title="Trending | Viral Prompt",
+        grid_var="trending_grid",
+        partial="partials/trending_grid.html",
+        grid_context=lambda snapshot: {"content": snapshot.trending}
     )
 
 
 @router.get("/prompt-library")
 async def prompt_library(request: Request):
     """Render the prompt library page"""
-    return templates.TemplateResponse(
-        request=request,
+    return await render_feed_page(
+        request,
         name="prompt-library.html",
-        context={
-            "prompts": SAMPLE_PROMPTS,
-            "page_title": "Prompt Library | Viral Prompt"
-        }
+        page_title="Prompt Library | Viral Prompt",
+        grid_var="prompt_grid",
+        partial="partials/prompt_grid.html",
+        grid_context=lambda snapshot: {"prompts": snapshot.prompts}
     )
 
 
 @router.get("/dashboard")
 async def dashboard(request: Request):
     """Render the user dashboard"""
-    return templates.TemplateResponse(
+    return await page_cache.render(
         request=request,
         name="dashboard.html",
         context={
@@ -153,7 +126,7 @@ async def dashboard(request: Request):
 @router.get("/profile")
 async def profile(request: Request):
     """Render the user profile page"""
-    return templates.TemplateResponse(
+    return await page_cache.render(
         request=request,
         name="profile.html",
         context={
@@ -165,7 +138,7 @@ async def profile(request: Request):
 @router.get("/settings")
 async def settings(request: Request):
     """Render the settings page"""
-    return templates.TemplateResponse(
+    return await page_cache.render(
         request=request,
         name="settings.html",
         context={
@@ -177,7 +150,7 @@ async def settings(request: Request):
 @router.get("/collections")
 async def collections(request: Request):
     """Render the collections page"""
-    return templates.TemplateResponse(
+    return await page_cache.render(
         request=request,
         name="collections.html",
         context={
@@ -189,7 +162,7 @@ async def collections(request: Request):
 @router.get("/signin")
 async def signin(request: Request):
     """Render the sign in page"""
-    return templates.TemplateResponse(
+    return await page_cache.render(
         request=request,
         name="signin.html",
         context={
@@ -201,7 +174,7 @@ async def signin(request: Request):
 @router.get("/analytics")
 async def analytics(request: Request):
     """Render the analytics page"""
-    return templates.TemplateResponse(
+    return await page_cache.render(
         request=request,
         name="analytics.html",
         context={
@@ -214,7 +187,7 @@ async def analytics(request: Request):
 @router.get("/ai-books")
 async def ai_books(request: Request):
     """Render the AI Books page"""
-    return templates.TemplateResponse(
+    return await page_cache.render(
         request=request,
         name="ai-books.html",
         context={
@@ -226,7 +199,7 @@ async def ai_books(request: Request):
 @router.get("/ai-music")
 async def ai_music(request: Request):
     """Render the AI Music page"""
-    return templates.TemplateResponse(
+    return await page_cache.render(
         request=request,
         name="ai-music.html",
         context={
@@ -238,7 +211,7 @@ async def ai_music(request: Request):
 @router.get("/ai-video-generator")
 async def ai_video_generator(request: Request):
     """Render the AI Video Generator page"""
-    return templates.TemplateResponse(
+    return await page_cache.render(
         request=request,
         name="ai-video-generator.html",
         context={
@@ -250,7 +223,7 @@ async def ai_video_generator(request: Request):
 @router.get("/caption-generator")
 async def caption_generator(request: Request):
     """Render the Caption Generator page"""
-    return templates.TemplateResponse(
+    return await page_cache.render(
         request=request,
         name="caption-generator.html",
         context={
@@ -262,7 +235,7 @@ async def caption_generator(request: Request):
 @router.get("/script-writer")
 async def script_writer(request: Request):
     """Render the Script Writer page"""
-    return templates.TemplateResponse(
+    return await page_cache.render(
         request=request,
         name="script-writer.html",
         context={
@@ -274,7 +247,7 @@ async def script_writer(request: Request):
 @router.get("/reel-creator")
 async def reel_creator(request: Request):
     """Render the Reel Creator page"""
-    return templates.TemplateResponse(
+    return await page_cache.render(
         request=request,
         name="reel-creator.html",
         context={
@@ -1,31 +1,103 @@
 """
 Prompts API routes
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from typing import Optional, List
+from sqlalchemy import select, func, Select
+from sqlalchemy.orm import joinedload, selectinload
+from typing import Optional, List, Sequence
 from uuid import UUID
 
-from ..database import get_db
-from ..models.prompt import Prompt, PromptLike, PromptSave
+from ..database import get_db, async_session_maker
+from ..models.prompt import Prompt, PromptCategory, PromptLike, PromptSave, PromptTagRelation
 from ..models.user import User
 from ..schemas.prompt import PromptCreate, PromptUpdate, PromptResponse, PromptListResponse
+from ..services.viewer_state import load_prompt_viewer_state, annotate_viewer_state
+from ..utils.cache import response_cache
+from ..utils.fieldsets import Projection, parse_fields
+from ..utils.singleflight import singleflight
 from .users import get_current_user, require_auth
 
 router = APIRouter(prefix="/api/prompts", tags=["Prompts"])
 
+# Cache tag shared by every cached prompt listing
+PROMPTS_CACHE_TAG = "prompts"
+
+
+# Columns the prompt list can project with `fields=` (see utils.fieldsets);
+# tags are a collection and only come with the full response
+PROMPT_FIELDS = Projection(
+    fields={
+        "id": Prompt.id,
+        "user_id": Prompt.user_id,
+        "category_id": Prompt.category_id,
+        "title": Prompt.title,
+        "prompt_text": Prompt.prompt_text,
+        "description": Prompt.description,
+        "type": Prompt.type,
+        "preview_image_url": Prompt.preview_image_url,
+        "is_featured": Prompt.is_featured,
+        "use_count": Prompt.use_count,
+        "like_count": Prompt.like_count,
+        "save_count": Prompt.save_count,
+        "created_at": Prompt.created_at,
+        "author": {
+            "id": User.id,
+            "username": User.username,
+            "display_name": User.display_name,
+            "avatar_url": User.avatar_url,
+            "is_verified": User.is_verified
+        },
+        "category": {
+            "id": PromptCategory.id,
+            "name": PromptCategory.name,
+            "slug": PromptCategory.slug
+        }
+    },
+    card=(
+        "title", "type", "preview_image_url", "is_featured",
+        "use_count", "like_count", "save_count", "author", "category"
+    )
+)
+
+
+def project_prompts(query: Select, names: Sequence[str]) -> Select:
+    """Turn an entity query on Prompt into a projection of the named fields"""
+    query = query.with_only_columns(*PROMPT_FIELDS.columns(names))
+    if "author" in names:
+        query = query.outerjoin(User, User.id == Prompt.user_id)
+    if "category" in names:
+        query = query.outerjoin(PromptCategory, PromptCategory.id == Prompt.category_id)
+    return query
+
+
+def prompt_cache_tag(prompt_id: UUID) -> str:
+    """Cache tag for a single prompt's detail response"""
+    return f"prompt:{prompt_id}"
+
 
 @router.get("", response_model=PromptListResponse)
 async def list_prompts(
+    request: Request,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     type: Optional[str] = None,
     category_id: Optional[int] = None,
     search: Optional[str] = None,
+    fields: Optional[str] = None,
+    current_user: Optional[User] = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """List prompts with optional filters"""
+    """List prompts with optional filters
+
+    Pass `fields=card` (or a comma-separated field list) for a column-projected
+    response with only those fields per item.
+    """
+    cached = await response_cache.get(request)
+    if cached is not None:
+        return cached
+    
+    names = parse_fields(PROMPT_FIELDS, fields)
     query = select(Prompt).where(Prompt.is_public == True)
     
     if type:
@@ -44,15 +116,39 @@ async def list_prompts(
     query = query.order_by(Prompt.created_at.desc())
     query = query.offset((page - 1) * page_size).limit(page_size)
     
+    if names:
+        result = await db.execute(project_prompts(query, names))
+        items = PROMPT_FIELDS.to_dicts(result.all(), names)
+        
+        viewer_state = await load_prompt_viewer_state(db, current_user, [item["id"] for item in items])
+        annotate_viewer_state(items, viewer_state)
+        
+        payload = {"items": items, "total": total, "page": page, "page_size": page_size}
+        return await response_cache.put(request, payload, tags=(PROMPTS_CACHE_TAG,))
+    
+    # Many-to-one author/category ride along in the page query; tags are
+    # collections, so they load in one extra IN query per level
+    query = query.options(
+        joinedload(Prompt.user),
+        joinedload(Prompt.category),
+        selectinload(Prompt.tags).selectinload(PromptTagRelation.tag)
+    )
+    
     result = await db.execute(query)
     prompts = result.scalars().all()
     
-    return PromptListResponse(
+    response = PromptListResponse(
         items=prompts,
         total=total,
         page=page,
         page_size=page_size
     )
+    
+    # Signed-in callers get liked/saved flags (their responses are never cached)
+    viewer_state = await load_prompt_viewer_state(db, current_user, [item.id for item in response.items])
+    annotate_viewer_state(response.items, viewer_state)
+    
+    return await response_cache.put(request, response, tags=(PROMPTS_CACHE_TAG,))
 
 
 @router.post("", response_model=PromptResponse, status_code=status.HTTP_201_CREATED)
@@ -70,15 +166,27 @@ async def create_prompt(
     db.add(new_prompt)
     await db.commit()
     await db.refresh(new_prompt)
+    await response_cache.invalidate(PROMPTS_CACHE_TAG)
     
     return new_prompt
 
 
 @router.get("/{prompt_id}", response_model=PromptResponse)
-async def get_prompt(prompt_id: UUID, db: AsyncSession = Depends(get_db)):
+async def get_prompt(prompt_id: UUID, request: Request):
     """Get a specific prompt"""
-    result = await db.execute(select(Prompt).where(Prompt.id == prompt_id))
-    prompt = result.scalar_one_or_none()
+    cached = await response_cache.get(request)
+    if cached is not None:
+        return cached
+    
+    # Shared with coalesced callers: own session, plain data
+    async def fetch_prompt():
+        async with async_session_maker() as session:
+            result = await session.execute(select(Prompt).where(Prompt.id == prompt_id))
+            prompt = result.scalar_one_or_none()
+            return PromptResponse.model_validate(prompt) if prompt else None
+    
+    # Concurrent identical requests share one in-flight query
+    prompt = await singleflight.do(f"prompt:{prompt_id}", fetch_prompt)
     
     if not prompt:
         raise HTTPException(
@@ -86,7 +194,7 @@ async def get_prompt(prompt_id: UUID, db: AsyncSession = Depends(get_db)):
             detail="Prompt not found"
         )
     
-    return prompt
+    return await response_cache.put(request, prompt, tags=(prompt_cache_tag(prompt_id),))
 
 
 @router.put("/{prompt_id}", response_model=PromptResponse)
@@ -117,6 +225,7 @@ async def update_prompt(
     
     await db.commit()
     await db.refresh(prompt)
+    await response_cache.invalidate(PROMPTS_CACHE_TAG, prompt_cache_tag(prompt_id))
     
     return prompt
 
@@ -145,6 +254,7 @@ async def delete_prompt(
     
     await db.delete(prompt)
     await db.commit()
+    await response_cache.invalidate(PROMPTS_CACHE_TAG, prompt_cache_tag(prompt_id))
 
 
 @router.post("/{prompt_id}/like", status_code=status.HTTP_201_CREATED)
@@ -186,6 +296,7 @@ async def like_prompt(
     prompt.like_count += 1
     
     await db.commit()
+    await response_cache.invalidate(PROMPTS_CACHE_TAG, prompt_cache_tag(prompt_id))
     
     return {"message": "Liked successfully"}
 
@@ -219,3 +330,4 @@ async def unlike_prompt(
     
     await db.delete(like)
     await db.commit()
+    await response_cache.invalidate(PROMPTS_CACHE_TAG, prompt_cache_tag(prompt_id))
@@ -1,16 +1,18 @@
 """
 User management routes
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import Optional
+from sqlalchemy import select, update, delete, func, case
+from sqlalchemy.dialects.postgresql import insert
+from typing import Optional, List
 from uuid import UUID
 
 from ..database import get_db
-from ..models.user import User
-from ..schemas.user import UserResponse, UserUpdate
+from ..models.user import User, UserFollower
+from ..schemas.user import UserResponse, UserUpdate, FollowStatusResponse
+from ..services.token_revocation import token_revocation_service
 from ..utils.security import decode_access_token
 
 router = APIRouter(prefix="/api/users", tags=["Users"])
@@ -29,6 +31,10 @@ async def get_current_user(
     if not payload:
         return None
     
+    jti = payload.get("jti")
+    if jti and await token_revocation_service.is_revoked(db, jti):
+        return None
+    
     user_id = payload.get("sub")
     if not user_id:
         return None
@@ -50,6 +56,18 @@ async def require_auth(
     return current_user
 
 
+async def require_admin(
+    current_user: User = Depends(require_auth)
+) -> User:
+    """Require an authenticated admin"""
+    if current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+    return current_user
+
+
 @router.get("/me", response_model=UserResponse)
 async def get_me(current_user: User = Depends(require_auth)):
     """Get current user's profile"""
@@ -72,6 +90,121 @@ async def update_me(
     return current_user
 
 
+@router.get("/me/following/status", response_model=FollowStatusResponse)
+async def following_status(
+    user_ids: List[UUID] = Query(..., max_length=100),
+    current_user: User = Depends(require_auth),
+    db: AsyncSession = Depends(get_db)
+):
+    """Check which of the given users the current user follows, in one query"""
+    result = await db.execute(
+        select(UserFollower.following_id).where(
+            UserFollower.follower_id == current_user.id,
+            UserFollower.following_id.in_(user_ids)
+        )
+    )
+    followed = set(result.scalars().all())
+    
+    return FollowStatusResponse(
+        following={user_id: user_id in followed for user_id in user_ids}
+    )
+
+
+async def adjust_follow_counts(db: AsyncSession, follower_id: UUID, following_id: UUID, delta: int) -> None:
+    """Add delta to one user's follower_count and the other's following_count
+
+    Counts are updated in SQL, not read-modify-write, so they stay exact under
+    concurrency. Both rows are locked in id order first: A following B while B
+    follows A would otherwise lock them in opposite orders and deadlock. The lock
+    is FOR NO KEY UPDATE (what the UPDATE takes anyway), so it doesn't wait on
+    the key-share locks concurrent user_followers inserts hold on these rows.
+    """
+    await db.execute(
+        select(User.id)
+        .where(User.id.in_((follower_id, following_id)))
+        .order_by(User.id)
+        .with_for_update(key_share=True)
+    )
+    await db.execute(
+        update(User)
+        .where(User.id.in_((follower_id, following_id)))
+        .values(
+            follower_count=case(
+                (User.id == following_id, func.greatest(User.follower_count + delta, 0)),
+                else_=User.follower_count
+            ),
+            following_count=case(
+                (User.id == follower_id, func.greatest(User.following_count + delta, 0)),
+                else_=User.following_count
+            )
+        )
+    )
+
+
+@router.post("/{user_id}/follow", status_code=status.HTTP_201_CREATED)
+async def follow_user(
+    user_id: UUID,
+    current_user: User = Depends(require_auth),
+    db: AsyncSession = Depends(get_db)
+):
+    """Follow a user"""
+    if user_id == current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot follow yourself"
+        )
+    
+    result = await db.execute(select(User.id).where(User.id == user_id))
+    if not result.scalar_one_or_none():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+    
+    # Insert-or-nothing so concurrent duplicate follows can't double count
+    result = await db.execute(
+        insert(UserFollower)
+        .values(follower_id=current_user.id, following_id=user_id)
+        .on_conflict_do_nothing()
+        .returning(UserFollower.following_id)
+    )
+    if not result.scalar_one_or_none():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Already following"
+        )
+    
+    await adjust_follow_counts(db, current_user.id, user_id, 1)
+    await db.commit()
+    
+    return {"message": "Followed successfully"}
+
+
+@router.delete("/{user_id}/follow", status_code=status.HTTP_204_NO_CONTENT)
+async def unfollow_user(
+    user_id: UUID,
+    current_user: User = Depends(require_auth),
+    db: AsyncSession = Depends(get_db)
+):
+    """Unfollow a user"""
+    result = await db.execute(
+        delete(UserFollower)
+        .where(
+            UserFollower.follower_id == current_user.id,
+            UserFollower.following_id == user_id
+        )
+        .returning(UserFollower.following_id)
+    )
+    if not result.scalar_one_or_none():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Not following"
+        )
+    
+    await adjust_follow_counts(db, current_user.id, user_id, -1)
+    await db.commit()
+
+
 @router.get("/{username}", response_model=UserResponse)
 async def get_user_by_username(username: str, db: AsyncSession = Depends(get_db)):
     """Get a user's public profile by username"""
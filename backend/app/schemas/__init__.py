@@ -1,12 +1,16 @@
 # Schemas package
-from .user import UserCreate, UserUpdate, UserResponse, UserLogin, Token
-from .prompt import PromptCreate, PromptUpdate, PromptResponse, PromptCategoryResponse
-from .content import ContentCreate, ContentUpdate, ContentResponse
+from .user import UserCreate, UserUpdate, UserResponse, UserLogin, Token, RefreshTokenRequest, FollowStatusResponse, AuthorSummary
+from .prompt import (
+    PromptCreate, PromptUpdate, PromptResponse, PromptCategoryResponse,
+    PromptListItem, CategorySummary, TagSummary
+)
+from .content import ContentCreate, ContentUpdate, ContentResponse, ContentListItem
 from .collection import CollectionCreate, CollectionUpdate, CollectionResponse
 
 __all__ = [
-    "UserCreate", "UserUpdate", "UserResponse", "UserLogin", "Token",
+    "UserCreate", "UserUpdate", "UserResponse", "UserLogin", "Token", "RefreshTokenRequest", "FollowStatusResponse", "AuthorSummary",
     "PromptCreate", "PromptUpdate", "PromptResponse", "PromptCategoryResponse",
-    "ContentCreate", "ContentUpdate", "ContentResponse",
+    "PromptListItem", "CategorySummary", "TagSummary",
+    "ContentCreate", "ContentUpdate", "ContentResponse", "ContentListItem",
     "CollectionCreate", "CollectionUpdate", "CollectionResponse"
 ]
@@ -1,11 +1,14 @@
 """
 Collection Pydantic schemas
 """
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import datetime
 from uuid import UUID
 
+from .content import ContentResponse
+from .prompt import PromptResponse
+
 
 class CollectionBase(BaseModel):
     """Base collection schema"""
@@ -44,15 +47,60 @@ class CollectionResponse(BaseModel):
         from_attributes = True
 
 
+class CollectionSummary(CollectionResponse):
+    """Schema for a collection card with its cover mosaic thumbnails"""
+    preview_thumbnails: List[str] = []
+
+
 class CollectionItemCreate(BaseModel):
     """Schema for adding item to collection"""
     content_id: Optional[UUID] = None
     prompt_id: Optional[UUID] = None
 
 
+class CollectionItemResponse(BaseModel):
+    """Schema for a collection item with its content or prompt hydrated"""
+    id: UUID
+    display_order: int
+    added_at: datetime
+    content: Optional[ContentResponse] = None
+    prompt: Optional[PromptResponse] = None
+
+
+class CollectionItemPage(BaseModel):
+    """Schema for a keyset-paginated page of collection items"""
+    items: List[CollectionItemResponse]
+    next_cursor: Optional[str] = None
+
+
+class CollectionItemMove(BaseModel):
+    """Move an item to directly after another item (or to the front)"""
+    item_id: UUID
+    after_item_id: Optional[UUID] = None
+
+
+class CollectionItemsBulkUpdate(BaseModel):
+    """Schema for bulk add/remove/reorder, applied in one transaction
+
+    Removals are applied first, then moves in order, then additions are
+    appended to the end.
+    """
+    add: List[CollectionItemCreate] = Field(default_factory=list, max_length=500)
+    remove: List[UUID] = Field(default_factory=list, max_length=500)
+    move: List[CollectionItemMove] = Field(default_factory=list, max_length=500)
+
+
+class CollectionItemsBulkResult(BaseModel):
+    """Schema for the outcome of a bulk update"""
+    added: int
+    removed: int
+    moved: int
+    item_count: int
+
+
 class CollectionListResponse(BaseModel):
     """Schema for paginated collection list"""
-    items: List[CollectionResponse]
+    items: List[CollectionSummary]
     total: int
     page: int
     page_size: int
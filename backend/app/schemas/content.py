@@ -1,11 +1,13 @@
 """
 Content Pydantic schemas
 """
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List, Any
 from datetime import datetime
 from uuid import UUID
 
+from .user import AuthorSummary
+
 
 class ContentBase(BaseModel):
     """Base content schema"""
@@ -59,14 +61,25 @@ class ContentResponse(BaseModel):
     comment_count: int = 0
     created_at: datetime
     updated_at: datetime
+    # Set on list responses for authenticated callers only
+    viewer_liked: Optional[bool] = None
+    viewer_saved: Optional[bool] = None
     
     class Config:
         from_attributes = True
 
 
+class ContentListItem(ContentResponse):
+    """Content in a list response, with embedded author
+
+    Built from content loaded with an eager-loading option for `user`.
+    """
+    author: Optional[AuthorSummary] = Field(None, validation_alias="user")
+
+
 class ContentListResponse(BaseModel):
     """Schema for paginated content list"""
-    items: List[ContentResponse]
+    items: List[ContentListItem]
     total: int
     page: int
     page_size: int
@@ -84,6 +97,8 @@ class CommentResponse(BaseModel):
     content_id: UUID
     user_id: UUID
     parent_id: Optional[UUID] = None
+    root_id: UUID
+    depth: int = 0
     body: str
     like_count: int = 0
     is_edited: bool = False
@@ -91,3 +106,23 @@ class CommentResponse(BaseModel):
     
     class Config:
         from_attributes = True
+
+
+class CommentThread(BaseModel):
+    """A top-level comment with its first replies"""
+    comment: CommentResponse
+    replies: List[CommentResponse]
+    reply_count: int = 0
+
+
+class CommentThreadListResponse(BaseModel):
+    """Schema for a paginated list of top-level comment threads"""
+    items: List[CommentThread]
+    total: int
+    page: int
+    page_size: int
+
+
+class CommentListResponse(BaseModel):
+    """Schema for a comment subtree in depth-first order"""
+    items: List[CommentResponse]
@@ -1,11 +1,13 @@
 """
 Prompt Pydantic schemas
 """
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator
 from typing import Optional, List
 from datetime import datetime
 from uuid import UUID
 
+from .user import AuthorSummary
+
 
 class PromptCategoryResponse(BaseModel):
     """Schema for prompt category response"""
@@ -20,6 +22,26 @@ class PromptCategoryResponse(BaseModel):
         from_attributes = True
 
 
+class CategorySummary(BaseModel):
+    """Compact category info embedded in list responses"""
+    id: int
+    name: str
+    slug: str
+    
+    class Config:
+        from_attributes = True
+
+
+class TagSummary(BaseModel):
+    """Compact tag info embedded in list responses"""
+    id: int
+    name: str
+    slug: str
+    
+    class Config:
+        from_attributes = True
+
+
 class PromptBase(BaseModel):
     """Base prompt schema"""
     title: str
@@ -63,14 +85,34 @@ class PromptResponse(BaseModel):
     save_count: int = 0
     created_at: datetime
     updated_at: datetime
+    # Set on list responses for authenticated callers only
+    viewer_liked: Optional[bool] = None
+    viewer_saved: Optional[bool] = None
     
     class Config:
         from_attributes = True
 
 
+class PromptListItem(PromptResponse):
+    """Prompt in a list response, with embedded author, category and tags
+
+    Built from prompts loaded with eager-loading options for `user`,
+    `category` and `tags.tag`; never validate a lazily loaded Prompt into it.
+    """
+    author: Optional[AuthorSummary] = Field(None, validation_alias="user")
+    category: Optional[CategorySummary] = None
+    tags: List[TagSummary] = []
+    
+    @field_validator("tags", mode="before")
+    @classmethod
+    def unwrap_tag_relations(cls, value):
+        """Prompt.tags holds PromptTagRelation rows; embed their tags"""
+        return [getattr(relation, "tag", relation) for relation in value or []]
+
+
 class PromptListResponse(BaseModel):
     """Schema for paginated prompt list"""
-    items: List[PromptResponse]
+    items: List[PromptListItem]
     total: int
     page: int
     page_size: int
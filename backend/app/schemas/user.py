@@ -2,7 +2,7 @@
 User Pydantic schemas
 """
 from pydantic import BaseModel, EmailStr
-from typing import Optional
+from typing import Optional, Dict
 from datetime import datetime
 from uuid import UUID
 
@@ -47,12 +47,31 @@ class UserResponse(BaseModel):
     is_premium: bool = False
     credits_balance: int = 50
     role: str = "user"
+    follower_count: int = 0
+    following_count: int = 0
     created_at: datetime
     
     class Config:
         from_attributes = True
 
 
+class FollowStatusResponse(BaseModel):
+    """Schema for batch is-following lookup"""
+    following: Dict[UUID, bool]
+
+
+class AuthorSummary(BaseModel):
+    """Compact author info embedded in list responses"""
+    id: UUID
+    username: str
+    display_name: Optional[str] = None
+    avatar_url: Optional[str] = None
+    is_verified: bool = False
+    
+    class Config:
+        from_attributes = True
+
+
 class UserLogin(BaseModel):
     """Schema for user login"""
     email: EmailStr
@@ -63,6 +82,12 @@ class Token(BaseModel):
     """Schema for JWT token response"""
     access_token: str
     token_type: str = "bearer"
+    refresh_token: Optional[str] = None
+
+
+class RefreshTokenRequest(BaseModel):
+    """Schema for exchanging or revoking a refresh token"""
+    refresh_token: str
 
 
 class TokenData(BaseModel):
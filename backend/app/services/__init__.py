@@ -0,0 +1,17 @@
+# Services package
+from .feed_snapshot import FeedSnapshot, feed_snapshot_service
+from .collection_covers import collection_cover_cache
+from .health import readiness_probe
+from .token_revocation import token_revocation_service
+from .refresh_tokens import issue_refresh_token, rotate_refresh_token, revoke_refresh_token
+from .warmup import warmup_service
+from .viewer_state import (
+    ViewerState, load_prompt_viewer_state, load_content_viewer_state, annotate_viewer_state
+)
+
+__all__ = [
+    "FeedSnapshot", "feed_snapshot_service", "collection_cover_cache", "readiness_probe", "token_revocation_service",
+    "issue_refresh_token", "rotate_refresh_token", "revoke_refresh_token",
+    "warmup_service",
+    "ViewerState", "load_prompt_viewer_state", "load_content_viewer_state", "annotate_viewer_state"
+]
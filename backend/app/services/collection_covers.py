@@ -0,0 +1,92 @@
+"""
+Collection cover mosaics
+
+Collection cards show a mosaic built from the first few item thumbnails.
+Covers for a whole page of collections are loaded with one windowed query and
+kept in an in-process LRU; adding, removing or reordering items invalidates the
+collection's entry, and the TTL bounds staleness across workers.
+"""
+from typing import Dict, Iterable, List, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import get_settings
+from ..models.collection import CollectionItem
+from ..models.content import Content
+from ..models.prompt import Prompt
+from ..utils.cache import LRUCache
+from ..utils.metrics import cache_hits_total, cache_misses_total
+
+settings = get_settings()
+
+
+class CollectionCoverCache:
+    """First-K item thumbnails per collection"""
+
+    def __init__(self, size: int, max_entries: int, ttl_seconds: int):
+        self.size = size
+        self._cache: LRUCache[Tuple[str, ...]] = LRUCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+
+    async def get_many(self, db: AsyncSession, collection_ids: Sequence[UUID]) -> Dict[UUID, Tuple[str, ...]]:
+        """Cover thumbnails for each collection, loading misses in one query"""
+        covers: Dict[UUID, Tuple[str, ...]] = {}
+        missing: List[UUID] = []
+        for collection_id in collection_ids:
+            cached = self._cache.get(str(collection_id))
+            if cached is None:
+                missing.append(collection_id)
+            else:
+                covers[collection_id] = cached
+
+        cache_hits_total.inc("collection_cover", amount=len(covers))
+        cache_misses_total.inc("collection_cover", amount=len(missing))
+
+        if missing:
+            loaded = await self._load(db, missing)
+            for collection_id in missing:
+                thumbnails = tuple(loaded.get(collection_id, ()))
+                self._cache.set(str(collection_id), thumbnails)
+                covers[collection_id] = thumbnails
+
+        return covers
+
+    def invalidate(self, *collection_ids: UUID) -> None:
+        """Drop cached covers after items were added, removed or reordered"""
+        for collection_id in collection_ids:
+            self._cache.delete(str(collection_id))
+
+    async def _load(self, db: AsyncSession, collection_ids: Iterable[UUID]) -> Dict[UUID, List[str]]:
+        thumbnail = func.coalesce(Content.thumbnail_url, Prompt.preview_image_url)
+        ranked = (
+            select(
+                CollectionItem.collection_id,
+                thumbnail.label("thumbnail_url"),
+                func.row_number().over(
+                    partition_by=CollectionItem.collection_id,
+                    order_by=(CollectionItem.display_order, CollectionItem.id)
+                ).label("position")
+            )
+            .outerjoin(Content, Content.id == CollectionItem.content_id)
+            .outerjoin(Prompt, Prompt.id == CollectionItem.prompt_id)
+            .where(CollectionItem.collection_id.in_(collection_ids), thumbnail.isnot(None))
+            .subquery()
+        )
+        result = await db.execute(
+            select(ranked.c.collection_id, ranked.c.thumbnail_url)
+            .where(ranked.c.position <= self.size)
+            .order_by(ranked.c.collection_id, ranked.c.position)
+        )
+
+        covers: Dict[UUID, List[str]] = {}
+        for collection_id, thumbnail_url in result.all():
+            covers.setdefault(collection_id, []).append(thumbnail_url)
+        return covers
+
+
+collection_cover_cache = CollectionCoverCache(
+    size=settings.COLLECTION_COVER_SIZE,
+    max_entries=settings.CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.COLLECTION_COVER_TTL_SECONDS
+)
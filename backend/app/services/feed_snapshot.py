@@ -0,0 +1,202 @@
+"""
+Feed snapshot service
+
+Periodically builds the data shown on the home, trending, explore and prompt
+library pages (top content, categories with live prompt counts and top
+prompts) and holds it in memory as immutable tuples, so page views render
+real data without touching the database or making extra API calls.
+"""
+import asyncio
+import logging
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import NamedTuple, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select, func, and_
+
+from ..config import get_settings
+from ..database import async_session_maker
+from ..models.content import Content
+from ..models.prompt import Prompt, PromptCategory
+from ..models.user import User
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Characters of prompt text carried in the snapshot for card previews
+PROMPT_EXCERPT_LENGTH = 240
+
+
+class ContentCard(NamedTuple):
+    """Content fields needed to render a feed card"""
+    id: UUID
+    title: str
+    description: Optional[str]
+    type: str
+    thumbnail_url: Optional[str]
+    is_ai_generated: bool
+    duration_seconds: Optional[int]
+    view_count: int
+    like_count: int
+    author: Optional[str]
+    author_avatar: Optional[str]
+
+
+class CategoryCard(NamedTuple):
+    """Prompt category with its live public prompt count"""
+    id: int
+    name: str
+    slug: str
+    icon: Optional[str]
+    color: Optional[str]
+    prompt_count: int
+
+
+class PromptCard(NamedTuple):
+    """Prompt fields needed to render a library card"""
+    id: UUID
+    title: str
+    excerpt: str
+    type: str
+    preview_image_url: Optional[str]
+    use_count: int
+    like_count: int
+    category: Optional[str]
+    author: Optional[str]
+
+
+@dataclass(frozen=True)
+class FeedSnapshot:
+    """Immutable point-in-time view of the public feeds"""
+    version: int = 0
+    built_at: Optional[datetime] = None
+    latest: Tuple[ContentCard, ...] = ()
+    trending: Tuple[ContentCard, ...] = ()
+    categories: Tuple[CategoryCard, ...] = ()
+    prompts: Tuple[PromptCard, ...] = ()
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether the snapshot has been built from the database at least once"""
+        return self.version > 0
+
+    def same_feeds(self, other: "FeedSnapshot") -> bool:
+        """Whether both snapshots hold the same cards"""
+        return (
+            self.latest == other.latest
+            and self.trending == other.trending
+            and self.categories == other.categories
+            and self.prompts == other.prompts
+        )
+
+
+class FeedSnapshotService:
+    """Builds feed snapshots on an interval and serves the latest one"""
+
+    def __init__(self, size: int, refresh_seconds: int):
+        self.size = size
+        self.refresh_seconds = refresh_seconds
+        self._snapshot = FeedSnapshot()
+        self._task: Optional[asyncio.Task] = None
+        self.started_at: Optional[datetime] = None
+        self._built = asyncio.Event()
+
+    @property
+    def current(self) -> FeedSnapshot:
+        return self._snapshot
+
+    async def refresh(self) -> FeedSnapshot:
+        """Rebuild the snapshot from the database and swap it in"""
+        async with async_session_maker() as db:
+            content_query = (
+                select(
+                    Content.id, Content.title, Content.description, Content.type,
+                    Content.thumbnail_url, Content.is_ai_generated, Content.duration_seconds,
+                    Content.view_count, Content.like_count, User.username, User.avatar_url
+                )
+                .outerjoin(User, User.id == Content.user_id)
+                .where(Content.is_public == True)
+                .limit(self.size)
+            )
+            latest = await db.execute(content_query.order_by(Content.created_at.desc()))
+            trending = await db.execute(
+                content_query.order_by(Content.view_count.desc(), Content.like_count.desc())
+            )
+
+            categories = await db.execute(
+                select(
+                    PromptCategory.id, PromptCategory.name, PromptCategory.slug,
+                    PromptCategory.icon, PromptCategory.color, func.count(Prompt.id)
+                )
+                .outerjoin(Prompt, and_(Prompt.category_id == PromptCategory.id, Prompt.is_public == True))
+                .group_by(PromptCategory.id)
+                .order_by(PromptCategory.display_order)
+            )
+
+            prompts = await db.execute(
+                select(
+                    Prompt.id, Prompt.title, func.substr(Prompt.prompt_text, 1, PROMPT_EXCERPT_LENGTH),
+                    Prompt.type, Prompt.preview_image_url, Prompt.use_count, Prompt.like_count,
+                    PromptCategory.name, User.username
+                )
+                .outerjoin(PromptCategory, PromptCategory.id == Prompt.category_id)
+                .outerjoin(User, User.id == Prompt.user_id)
+                .where(Prompt.is_public == True)
+                .order_by(Prompt.use_count.desc())
+                .limit(self.size)
+            )
+
+            snapshot = FeedSnapshot(
+                version=self._snapshot.version + 1,
+                built_at=datetime.utcnow(),
+                latest=tuple(ContentCard(*row) for row in latest),
+                trending=tuple(ContentCard(*row) for row in trending),
+                categories=tuple(CategoryCard(*row) for row in categories),
+                prompts=tuple(PromptCard(*row) for row in prompts)
+            )
+
+        # Pages and fragments are cached per version, so only a change in the
+        # feeds themselves gets a new one
+        if self._snapshot.is_ready and snapshot.same_feeds(self._snapshot):
+            snapshot = replace(self._snapshot, built_at=snapshot.built_at)
+
+        self._snapshot = snapshot
+        self._built.set()
+        return snapshot
+
+    async def wait_until_built(self) -> FeedSnapshot:
+        """Wait until a snapshot has been built at least once"""
+        await self._built.wait()
+        return self._snapshot
+
+    def start(self) -> None:
+        """Start the background refresh loop"""
+        if self._task is None:
+            self.started_at = datetime.utcnow()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background refresh loop"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                # Keep serving the previous snapshot until the database recovers
+                logger.exception("Feed snapshot refresh failed")
+            await asyncio.sleep(self.refresh_seconds)
+
+
+feed_snapshot_service = FeedSnapshotService(
+    size=settings.FEED_SNAPSHOT_SIZE,
+    refresh_seconds=settings.FEED_SNAPSHOT_REFRESH_SECONDS
+)
@@ -0,0 +1,134 @@
+"""
+Readiness probe
+
+Liveness only says the process answers; readiness says this worker should get
+traffic. The probe checks database connectivity with a bounded timeout, pool
+saturation and how far the feed snapshot refresher has fallen behind, timing
+each dependency. Results are cached for READINESS_CACHE_SECONDS and concurrent
+probes share one run, so load balancer polling adds no database load.
+"""
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ..config import get_settings
+from ..database import engine
+from ..utils.singleflight import singleflight
+from .feed_snapshot import feed_snapshot_service
+
+settings = get_settings()
+
+# A check returns (ok, details); raising counts as a failure
+Check = Callable[[], Awaitable[Tuple[bool, Dict[str, Any]]]]
+
+
+@dataclass
+class ReadinessReport:
+    """Outcome of one readiness probe run"""
+    ready: bool
+    checked_at: datetime
+    checks: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": "ready" if self.ready else "not_ready",
+            "checked_at": self.checked_at.isoformat() + "Z",
+            "checks": self.checks
+        }
+
+
+class ReadinessProbe:
+    """Runs dependency checks concurrently and caches the combined result"""
+
+    def __init__(self, cache_seconds: float):
+        self.cache_seconds = cache_seconds
+        self._checks: List[Tuple[str, Check]] = []
+        self._report: Optional[ReadinessReport] = None
+        self._expires_at = 0.0
+
+    def add_check(self, name: str, check: Check) -> None:
+        self._checks.append((name, check))
+
+    def expire(self) -> None:
+        """Drop the cached report so the next probe re-runs the checks"""
+        self._expires_at = 0.0
+
+    async def report(self) -> ReadinessReport:
+        """The cached report, re-running the checks once it expires"""
+        if self._report is None or time.monotonic() >= self._expires_at:
+            await singleflight.do("readiness", self._refresh)
+        return self._report
+
+    async def _refresh(self) -> None:
+        results = await asyncio.gather(*(_timed(check) for _, check in self._checks))
+        checks = {name: result for (name, _), result in zip(self._checks, results)}
+        self._report = ReadinessReport(
+            ready=all(result["ok"] for result in results),
+            checked_at=datetime.utcnow(),
+            checks=checks
+        )
+        self._expires_at = time.monotonic() + self.cache_seconds
+
+
+async def _timed(check: Check) -> Dict[str, Any]:
+    started = time.perf_counter()
+    try:
+        ok, details = await check()
+    except Exception as exc:
+        ok, details = False, {"error": f"{type(exc).__name__}: {exc}"}
+    return {"ok": ok, "latency_ms": round((time.perf_counter() - started) * 1000, 2), **details}
+
+
+def database_check(engine: AsyncEngine, timeout: float) -> Check:
+    """Round-trip a trivial query; waiting on an exhausted pool counts against the timeout"""
+    async def check() -> Tuple[bool, Dict[str, Any]]:
+        async def ping() -> None:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+
+        try:
+            await asyncio.wait_for(ping(), timeout)
+        except asyncio.TimeoutError:
+            return False, {"error": f"no response within {timeout:g}s"}
+        return True, {}
+    return check
+
+
+def pool_check(engine: AsyncEngine, max_saturation: float) -> Check:
+    """Fail once checked-out connections approach pool_size + max_overflow"""
+    async def check() -> Tuple[bool, Dict[str, Any]]:
+        pool = engine.sync_engine.pool
+        if not hasattr(pool, "checkedout"):
+            return True, {"pool": type(pool).__name__}
+        capacity = pool.size() + max(getattr(pool, "_max_overflow", 0), 0)
+        checked_out = pool.checkedout()
+        saturation = checked_out / capacity if capacity else 0.0
+        return saturation < max_saturation, {
+            "checked_out": checked_out,
+            "capacity": capacity,
+            "saturation": round(saturation, 3)
+        }
+    return check
+
+
+def feed_snapshot_check(max_age_seconds: float) -> Check:
+    """Fail when the snapshot refresher has fallen behind (or never succeeded)"""
+    async def check() -> Tuple[bool, Dict[str, Any]]:
+        snapshot = feed_snapshot_service.current
+        since = snapshot.built_at or feed_snapshot_service.started_at
+        if since is None:
+            return True, {"status": "not_started"}
+        age = (datetime.utcnow() - since).total_seconds()
+        return age <= max_age_seconds, {"version": snapshot.version, "age_seconds": round(age, 1)}
+    return check
+
+
+readiness_probe = ReadinessProbe(cache_seconds=settings.READINESS_CACHE_SECONDS)
+readiness_probe.add_check("database", database_check(engine, settings.READINESS_DB_TIMEOUT_SECONDS))
+readiness_probe.add_check("db_pool", pool_check(engine, settings.READINESS_MAX_POOL_SATURATION))
+readiness_probe.add_check("feed_snapshot", feed_snapshot_check(settings.READINESS_MAX_FEED_SNAPSHOT_AGE_SECONDS))
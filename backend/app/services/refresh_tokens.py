@@ -0,0 +1,96 @@
+"""
+Refresh token rotation
+
+Login issues a refresh token alongside the access token, starting a token
+family. Each use of a refresh token marks it used and issues a new one in the
+same family, so a session can be extended without re-checking the password.
+Used tokens are kept until they expire: presenting one again means it was
+copied, and the whole family is deleted, which signs out both the legitimate
+client and whoever holds the copy.
+"""
+import logging
+import uuid
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select, update, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import get_settings
+from ..models.user import RefreshToken
+from ..utils.metrics import registry
+from ..utils.security import create_refresh_token, hash_refresh_token
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+refresh_tokens_total = registry.counter(
+    "auth_refresh_tokens_total", "Refresh token exchanges by result (rotated, invalid, reused)", ("result",)
+)
+
+
+async def issue_refresh_token(db: AsyncSession, user_id: UUID, family_id: Optional[UUID] = None) -> str:
+    """Store a new refresh token for user_id, starting a new family unless one is given"""
+    token = create_refresh_token()
+    db.add(RefreshToken(
+        token_hash=hash_refresh_token(token),
+        user_id=user_id,
+        family_id=family_id or uuid.uuid4(),
+        expires_at=datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    ))
+    return token
+
+
+async def rotate_refresh_token(db: AsyncSession, token: str) -> Optional[Tuple[UUID, str]]:
+    """Exchange a refresh token for (user_id, new refresh token); None if it isn't valid"""
+    token_hash = hash_refresh_token(token)
+    now = datetime.utcnow()
+
+    # Claim the token in one statement so two concurrent uses can't both succeed
+    result = await db.execute(
+        update(RefreshToken)
+        .where(
+            RefreshToken.token_hash == token_hash,
+            RefreshToken.used_at.is_(None),
+            RefreshToken.expires_at > now
+        )
+        .values(used_at=now)
+        .returning(RefreshToken.user_id, RefreshToken.family_id)
+    )
+    claimed = result.first()
+    if claimed is not None:
+        refresh_tokens_total.inc("rotated")
+        return claimed.user_id, await issue_refresh_token(db, claimed.user_id, claimed.family_id)
+
+    result = await db.execute(
+        select(RefreshToken.family_id, RefreshToken.user_id)
+        .where(RefreshToken.token_hash == token_hash, RefreshToken.used_at.is_not(None))
+    )
+    reused = result.first()
+    if reused is None:
+        refresh_tokens_total.inc("invalid")
+        return None
+
+    logger.warning("Refresh token reused; revoking token family %s of user %s", reused.family_id, reused.user_id)
+    await revoke_refresh_family(db, reused.family_id)
+    refresh_tokens_total.inc("reused")
+    return None
+
+
+async def revoke_refresh_token(db: AsyncSession, token: str) -> None:
+    """Revoke the family a refresh token belongs to (logout)"""
+    result = await db.execute(
+        select(RefreshToken.family_id).where(RefreshToken.token_hash == hash_refresh_token(token))
+    )
+    family_id = result.scalar_one_or_none()
+    if family_id is not None:
+        await revoke_refresh_family(db, family_id)
+
+
+async def revoke_refresh_family(db: AsyncSession, family_id: UUID) -> None:
+    await db.execute(delete(RefreshToken).where(RefreshToken.family_id == family_id))
+
+
+async def purge_expired_refresh_tokens(db: AsyncSession, now: datetime) -> None:
+    await db.execute(delete(RefreshToken).where(RefreshToken.expires_at < now))
@@ -0,0 +1,121 @@
+"""
+Access token revocation
+
+Revoked token ids (jti) live in the revoked_tokens table until the token would
+have expired anyway. Each worker keeps a bloom filter of them, rebuilt from
+the database every TOKEN_REVOCATION_SYNC_SECONDS, so checking a token costs a
+few hashes: a miss means "not revoked" without touching the database, and
+only the rare hit (a revoked token, or a ~0.1% false positive) is confirmed
+with a primary-key lookup. Revocations made in this worker apply immediately;
+other workers see them after their next sync.
+"""
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict, Optional
+from uuid import UUID
+
+from sqlalchemy import select, delete
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import get_settings
+from ..database import async_session_maker
+from ..models.user import RevokedToken
+from ..utils.bloom import BloomFilter
+from .health import readiness_probe
+from .refresh_tokens import purge_expired_refresh_tokens
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+BLOOM_ERROR_RATE = 0.001
+# Minimum filter capacity, so a worker's own revocations between syncs fit
+MIN_BLOOM_CAPACITY = 1024
+
+
+class TokenRevocationService:
+    """Per-worker bloom filter of revoked token ids, synced from the database"""
+
+    def __init__(self, sync_seconds: int):
+        self.sync_seconds = sync_seconds
+        self.synced_at: Optional[datetime] = None
+        self._bloom = BloomFilter(MIN_BLOOM_CAPACITY, BLOOM_ERROR_RATE)
+        # Revoked here since startup; re-added on every rebuild so a sync that
+        # raced the insert can't drop them
+        self._local: Dict[str, datetime] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def is_revoked(self, db: AsyncSession, jti: str) -> bool:
+        """Whether a token id was revoked; only bloom hits query the database"""
+        if jti not in self._bloom:
+            return False
+        result = await db.execute(select(RevokedToken.jti).where(RevokedToken.jti == jti))
+        return result.scalar_one_or_none() is not None
+
+    async def revoke(self, db: AsyncSession, jti: str, user_id: Optional[UUID], expires_at: datetime) -> None:
+        """Revoke a token id until expires_at"""
+        await db.execute(
+            insert(RevokedToken)
+            .values(jti=jti, user_id=user_id, expires_at=expires_at)
+            .on_conflict_do_nothing(index_elements=[RevokedToken.jti])
+        )
+        self._local[jti] = expires_at
+        self._bloom.add(jti)
+
+    async def sync(self) -> None:
+        """Rebuild the bloom filter from unexpired revocations; purge expired revocations and refresh tokens"""
+        now = datetime.utcnow()
+        async with async_session_maker() as db:
+            await db.execute(delete(RevokedToken).where(RevokedToken.expires_at < now))
+            await purge_expired_refresh_tokens(db, now)
+            result = await db.execute(select(RevokedToken.jti).where(RevokedToken.expires_at >= now))
+            jtis = result.scalars().all()
+            await db.commit()
+
+        self._local = {jti: expires for jti, expires in self._local.items() if expires >= now}
+        capacity = max(MIN_BLOOM_CAPACITY, 2 * (len(jtis) + len(self._local)))
+        bloom = BloomFilter.from_items(jtis, capacity, BLOOM_ERROR_RATE)
+        for jti in self._local:
+            bloom.add(jti)
+
+        self._bloom = bloom
+        self.synced_at = now
+
+    def start(self) -> None:
+        """Start the background sync loop"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background sync loop"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sync()
+            except Exception:
+                # Keep checking against the previous filter until the database recovers
+                logger.exception("Token revocation sync failed")
+            await asyncio.sleep(self.sync_seconds)
+
+
+token_revocation_service = TokenRevocationService(sync_seconds=settings.TOKEN_REVOCATION_SYNC_SECONDS)
+
+
+async def _revocation_check():
+    synced_at = token_revocation_service.synced_at
+    if synced_at is None:
+        return False, {"status": "not_synced"}
+    return True, {"age_seconds": round((datetime.utcnow() - synced_at).total_seconds(), 1)}
+
+
+# Until the first sync, tokens revoked before this worker started would be accepted
+readiness_probe.add_check("token_revocation", _revocation_check)
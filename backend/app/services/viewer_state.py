@@ -0,0 +1,92 @@
+"""
+Batch "liked/saved by me" annotation for list responses
+
+Loads the caller's likes and saves for a whole page of ids with one IN query
+per relation, instead of one lookup per item.
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Sequence, Union
+from uuid import UUID
+
+from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.collection import Collection, CollectionItem
+from ..models.content import ContentLike
+from ..models.prompt import PromptLike, PromptSave
+from ..models.user import User
+
+
+@dataclass(frozen=True)
+class ViewerState:
+    """Ids on a page that the viewer has liked or saved"""
+    liked: FrozenSet[UUID] = frozenset()
+    saved: FrozenSet[UUID] = frozenset()
+
+
+async def load_prompt_viewer_state(
+    db: AsyncSession,
+    user: Optional[User],
+    prompt_ids: Sequence[UUID]
+) -> Optional[ViewerState]:
+    """Load which of the prompts the user liked and saved"""
+    if user is None or not prompt_ids:
+        return None
+
+    liked = await db.execute(
+        select(PromptLike.prompt_id).where(
+            PromptLike.user_id == user.id,
+            PromptLike.prompt_id.in_(prompt_ids)
+        )
+    )
+    saved = await db.execute(
+        select(PromptSave.prompt_id).where(
+            PromptSave.user_id == user.id,
+            PromptSave.prompt_id.in_(prompt_ids)
+        )
+    )
+    return ViewerState(liked=frozenset(liked.scalars()), saved=frozenset(saved.scalars()))
+
+
+async def load_content_viewer_state(
+    db: AsyncSession,
+    user: Optional[User],
+    content_ids: Sequence[UUID]
+) -> Optional[ViewerState]:
+    """Load which of the content items the user liked and saved to a collection"""
+    if user is None or not content_ids:
+        return None
+
+    liked = await db.execute(
+        select(ContentLike.content_id).where(
+            ContentLike.user_id == user.id,
+            ContentLike.content_id.in_(content_ids)
+        )
+    )
+    saved = await db.execute(
+        select(CollectionItem.content_id)
+        .join(Collection, Collection.id == CollectionItem.collection_id)
+        .where(
+            Collection.user_id == user.id,
+            CollectionItem.content_id.in_(content_ids)
+        )
+        .distinct()
+    )
+    return ViewerState(liked=frozenset(liked.scalars()), saved=frozenset(saved.scalars()))
+
+
+def annotate_viewer_state(
+    items: Iterable[Union[BaseModel, Dict[str, Any]]],
+    state: Optional[ViewerState]
+) -> None:
+    """Set viewer_liked / viewer_saved on response items (or projected rows) in place"""
+    if state is None:
+        return
+    for item in items:
+        if isinstance(item, dict):
+            item["viewer_liked"] = item["id"] in state.liked
+            item["viewer_saved"] = item["id"] in state.saved
+        else:
+            item.viewer_liked = item.id in state.liked
+            item.viewer_saved = item.id in state.saved
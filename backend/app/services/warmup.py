@@ -0,0 +1,150 @@
+"""
+Startup warm-up
+
+Right after a deploy the first requests would pay for opening database
+connections, compiling SQLAlchemy statements, compiling Jinja templates and
+filling empty caches. The warm-up runs in the background once the app starts:
+it opens the pool's connections, waits for the first feed snapshot, compiles
+every template and sends the hot list requests through the app in-process
+(compiling their queries and priming the response cache). Rendered pages are
+cached per base URL, so the feed pages are only warmed when WARMUP_BASE_URL
+says which base URL real requests arrive with. The readiness probe reports
+not-ready until the warm-up has finished.
+"""
+import asyncio
+import logging
+import time
+from typing import Dict, Optional, Sequence
+
+from fastapi import FastAPI
+from fastapi.templating import Jinja2Templates
+from sqlalchemy import text
+
+from ..config import get_settings
+from ..database import engine
+from .feed_snapshot import feed_snapshot_service
+from .health import readiness_probe
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# How long to wait for the snapshot service's first build
+FEED_SNAPSHOT_WAIT_SECONDS = 10
+
+# Anonymous API requests whose queries, serializers and cached responses are hot
+# (the response cache is keyed on path and query only)
+WARMUP_API_PATHS = (
+    "/api/content",
+    "/api/content/trending",
+    "/api/content?fields=card",
+    "/api/prompts",
+    "/api/prompts?fields=card",
+    "/api/collections",
+)
+
+# Feed pages; their rendered bodies are cached per base URL
+WARMUP_PAGE_PATHS = (
+    "/",
+    "/trending",
+    "/explore",
+    "/prompt-library",
+)
+
+
+class WarmupService:
+    """Runs the warm-up steps once per worker and records how long each took"""
+
+    def __init__(self, pool_connections: int, timeout_seconds: float, base_url: Optional[str] = None):
+        self.pool_connections = pool_connections
+        self.timeout_seconds = timeout_seconds
+        self.base_url = base_url
+        self.finished = False
+        self.timings_ms: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self, app: FastAPI, templates: Jinja2Templates) -> None:
+        """Warm up in the background; readiness waits for it"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(app, templates))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self, app: FastAPI, templates: Jinja2Templates) -> None:
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._warm(app, templates), self.timeout_seconds)
+        except asyncio.TimeoutError:
+            logger.warning("Warm-up did not finish within %.0fs; serving anyway", self.timeout_seconds)
+        finally:
+            # Best effort: a failed step only means colder first requests
+            self.finished = True
+            readiness_probe.expire()
+        logger.info("Warm-up finished in %.0f ms: %s", (time.perf_counter() - started) * 1000, self.timings_ms)
+
+    async def _warm(self, app: FastAPI, templates: Jinja2Templates) -> None:
+        await self._step("pool", self._open_connections())
+        await self._step(
+            "feed_snapshot",
+            asyncio.wait_for(feed_snapshot_service.wait_until_built(), FEED_SNAPSHOT_WAIT_SECONDS)
+        )
+        await self._step("templates", asyncio.to_thread(self.compile_templates, templates))
+        await self._step("requests", self._send_requests(app, "http://warmup", WARMUP_API_PATHS))
+        if self.base_url:
+            await self._step("pages", self._send_requests(app, self.base_url, WARMUP_PAGE_PATHS))
+
+    async def _step(self, name: str, work) -> None:
+        started = time.perf_counter()
+        try:
+            await work
+        except Exception:
+            logger.exception("Warm-up step %s failed", name)
+        self.timings_ms[name] = round((time.perf_counter() - started) * 1000, 1)
+
+    async def _open_connections(self) -> None:
+        """Open up to pool_connections connections at once so they all stay pooled"""
+        pool = engine.sync_engine.pool
+        count = min(self.pool_connections, pool.size()) if hasattr(pool, "size") else 1
+
+        async def ping() -> None:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+
+        await asyncio.gather(*(ping() for _ in range(count)))
+
+    @staticmethod
+    def compile_templates(templates: Jinja2Templates) -> None:
+        for name in templates.env.list_templates(extensions=["html"]):
+            templates.env.get_template(name)
+
+    @staticmethod
+    async def _send_requests(app: FastAPI, base_url: str, paths: Sequence[str]) -> None:
+        # httpx is only needed here, so keep it out of the import graph until warm-up runs
+        import httpx
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url=base_url) as client:
+            for path in paths:
+                response = await client.get(path)
+                if response.status_code >= 500:
+                    logger.warning("Warm-up request %s returned %s", path, response.status_code)
+
+
+warmup_service = WarmupService(
+    pool_connections=settings.WARMUP_POOL_CONNECTIONS,
+    timeout_seconds=settings.WARMUP_TIMEOUT_SECONDS,
+    base_url=settings.WARMUP_BASE_URL
+)
+
+
+async def _warmup_check():
+    return warmup_service.finished or not settings.WARMUP_ENABLED, dict(warmup_service.timings_ms)
+
+
+readiness_probe.add_check("warmup", _warmup_check)
@@ -1,4 +1,6 @@
 # Utils package
 from .security import verify_password, get_password_hash, create_access_token, decode_access_token
+from .cache import response_cache
+from .singleflight import singleflight
 
-__all__ = ["verify_password", "get_password_hash", "create_access_token", "decode_access_token"]
+__all__ = ["verify_password", "get_password_hash", "create_access_token", "decode_access_token", "response_cache", "singleflight"]
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Fingerprinted, precompressed static assets
+
+The build step (`python -m app.utils.assets` from backend/) minifies the CSS
+and JS under static/, writes content-hashed copies to static/dist/ together
+with .gz (and, when brotli is installed, .br) siblings, and records the
+mapping in static/dist/manifest.json. Templates reference assets through
+asset_url(), and PrecompressedStaticFiles serves the hashed files with
+`Cache-Control: immutable`, picking the precompressed variant the client
+accepts so nothing is compressed per request.
+"""
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import stat
+from typing import Dict, Iterator, List, Tuple
+
+import anyio
+from jinja2 import pass_context
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+from .negotiation import acceptable_encodings
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip siblings are always written
+    brotli = None
+
+STATIC_DIR = "static"
+DIST_DIR = "dist"
+MANIFEST_NAME = "manifest.json"
+
+# Sources that are fingerprinted, relative to STATIC_DIR
+ASSET_EXTENSIONS = (".css", ".js")
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Content coding -> suffix of the precompressed sibling, in serving preference order
+PRECOMPRESSED_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+def minify_css(source: str) -> str:
+    """Strip comments and insignificant whitespace from a stylesheet"""
+    source = re.sub(r"/\*.*?\*/", "", source, flags=re.DOTALL)
+    source = re.sub(r"\s+", " ", source)
+    source = re.sub(r"\s*([{};,>])\s*", r"\1", source)
+    source = re.sub(r":\s+", ":", source)
+    return source.replace(";}", "}").strip()
+
+
+# A "/" after one of these (or at the start) begins a regex literal, not a division
+REGEX_PRECEDING_CHARS = frozenset("(,=:[!&|?{};+-*%<>~^")
+REGEX_PRECEDING_KEYWORDS = re.compile(
+    r"(?:^|[^\w$])(?:return|typeof|instanceof|case|do|else|in|of|new|delete|void|throw|yield|await)$"
+)
+
+
+def minify_js(source: str) -> str:
+    """Minify a script: drop comments, indentation and blank lines outside literals
+
+    String, template and regex literals are copied verbatim, and statements are
+    never joined, so automatic semicolon insertion is unaffected.
+    """
+    pieces = []
+    for is_code, text in _js_pieces(source):
+        pieces.append(re.sub(r"[ \t]*\n[ \t\n]*", "\n", text) if is_code else text)
+    return "".join(pieces).strip() + "\n"
+
+
+def _js_pieces(source: str) -> Iterator[Tuple[bool, str]]:
+    """Split a script into (is_code, text) pieces, with comments removed from code"""
+    code: List[str] = []
+    after_literal = False
+    i, n = 0, len(source)
+    while i < n:
+        char = source[i]
+        starts_regex = (
+            char == "/" and source[i:i + 2] not in ("//", "/*")
+            and _regex_allowed("".join(code[-16:]), after_literal)
+        )
+        if char in "'\"`" or starts_regex:
+            end = _regex_end(source, i) if starts_regex else _literal_end(source, i)
+            yield True, "".join(code)
+            yield False, source[i:end]
+            code, after_literal, i = [], True, end
+        elif source.startswith("//", i):
+            end = source.find("\n", i)
+            i = n if end == -1 else end
+        elif source.startswith("/*", i):
+            end = source.find("*/", i + 2)
+            end = n if end == -1 else end + 2
+            # Keep a line break the comment spanned, since it can end a statement
+            code.append("\n" if "\n" in source[i:end] else " ")
+            i = end
+        else:
+            code.append(char)
+            i += 1
+    yield True, "".join(code)
+
+
+def _regex_allowed(preceding: str, after_literal: bool) -> bool:
+    preceding = preceding.rstrip()
+    if not preceding:
+        return not after_literal
+    return preceding[-1] in REGEX_PRECEDING_CHARS or REGEX_PRECEDING_KEYWORDS.search(preceding) is not None
+
+
+def _literal_end(source: str, start: int) -> int:
+    """Index just past the string or template literal starting at start"""
+    quote = source[start]
+    i, n = start + 1, len(source)
+    while i < n:
+        char = source[i]
+        if char == "\\":
+            i += 2
+        elif char == quote:
+            return i + 1
+        elif quote == "`" and source.startswith("${", i):
+            i = _expression_end(source, i + 2)
+        elif quote != "`" and char == "\n":
+            # Unterminated string: hand the rest back to the code scanner
+            return i
+        else:
+            i += 1
+    return n
+
+
+def _expression_end(source: str, start: int) -> int:
+    """Index just past the "}" closing a template substitution"""
+    depth = 0
+    i, n = start, len(source)
+    while i < n:
+        char = source[i]
+        if char in "'\"`":
+            i = _literal_end(source, i)
+            continue
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            if depth == 0:
+                return i + 1
+            depth -= 1
+        i += 1
+    return n
+
+
+def _regex_end(source: str, start: int) -> int:
+    """Index just past the regex literal (and its flags) starting at start"""
+    in_class = False
+    i, n = start + 1, len(source)
+    while i < n:
+        char = source[i]
+        if char == "\\":
+            i += 2
+            continue
+        if char == "\n":
+            # Regex literals can't span lines: this was a division after all
+            return i
+        if char == "[":
+            in_class = True
+        elif char == "]":
+            in_class = False
+        elif char == "/" and not in_class:
+            i += 1
+            while i < n and (source[i].isalnum() or source[i] in "_$"):
+                i += 1
+            return i
+        i += 1
+    return n
+
+
+MINIFIERS = {".css": minify_css, ".js": minify_js}
+
+
+def build_assets(static_dir: str = STATIC_DIR) -> Dict[str, str]:
+    """Minify, fingerprint and precompress assets; return the manifest"""
+    dist_dir = os.path.join(static_dir, DIST_DIR)
+    manifest: Dict[str, str] = {}
+
+    for root, dirs, files in os.walk(static_dir):
+        # Never re-process build output
+        dirs[:] = [name for name in dirs if os.path.join(root, name) != dist_dir]
+        for filename in sorted(files):
+            stem, ext = os.path.splitext(filename)
+            if ext not in ASSET_EXTENSIONS:
+                continue
+
+            source_path = os.path.join(root, filename)
+            relative_dir = os.path.relpath(root, static_dir)
+            with open(source_path, encoding="utf-8") as f:
+                body = MINIFIERS[ext](f.read()).encode()
+
+            digest = hashlib.sha256(body).hexdigest()[:12]
+            hashed_name = os.path.normpath(os.path.join(relative_dir, f"{stem}.{digest}{ext}"))
+            output_path = os.path.join(dist_dir, hashed_name)
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+            with open(output_path, "wb") as f:
+                f.write(body)
+            with open(output_path + ".gz", "wb") as f:
+                f.write(gzip.compress(body, compresslevel=9, mtime=0))
+            if brotli is not None:
+                with open(output_path + ".br", "wb") as f:
+                    f.write(brotli.compress(body, quality=11))
+
+            source_name = os.path.normpath(os.path.join(relative_dir, filename))
+            manifest[source_name.replace(os.sep, "/")] = f"{DIST_DIR}/{hashed_name.replace(os.sep, '/')}"
+
+    with open(os.path.join(dist_dir, MANIFEST_NAME), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+    return manifest
+
+
+def load_manifest(static_dir: str = STATIC_DIR) -> Dict[str, str]:
+    """Load the asset manifest, or an empty one if assets weren't built"""
+    try:
+        with open(os.path.join(static_dir, DIST_DIR, MANIFEST_NAME), encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+manifest = load_manifest()
+
+
+@pass_context
+def asset_url(context, path: str) -> str:
+    """Jinja global: URL of the fingerprinted asset, or the source file if unbuilt"""
+    request = context["request"]
+    return str(request.url_for("static", path=manifest.get(path, path)))
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles that serves prebuilt .br/.gz siblings of fingerprinted assets"""
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if not path.startswith(DIST_DIR + "/") or scope["method"] not in ("GET", "HEAD"):
+            return await super().get_response(path, scope)
+
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        headers = {"Cache-Control": IMMUTABLE_CACHE_CONTROL, "Vary": "Accept-Encoding"}
+
+        for encoding in acceptable_encodings(accept_encoding, list(PRECOMPRESSED_SUFFIXES)):
+            full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, path + PRECOMPRESSED_SUFFIXES[encoding])
+            if stat_result and stat.S_ISREG(stat_result.st_mode):
+                return FileResponse(
+                    full_path,
+                    stat_result=stat_result,
+                    media_type=media_type,
+                    headers={**headers, "Content-Encoding": encoding}
+                )
+
+        response = await super().get_response(path, scope)
+        response.headers.update(headers)
+        return response
+
+
+if __name__ == "__main__":
+    built = build_assets()
+    for source, target in sorted(built.items()):
+        print(f"{source} -> {target}")
+    print(f"✅ Built {len(built)} assets into {os.path.join(STATIC_DIR, DIST_DIR)}")
@@ -0,0 +1,43 @@
+"""
+Bloom filter for compact set-membership checks
+
+Answers "definitely not in the set" or "possibly in the set" using a fixed bit
+array, so a large set (e.g. revoked token ids) can be checked on every request
+without holding the set itself. False positives occur at roughly the rate the
+filter was sized for; callers confirm positives against the source of truth.
+"""
+import hashlib
+import math
+from typing import Iterable
+
+
+class BloomFilter:
+    """Fixed-size bloom filter using double hashing over one blake2b digest"""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        capacity = max(capacity, 1)
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    @classmethod
+    def from_items(cls, items: Iterable[str], capacity: int, error_rate: float = 0.01) -> "BloomFilter":
+        bloom = cls(capacity, error_rate)
+        for item in items:
+            bloom.add(item)
+        return bloom
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self.size for i in range(self.hash_count))
@@ -0,0 +1,363 @@
+"""
+Response caching for anonymous public reads
+
+Entries live in an in-process LRU with a TTL and, when CACHE_REDIS_URL is set,
+in a shared Redis backend so that workers can reuse each other's renders.
+Entries are tagged (e.g. "prompts", "prompt:<id>") and mutations invalidate
+by tag; with Redis, invalidations are also published so every worker drops
+the tag from its local LRU, and the local tier is bypassed whenever that
+subscription isn't live (it could have missed one). Cached responses carry ETag / Last-Modified headers and conditional
+GETs are answered with 304 Not Modified.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Any, Dict, Generic, Iterable, NamedTuple, Optional, Set, Tuple, TypeVar
+
+from fastapi import Request, Response, status
+
+from ..config import get_settings
+from .metrics import cache_hits_total, cache_misses_total
+from .serialization import dump_json
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Seconds before re-subscribing after the invalidation channel drops
+RESUBSCRIBE_DELAY_SECONDS = 1
+
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """A cached response body and its validators"""
+    body: bytes
+    etag: str
+    last_modified: float
+    media_type: str = "application/json"
+
+
+class SharedHit(NamedTuple):
+    """An entry read from the shared backend, with its tags and remaining TTL"""
+    entry: CacheEntry
+    tags: Tuple[str, ...]
+    ttl_seconds: float
+
+
+class LRUCache(Generic[V]):
+    """In-process LRU cache of values of type V, with per-entry expiry and tag index"""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, V, Tuple[str, ...]]]" = OrderedDict()
+        self._tags: Dict[str, Set[str]] = {}
+
+    def get(self, key: str) -> Optional[V]:
+        """Return a live entry and mark it as recently used"""
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        expires_at, entry, _ = item
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(
+        self,
+        key: str,
+        entry: V,
+        tags: Iterable[str] = (),
+        ttl_seconds: Optional[float] = None
+    ) -> None:
+        """Store an entry (for ttl_seconds, default the cache TTL), evicting the least recently used one if full"""
+        if key in self._entries:
+            self._remove(key)
+        tags = tuple(tags)
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._entries[key] = (time.monotonic() + ttl, entry, tags)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def delete(self, key: str) -> None:
+        """Drop a single entry if present"""
+        self._remove(key)
+
+    def invalidate_tags(self, tags: Iterable[str]) -> None:
+        """Drop every entry carrying any of the given tags"""
+        for tag in tags:
+            for key in self._tags.pop(tag, set()):
+                self._remove(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._tags.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str) -> None:
+        item = self._entries.pop(key, None)
+        if item is None:
+            return
+        for tag in item[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+class RedisCacheBackend:
+    """Shared cache backend on Redis (or any protocol-compatible stand-in)"""
+
+    KEY_PREFIX = "vp:cache:"
+    TAG_PREFIX = "vp:tag:"
+    INVALIDATION_CHANNEL = "vp:invalidate"
+
+    def __init__(self, url: str, ttl_seconds: int):
+        # Imported lazily: redis is only required when a shared backend is configured
+        import redis.asyncio as redis
+
+        self.ttl_seconds = ttl_seconds
+        self._client = redis.from_url(url)
+
+    async def get(self, key: str) -> Optional[SharedHit]:
+        """Return an entry with its tags and remaining TTL"""
+        redis_key = self.KEY_PREFIX + key
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.hgetall(redis_key)
+            pipe.pttl(redis_key)
+            data, ttl_ms = await pipe.execute()
+        if not data or ttl_ms <= 0:
+            return None
+        entry = CacheEntry(
+            body=data[b"body"],
+            etag=data[b"etag"].decode(),
+            last_modified=float(data[b"last_modified"]),
+            media_type=data[b"media_type"].decode()
+        )
+        return SharedHit(entry, tuple(json.loads(data.get(b"tags", b"[]"))), ttl_ms / 1000)
+
+    async def set(self, key: str, entry: CacheEntry, tags: Iterable[str] = ()) -> None:
+        redis_key = self.KEY_PREFIX + key
+        tags = list(tags)
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.hset(redis_key, mapping={
+                "body": entry.body,
+                "etag": entry.etag,
+                "last_modified": repr(entry.last_modified),
+                "media_type": entry.media_type,
+                "tags": json.dumps(tags)
+            })
+            pipe.expire(redis_key, self.ttl_seconds)
+            for tag in tags:
+                pipe.sadd(self.TAG_PREFIX + tag, redis_key)
+                pipe.expire(self.TAG_PREFIX + tag, self.ttl_seconds)
+            await pipe.execute()
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> None:
+        tags = list(tags)
+        for tag in tags:
+            tag_key = self.TAG_PREFIX + tag
+            keys = await self._client.smembers(tag_key)
+            await self._client.delete(tag_key, *keys)
+        await self._client.publish(self.INVALIDATION_CHANNEL, json.dumps(tags))
+
+    async def listen_invalidations(self, on_subscribed, on_tags) -> None:
+        """Call on_subscribed() once subscribed, then on_tags(tags) per published invalidation"""
+        pubsub = self._client.pubsub()
+        try:
+            await pubsub.subscribe(self.INVALIDATION_CHANNEL)
+            async for message in pubsub.listen():
+                if message["type"] == "subscribe":
+                    on_subscribed()
+                elif message["type"] == "message":
+                    on_tags(json.loads(message["data"]))
+        finally:
+            await pubsub.aclose()
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+class ResponseCache:
+    """Two-level response cache keyed on route plus normalized query params"""
+
+    def __init__(
+        self,
+        enabled: bool,
+        ttl_seconds: int,
+        max_entries: int,
+        redis_url: Optional[str] = None
+    ):
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self.local: LRUCache[CacheEntry] = LRUCache(max_entries, ttl_seconds)
+        self.shared = RedisCacheBackend(redis_url, ttl_seconds) if enabled and redis_url else None
+        # With a shared backend the local tier is only trusted while this worker
+        # receives other workers' invalidations
+        self._subscribed = False
+        self._listener: Optional[asyncio.Task] = None
+
+    @property
+    def local_enabled(self) -> bool:
+        return self.shared is None or self._subscribed
+
+    def start(self) -> None:
+        """Follow other workers' invalidations (only needed with a shared backend)"""
+        if self.shared is not None and self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    @staticmethod
+    def is_cacheable(request: Request) -> bool:
+        """Only anonymous GET requests share cached responses"""
+        return request.method == "GET" and "authorization" not in request.headers
+
+    @staticmethod
+    def make_key(request: Request) -> str:
+        """Build a key from the path and sorted, non-empty query params"""
+        params = sorted(
+            (name, value)
+            for name, value in request.query_params.multi_items()
+            if value != ""
+        )
+        query = "&".join(f"{name}={value}" for name, value in params)
+        return f"{request.url.path}?{query}"
+
+    async def get(self, request: Request) -> Optional[Response]:
+        """Return a cached (or 304) response for this request, if any"""
+        if not self.enabled or not self.is_cacheable(request):
+            return None
+
+        key = self.make_key(request)
+        entry = None
+        if self.local_enabled:
+            entry = self.local.get(key)
+            _record_lookup("response", entry)
+        if entry is None and self.shared is not None:
+            hit = await self.shared.get(key)
+            _record_lookup("response_redis", hit)
+            if hit is not None:
+                entry = hit.entry
+                if self.local_enabled:
+                    # Keep the tags so invalidation reaches the copy, and expire
+                    # it with the shared entry rather than a fresh TTL from now
+                    self.local.set(key, entry, hit.tags, ttl_seconds=hit.ttl_seconds)
+        if entry is None:
+            return None
+
+        return self._respond(request, entry)
+
+    async def put(
+        self,
+        request: Request,
+        payload: Any,
+        tags: Iterable[str] = ()
+    ) -> Response:
+        """Serialize a response model (or projected rows), cache it when allowed, and respond"""
+        body = dump_json(payload)
+        if not self.enabled or not self.is_cacheable(request):
+            return Response(content=body, media_type="application/json")
+
+        entry = CacheEntry(
+            body=body,
+            etag=f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"',
+            last_modified=float(int(time.time()))
+        )
+        key = self.make_key(request)
+        tags = tuple(tags)
+        if self.local_enabled:
+            self.local.set(key, entry, tags)
+        if self.shared is not None:
+            await self.shared.set(key, entry, tags)
+
+        return self._respond(request, entry)
+
+    async def invalidate(self, *tags: str) -> None:
+        """Invalidate every cached response carrying any of the tags"""
+        self.local.invalidate_tags(tags)
+        if self.shared is not None:
+            await self.shared.invalidate_tags(tags)
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        if self.shared is not None:
+            await self.shared.close()
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                await self.shared.listen_invalidations(self._on_subscribed, self.local.invalidate_tags)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Cache invalidation subscription failed; bypassing the local cache")
+            # Invalidations published while disconnected are lost: stop trusting local entries
+            self._subscribed = False
+            await asyncio.sleep(RESUBSCRIBE_DELAY_SECONDS)
+
+    def _on_subscribed(self) -> None:
+        # Entries cached before (re)subscribing may have missed invalidations
+        self.local.clear()
+        self._subscribed = True
+
+    def _respond(self, request: Request, entry: CacheEntry) -> Response:
+        headers = {
+            "ETag": entry.etag,
+            "Last-Modified": formatdate(entry.last_modified, usegmt=True),
+            "Cache-Control": f"public, max-age={self.ttl_seconds}",
+            "Vary": "Authorization"
+        }
+        if _not_modified(request, entry):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(content=entry.body, media_type=entry.media_type, headers=headers)
+
+
+def _record_lookup(cache: str, entry: Any) -> None:
+    if entry is None:
+        cache_misses_total.inc(cache)
+    else:
+        cache_hits_total.inc(cache)
+
+
+def _not_modified(request: Request, entry: CacheEntry) -> bool:
+    """Evaluate If-None-Match / If-Modified-Since against an entry"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in candidates or entry.etag in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return entry.last_modified <= since
+
+    return False
+
+
+response_cache = ResponseCache(
+    enabled=settings.CACHE_ENABLED,
+    ttl_seconds=settings.CACHE_TTL_SECONDS,
+    max_entries=settings.CACHE_MAX_ENTRIES,
+    redis_url=settings.CACHE_REDIS_URL
+)
@@ -0,0 +1,78 @@
+"""
+Column-projected list queries with sparse fieldsets
+
+List endpoints accept `fields=` (comma-separated names, or "card" for the
+preset a feed card needs). Instead of loading full ORM entities they select
+just those columns as row tuples, so large text/JSONB columns are never read,
+nothing enters the identity map, and rows encode directly to JSON.
+"""
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from fastapi import HTTPException, status
+from sqlalchemy.sql.elements import ColumnElement
+
+# A field is either one column or a nested object of columns (e.g. author)
+FieldSpec = Union[ColumnElement, Mapping[str, ColumnElement]]
+
+CARD_PRESET = "card"
+
+
+class Projection:
+    """Named columns a list endpoint can project, plus its card preset"""
+
+    def __init__(self, fields: Mapping[str, FieldSpec], card: Sequence[str]):
+        self.fields = dict(fields)
+        self.card = tuple(card)
+
+    def resolve(self, fields: str) -> Tuple[str, ...]:
+        """Parse a `fields=` value; "id" is always included"""
+        names = ["id"]
+        for name in fields.split(","):
+            name = name.strip()
+            if not name:
+                continue
+            if name == CARD_PRESET:
+                names.extend(self.card)
+            elif name in self.fields:
+                names.append(name)
+            else:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Unknown field '{name}'. Allowed: {CARD_PRESET}, {', '.join(self.fields)}"
+                )
+        return tuple(dict.fromkeys(names))
+
+    def columns(self, names: Sequence[str]) -> List[ColumnElement]:
+        """Labelled columns to select for the given field names"""
+        columns = []
+        for name in names:
+            spec = self.fields[name]
+            if isinstance(spec, Mapping):
+                columns.extend(column.label(f"{name}__{key}") for key, column in spec.items())
+            else:
+                columns.append(spec.label(name))
+        return columns
+
+    def to_dicts(self, rows: Sequence[Any], names: Sequence[str]) -> List[Dict[str, Any]]:
+        """Shape selected rows into response dicts"""
+        items = []
+        for row in rows:
+            values = row._mapping
+            item = {}
+            for name in names:
+                spec = self.fields[name]
+                if isinstance(spec, Mapping):
+                    nested = {key: values[f"{name}__{key}"] for key in spec}
+                    # An outer join that matched nothing yields all-NULL columns
+                    item[name] = nested if any(value is not None for value in nested.values()) else None
+                else:
+                    item[name] = values[name]
+            items.append(item)
+        return items
+
+
+def parse_fields(projection: Projection, fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Resolved field names, or None when the full response was requested"""
+    if fields is None or not fields.strip():
+        return None
+    return projection.resolve(fields)
@@ -0,0 +1,135 @@
+"""
+Event-loop stall detection and sampling profiles of a live worker
+
+Blocking calls on the event loop (bcrypt, JWT decoding, large synchronous
+serializations) stall every request the worker is serving. LoopWatchdog runs
+a heartbeat task on the loop and a watcher thread beside it: when the
+heartbeat is late by more than LOOP_STALL_THRESHOLD_MS the thread captures
+the loop thread's stack while it is still blocked, and the stall is logged
+with that stack once the loop recovers.
+
+sample_stacks() samples thread stacks at a fixed interval and returns them
+collapsed ("outer;inner;leaf count" per line), the input format of
+flamegraph.pl, speedscope and similar tools.
+"""
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from typing import Dict, Optional
+
+from ..config import get_settings
+from .metrics import registry
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+event_loop_stalls_total = registry.counter(
+    "event_loop_stalls_total", "Event-loop stalls longer than LOOP_STALL_THRESHOLD_MS"
+)
+
+
+class LoopWatchdog:
+    """Detects event-loop stalls and captures the blocking stack"""
+
+    def __init__(self, threshold_ms: float):
+        self.threshold = threshold_ms / 1000
+        # Beat often enough that a stall is noticed well within the threshold
+        self.interval = self.threshold / 4
+        self._beat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._stalled_stack: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start watching the running loop"""
+        if self._task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._heartbeat())
+        self._thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._thread.start()
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stop.set()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._thread.join()
+
+    async def _heartbeat(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            stalled_for = now - self._beat - self.interval
+            self._beat = now
+            if stalled_for > self.threshold:
+                event_loop_stalls_total.inc()
+                logger.warning(
+                    "Event loop blocked for %.0f ms; stack while blocked:\n%s",
+                    stalled_for * 1000, self._stalled_stack or "  (not captured)"
+                )
+            self._stalled_stack = None
+
+    def _watch(self) -> None:
+        captured_for = None
+        while not self._stop.wait(self.interval):
+            beat = self._beat
+            if time.monotonic() - beat - self.interval <= self.threshold or captured_for == beat:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is not None:
+                self._stalled_stack = "".join(traceback.format_stack(frame))
+            captured_for = beat
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def sample_stacks(seconds: float, interval: float, thread_id: Optional[int] = None) -> Dict[str, int]:
+    """Sample stacks for `seconds` and count each collapsed stack
+
+    Samples only `thread_id` when given, otherwise every thread except the
+    sampler itself (prefixed with the thread name). Blocks the calling thread,
+    so run it off the event loop.
+    """
+    own_id = threading.get_ident()
+    names = {thread.ident: thread.name for thread in threading.enumerate()}
+    stacks: Counter = Counter()
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        for ident, frame in sys._current_frames().items():
+            if ident == own_id or (thread_id is not None and ident != thread_id):
+                continue
+            labels = []
+            while frame is not None:
+                labels.append(_frame_label(frame))
+                frame = frame.f_back
+            if thread_id is None:
+                labels.append(names.get(ident, str(ident)))
+            stacks[";".join(reversed(labels))] += 1
+        time.sleep(interval)
+    return dict(stacks)
+
+
+def collapse(stacks: Dict[str, int]) -> str:
+    """Render counted stacks in collapsed (folded) format, hottest first"""
+    return "".join(f"{stack} {count}\n" for stack, count in sorted(stacks.items(), key=lambda item: -item[1]))
+
+
+loop_watchdog = LoopWatchdog(settings.LOOP_STALL_THRESHOLD_MS)
@@ -0,0 +1,350 @@
+"""
+Prometheus metrics for the API
+
+Counters, gauges and histograms are plain per-worker dicts. They are only
+updated from the worker's event loop, so no locks sit on the hot path; a
+request costs two clock reads and three dict updates. `GET /metrics` renders
+them in the Prometheus text format.
+
+With several uvicorn workers, set METRICS_MULTIPROC_DIR to a directory shared
+by the workers (and emptied before they start). Each worker then writes its
+snapshot there every METRICS_FLUSH_SECONDS and whichever worker answers the
+scrape merges them: counters and histograms are summed across every file
+(including workers that have exited, so totals never go backwards), gauges
+across live workers only.
+"""
+import asyncio
+import json
+import logging
+import os
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0)
+LOOP_LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+Labels = Tuple[str, ...]
+
+
+class Metric:
+    """A named metric family with one value per label combination"""
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), multiprocess_mode: str = "sum"):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        # How gauges from several workers combine: "sum", "max" or "all" (one series per pid)
+        self.multiprocess_mode = multiprocess_mode
+        self._values: Dict[Labels, Any] = {}
+
+    def samples(self) -> List[Tuple[Labels, Any]]:
+        return list(self._values.items())
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+
+class Gauge(Metric):
+    type = "gauge"
+
+    def set(self, value: float, *labels: str) -> None:
+        self._values[labels] = value
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) - amount
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, *labels: str) -> None:
+        state = self._values.get(labels)
+        if state is None:
+            # Per-bucket (non-cumulative) counts, the +Inf overflow, then sum
+            state = self._values[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        state[bisect_left(self.buckets, value)] += 1
+        state[-1] += value
+
+
+class MetricsRegistry:
+    """Holds this worker's metrics and renders them, merged across workers"""
+
+    def __init__(self, multiprocess_dir: Optional[str] = None):
+        self.multiprocess_dir = multiprocess_dir
+        self._metrics: Dict[str, Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = (), multiprocess_mode: str = "sum") -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames, multiprocess_mode))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Register a callback that refreshes gauges just before a snapshot"""
+        self._collectors.append(collector)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """This worker's metrics as JSON-serializable data"""
+        for collector in self._collectors:
+            collector()
+        return {
+            "pid": os.getpid(),
+            "metrics": {
+                name: [[list(labels), value] for labels, value in metric.samples()]
+                for name, metric in self._metrics.items()
+            }
+        }
+
+    def flush(self) -> None:
+        """Write this worker's snapshot for the other workers to merge"""
+        if not self.multiprocess_dir:
+            return
+        path = os.path.join(self.multiprocess_dir, f"metrics-{os.getpid()}.json")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f)
+        os.replace(tmp_path, path)
+
+    def render(self) -> str:
+        """Prometheus text exposition of every worker's metrics"""
+        snapshots = [self.snapshot()]
+        if self.multiprocess_dir:
+            snapshots.extend(self._read_other_workers())
+
+        lines: List[str] = []
+        for name, metric in self._metrics.items():
+            merged = self._merge(metric, snapshots)
+            lines.append(f"# HELP {name} {metric.documentation}")
+            lines.append(f"# TYPE {name} {metric.type}")
+            for labels, value in sorted(merged.items()):
+                pairs = list(zip(metric.labelnames + ("pid",), labels))
+                if isinstance(metric, Histogram):
+                    cumulative = 0
+                    for bound, count in zip(metric.buckets + (float("inf"),), value):
+                        cumulative += count
+                        le = "+Inf" if bound == float("inf") else repr(float(bound))
+                        lines.append(f"{name}_bucket{_format_labels(pairs + [('le', le)])} {cumulative}")
+                    lines.append(f"{name}_sum{_format_labels(pairs)} {value[-1]!r}")
+                    lines.append(f"{name}_count{_format_labels(pairs)} {cumulative}")
+                else:
+                    lines.append(f"{name}{_format_labels(pairs)} {float(value)!r}")
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric: Metric) -> Any:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def _read_other_workers(self) -> List[Dict[str, Any]]:
+        snapshots = []
+        try:
+            names = os.listdir(self.multiprocess_dir)
+        except FileNotFoundError:
+            return snapshots
+        for file_name in names:
+            if not (file_name.startswith("metrics-") and file_name.endswith(".json")):
+                continue
+            try:
+                with open(os.path.join(self.multiprocess_dir, file_name), encoding="utf-8") as f:
+                    snapshot = json.load(f)
+            except (OSError, ValueError):
+                continue  # being replaced or unreadable; the next scrape picks it up
+            if snapshot.get("pid") != os.getpid():
+                snapshots.append(snapshot)
+        return snapshots
+
+    @staticmethod
+    def _merge(metric: Metric, snapshots: List[Dict[str, Any]]) -> Dict[Labels, Any]:
+        merged: Dict[Labels, Any] = {}
+        for snapshot in snapshots:
+            pid = snapshot["pid"]
+            is_gauge = isinstance(metric, Gauge)
+            if is_gauge and not _pid_alive(pid):
+                continue
+            for labels, value in snapshot["metrics"].get(metric.name, ()):
+                labels = tuple(labels)
+                if is_gauge and metric.multiprocess_mode == "all":
+                    merged[labels + (str(pid),)] = value
+                elif labels not in merged:
+                    merged[labels] = list(value) if isinstance(value, list) else value
+                elif isinstance(metric, Histogram):
+                    merged[labels] = [a + b for a, b in zip(merged[labels], value)]
+                elif is_gauge and metric.multiprocess_mode == "max":
+                    merged[labels] = max(merged[labels], value)
+                else:
+                    merged[labels] += value
+        return merged
+
+
+def _pid_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _format_labels(pairs: Sequence[Tuple[str, str]]) -> str:
+    if not pairs:
+        return ""
+    escaped = (
+        name + '="' + str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+        for name, value in pairs
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+registry = MetricsRegistry(settings.METRICS_MULTIPROC_DIR)
+
+http_requests_total = registry.counter(
+    "http_requests_total", "HTTP requests by route template and status", ("method", "route", "status")
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template", ("method", "route")
+)
+http_requests_in_progress = registry.gauge(
+    "http_requests_in_progress", "HTTP requests currently being served", ("method",)
+)
+cache_hits_total = registry.counter("cache_hits_total", "Cache lookups served from the cache", ("cache",))
+cache_misses_total = registry.counter("cache_misses_total", "Cache lookups that missed", ("cache",))
+db_pool_connections = registry.gauge(
+    "db_pool_connections", "Database pool connections by state (size, checked_in, checked_out, overflow)", ("state",)
+)
+event_loop_lag_seconds = registry.histogram(
+    "event_loop_lag_seconds", "Event-loop scheduling delay per probe", buckets=LOOP_LAG_BUCKETS
+)
+event_loop_lag_last_seconds = registry.gauge(
+    "event_loop_lag_last_seconds", "Latest event-loop scheduling delay (worst worker)", multiprocess_mode="max"
+)
+
+
+def route_template(scope: Scope) -> str:
+    """The matched route's path template; unmatched paths share one label to bound cardinality"""
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class PrometheusMiddleware:
+    """Records request count, latency and in-flight requests per route template"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_requests_in_progress.inc(method)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            http_requests_in_progress.dec(method)
+            route = route_template(scope)
+            http_request_duration_seconds.observe(elapsed, method, route)
+            http_requests_total.inc(method, route, str(status_code))
+
+
+def pool_collector(engine: AsyncEngine) -> Callable[[], None]:
+    """Collector that copies the engine's connection pool counters into db_pool_connections"""
+    def collect() -> None:
+        pool = engine.sync_engine.pool
+        for state, read in (
+            ("size", "size"), ("checked_in", "checkedin"), ("checked_out", "checkedout"), ("overflow", "overflow")
+        ):
+            if hasattr(pool, read):
+                db_pool_connections.set(getattr(pool, read)(), state)
+    return collect
+
+
+class MetricsService:
+    """Background probes: event-loop lag and, in multiprocess mode, snapshot flushing"""
+
+    def __init__(self, registry: MetricsRegistry, lag_interval: float, flush_seconds: float):
+        self.registry = registry
+        self.lag_interval = lag_interval
+        self.flush_seconds = flush_seconds
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+        self._tasks.append(asyncio.create_task(self._probe_loop_lag()))
+        if self.registry.multiprocess_dir:
+            os.makedirs(self.registry.multiprocess_dir, exist_ok=True)
+            self._tasks.append(asyncio.create_task(self._flush_periodically()))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+        # Leave final counter values behind so cluster totals never go backwards
+        self.registry.flush()
+
+    async def _probe_loop_lag(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            scheduled = loop.time() + self.lag_interval
+            await asyncio.sleep(self.lag_interval)
+            lag = max(0.0, loop.time() - scheduled)
+            event_loop_lag_seconds.observe(lag)
+            event_loop_lag_last_seconds.set(lag)
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_seconds)
+            try:
+                self.registry.flush()
+            except OSError:
+                logger.exception("Writing metrics snapshot failed")
+
+
+metrics_service = MetricsService(
+    registry,
+    lag_interval=settings.EVENT_LOOP_LAG_INTERVAL_SECONDS,
+    flush_seconds=settings.METRICS_FLUSH_SECONDS
+)
@@ -0,0 +1,43 @@
+"""
+Accept-Encoding negotiation for precompressed responses
+
+Parses the header into content codings with q-values, so `br;q=0` rules
+brotli out and a coding only matches its own token, not any token containing
+it. Shared by the page cache and the static asset server.
+"""
+from typing import Dict, List, Sequence
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """Map each content coding in an Accept-Encoding header to its q-value"""
+    weights: Dict[str, float] = {}
+    for part in header.split(","):
+        coding, *params = (piece.strip() for piece in part.split(";"))
+        if not coding:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    # A malformed weight can't be trusted to mean "acceptable"
+                    q = 0.0
+        weights[coding.lower()] = q
+    return weights
+
+
+def acceptable_encodings(header: str, available: Sequence[str]) -> List[str]:
+    """Codings from `available` the client accepts, most preferred first
+
+    Codings the header doesn't name take the `*` weight (0 without one). Ties
+    keep the order of `available`, so list the server's preference first.
+    """
+    weights = parse_accept_encoding(header)
+    wildcard = weights.get("*", 0.0)
+    ranked = sorted(
+        ((weights.get(coding, wildcard), index, coding) for index, coding in enumerate(available)),
+        key=lambda entry: (-entry[0], entry[1])
+    )
+    return [coding for q, _, coding in ranked if q > 0]
@@ -0,0 +1,186 @@
+"""
+Rendered-page and fragment caching for the Jinja page routes
+
+Pages whose context doesn't depend on the request are rendered once per
+version of the template and everything it extends, includes or imports (and
+per base URL, since url_for() emits absolute URLs) and served as bytes. Gzip and, when the brotli package is installed, brotli
+variants are compressed once at render time, and each variant gets its own
+strong ETag. Renders run in a worker thread (gzip-9 and brotli-11 take long
+enough to stall the event loop), and concurrent misses for a page share one
+render. Data-driven pages cache their fragments with a TTL instead.
+"""
+import asyncio
+import gzip
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from fastapi import Request, Response, status
+from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, Template, meta
+from markupsafe import Markup
+
+from .metrics import cache_hits_total, cache_misses_total
+from .negotiation import acceptable_encodings
+from .singleflight import singleflight
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; pages are still served gzipped
+    brotli = None
+
+
+@dataclass(frozen=True)
+class RenderedPage:
+    """A rendered page and its precompressed variants"""
+    body: bytes
+    gzip_body: bytes
+    br_body: Optional[bytes]
+    etag: str
+    # The template and every template it pulled in, to check for edits
+    templates: Tuple[Template, ...]
+
+    @property
+    def is_up_to_date(self) -> bool:
+        return all(template.is_up_to_date for template in self.templates)
+
+
+class PageCache:
+    """Caches fully rendered pages keyed on template and base URL until a template changes"""
+
+    def __init__(self, templates: Jinja2Templates, max_entries: int = 256):
+        self.templates = templates
+        self.max_entries = max_entries
+        self._pages: "OrderedDict[Tuple[Hashable, ...], RenderedPage]" = OrderedDict()
+
+    async def render(
+        self,
+        request: Request,
+        name: str,
+        context: Dict[str, Any],
+        version: Hashable = None
+    ) -> Response:
+        """Serve a cached render of a template, rendering it if stale
+
+        `context` must not depend on the request. Data-driven callers pass a
+        `version` that changes whenever their data does.
+        """
+        key = (name, str(request.base_url), version)
+
+        page = self._pages.get(key)
+        if page is None or not page.is_up_to_date:
+            cache_misses_total.inc("page")
+            page = await singleflight.do(
+                f"page:{key!r}", lambda: asyncio.to_thread(self._render, request, name, context)
+            )
+            self._pages[key] = page
+            while len(self._pages) > self.max_entries:
+                self._pages.popitem(last=False)
+        else:
+            cache_hits_total.inc("page")
+            self._pages.move_to_end(key)
+
+        return _negotiate(request, page)
+
+    def clear(self) -> None:
+        self._pages.clear()
+
+    def _render(self, request: Request, name: str, context: Dict[str, Any]) -> RenderedPage:
+        env = self.templates.env
+        template = env.get_template(name)
+        body = template.render({**context, "request": request}).encode()
+        return RenderedPage(
+            body=body,
+            gzip_body=gzip.compress(body, compresslevel=9, mtime=0),
+            br_body=brotli.compress(body, quality=11) if brotli is not None else None,
+            etag=hashlib.blake2b(body, digest_size=16).hexdigest(),
+            templates=tuple(env.get_template(dependency) for dependency in template_dependencies(env, name))
+        )
+
+
+def template_dependencies(env: Environment, name: str) -> List[str]:
+    """name plus every template it extends, includes or imports, recursively
+
+    Only literal template names can be followed; a page that includes a
+    computed name must pass a `version` that changes with it.
+    """
+    found: List[str] = []
+    pending = [name]
+    while pending:
+        current = pending.pop()
+        if current in found:
+            continue
+        found.append(current)
+        source = env.loader.get_source(env, current)[0]
+        pending.extend(
+            reference for reference in meta.find_referenced_templates(env.parse(source))
+            if reference is not None
+        )
+    return found
+
+
+class FragmentCache:
+    """TTL cache for rendered template fragments on data-driven pages"""
+
+    def __init__(self, templates: Jinja2Templates, max_entries: int = 512):
+        self.templates = templates
+        self.max_entries = max_entries
+        self._fragments: "OrderedDict[Hashable, Tuple[float, Markup]]" = OrderedDict()
+
+    def render(
+        self,
+        name: str,
+        key: Hashable,
+        ttl_seconds: float,
+        context_factory: Callable[[], Dict[str, Any]]
+    ) -> Markup:
+        """Return a cached fragment, re-rendering it once its TTL expires"""
+        cache_key = (name, key)
+        now = time.monotonic()
+
+        cached = self._fragments.get(cache_key)
+        if cached is not None and cached[0] > now:
+            cache_hits_total.inc("fragment")
+            self._fragments.move_to_end(cache_key)
+            return cached[1]
+
+        cache_misses_total.inc("fragment")
+
+        fragment = Markup(self.templates.get_template(name).render(context_factory()))
+        self._fragments[cache_key] = (now + ttl_seconds, fragment)
+        while len(self._fragments) > self.max_entries:
+            self._fragments.popitem(last=False)
+        return fragment
+
+    def clear(self) -> None:
+        self._fragments.clear()
+
+
+def _negotiate(request: Request, page: RenderedPage) -> Response:
+    """Pick the best precompressed variant and answer conditional GETs"""
+    variants = {"gzip": page.gzip_body}
+    if page.br_body is not None:
+        variants["br"] = page.br_body
+    accepted = acceptable_encodings(
+        request.headers.get("accept-encoding", ""), [coding for coding in ("br", "gzip") if coding in variants]
+    )
+    encoding = accepted[0] if accepted else None
+    body = variants[encoding] if encoding else page.body
+
+    # Each representation gets its own strong validator
+    etag = f'"{page.etag}-{encoding}"' if encoding else f'"{page.etag}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "public, no-cache",
+        "Vary": "Accept-Encoding"
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in {tag.strip() for tag in if_none_match.split(",")}:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="text/html", headers=headers)
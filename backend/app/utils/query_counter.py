@@ -0,0 +1,51 @@
+"""
+SQL statement counting for N+1 regression checks
+
+    with assert_max_queries(4):
+        response = await client.get("/api/prompts?page_size=50")
+
+The counter listens on the engine, so it sees every statement issued while it
+is active; use it where requests run one at a time (tests, scripts).
+"""
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ..database import engine as default_engine
+
+
+class QueryCounter:
+    """Records the SQL statements executed on an engine while active"""
+
+    def __init__(self, engine: Optional[AsyncEngine] = None):
+        self.engine = (engine or default_engine).sync_engine
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def __enter__(self) -> "QueryCounter":
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        self.statements.append(statement)
+
+
+@contextmanager
+def assert_max_queries(limit: int, engine: Optional[AsyncEngine] = None) -> Iterator[QueryCounter]:
+    """Fail if the enclosed block issues more than `limit` SQL statements"""
+    with QueryCounter(engine) as counter:
+        yield counter
+
+    if counter.count > limit:
+        statements = "\n".join(f"  {i}. {sql}" for i, sql in enumerate(counter.statements, 1))
+        raise AssertionError(
+            f"Expected at most {limit} SQL statements, got {counter.count}:\n{statements}"
+        )
@@ -0,0 +1,175 @@
+"""
+Per-request SQL statement count and DB time
+
+Engine event hooks add every statement's duration to the stats of the request
+that issued it (tracked in a context variable, which SQLAlchemy's async
+greenlets and coalesced single-flight tasks inherit). QueryMetricsMiddleware
+then:
+
+- adds a `Server-Timing` header (db time, statement count, slowest statement)
+  when DEBUG is on, so the browser's network panel shows it per request
+- records per-route histograms of statement count, DB time and request time,
+  served by `/metrics/queries`
+- logs requests over SLOW_REQUEST_QUERY_COUNT statements or SLOW_REQUEST_DB_MS
+"""
+import logging
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+QUERY_COUNT_BUCKETS = (1, 2, 3, 5, 8, 13, 21, 34, 55)
+DURATION_MS_BUCKETS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+
+@dataclass
+class RequestQueryStats:
+    """SQL executed on behalf of one request"""
+    count: int = 0
+    db_ms: float = 0.0
+    slowest_ms: float = 0.0
+    slowest_sql: Optional[str] = None
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        self.count += 1
+        self.db_ms += elapsed_ms
+        if elapsed_ms > self.slowest_ms:
+            self.slowest_ms = elapsed_ms
+            self.slowest_sql = statement
+
+
+current_query_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("current_query_stats", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if current_query_stats.get() is not None:
+        context._query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = current_query_stats.get()
+    started = getattr(context, "_query_started", None)
+    if stats is not None and started is not None:
+        stats.record(statement, (time.perf_counter() - started) * 1000)
+
+
+def install_query_hooks(engine: AsyncEngine) -> None:
+    """Attribute statements executed on engine to the current request"""
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class Histogram:
+    """Cumulative-bucket histogram (Prometheus style: each bucket counts values <= bound)"""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> Dict[str, object]:
+        cumulative, running = {}, 0
+        for bound, count in zip(self.buckets + ("+Inf",), self.counts):
+            running += count
+            cumulative[str(bound)] = running
+        return {"count": self.count, "sum": round(self.sum, 3), "buckets": cumulative}
+
+
+class RouteQueryMetrics:
+    """Per-route histograms of statement count, DB time and request time"""
+
+    def __init__(self):
+        self._routes: Dict[str, Tuple[Histogram, Histogram, Histogram]] = {}
+
+    def observe(self, route: str, stats: RequestQueryStats, request_ms: float) -> None:
+        histograms = self._routes.get(route)
+        if histograms is None:
+            histograms = self._routes[route] = (
+                Histogram(QUERY_COUNT_BUCKETS), Histogram(DURATION_MS_BUCKETS), Histogram(DURATION_MS_BUCKETS)
+            )
+        queries, db_ms, duration_ms = histograms
+        queries.observe(stats.count)
+        db_ms.observe(stats.db_ms)
+        duration_ms.observe(request_ms)
+
+    def snapshot(self) -> Dict[str, Dict[str, object]]:
+        return {
+            route: {
+                "queries": queries.snapshot(),
+                "db_ms": db_ms.snapshot(),
+                "duration_ms": duration_ms.snapshot()
+            }
+            for route, (queries, db_ms, duration_ms) in sorted(self._routes.items())
+        }
+
+    def clear(self) -> None:
+        self._routes.clear()
+
+
+route_query_metrics = RouteQueryMetrics()
+
+
+def route_label(scope: Scope) -> str:
+    """Method plus route template (e.g. `GET /api/content/{content_id}`), set once routing ran"""
+    route = scope.get("route")
+    path = getattr(route, "path", None) or "unmatched"
+    return f"{scope['method']} {path}"
+
+
+def server_timing(stats: RequestQueryStats) -> str:
+    parts: List[str] = [f'db;dur={stats.db_ms:.2f};desc="{stats.count} queries"']
+    if stats.count:
+        parts.append(f"db-slowest;dur={stats.slowest_ms:.2f}")
+    return ", ".join(parts)
+
+
+class QueryMetricsMiddleware:
+    """Collects per-request SQL stats for HTTP requests"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats()
+        token = current_query_stats.set(stats)
+        started = time.perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start" and settings.DEBUG:
+                MutableHeaders(scope=message).append("Server-Timing", server_timing(stats))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_query_stats.reset(token)
+            request_ms = (time.perf_counter() - started) * 1000
+            route = route_label(scope)
+            route_query_metrics.observe(route, stats, request_ms)
+            if stats.count > settings.SLOW_REQUEST_QUERY_COUNT or stats.db_ms > settings.SLOW_REQUEST_DB_MS:
+                logger.warning(
+                    "%s issued %d SQL statements in %.1f ms (request %.1f ms); slowest %.1f ms: %s",
+                    route, stats.count, stats.db_ms, request_ms, stats.slowest_ms,
+                    " ".join((stats.slowest_sql or "").split())[:500]
+                )
@@ -1,27 +1,68 @@
 """
 Security utilities for password hashing and JWT tokens
+
+Access tokens carry a `jti` (so they can be revoked) and, when signing keys are
+configured, a `kid` header naming the key that signed them. Rotating keys means
+adding a new entry to JWT_SIGNING_KEYS, pointing JWT_ACTIVE_KID at it and
+removing the old entry once tokens signed with it have expired. Tokens without
+a kid are signed with SECRET_KEY and only accepted while JWT_SIGNING_KEYS is
+empty, so configuring signing keys retires SECRET_KEY for access tokens. Verified
+payloads are cached for TOKEN_CACHE_TTL_SECONDS (never past their expiry).
+
+Refresh tokens are opaque random strings; only their HMAC is stored, so
+checking one is a hash and a primary-key lookup rather than a bcrypt round.
 """
+import hashlib
+import hmac
+import secrets
+import time
+import uuid
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Dict, Optional
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 
 from ..config import get_settings
+from .cache import LRUCache
 
 settings = get_settings()
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing (created on first use: only sign-in and registration need passlib)
+_pwd_context = None
+
+# Token string -> verified payload
+_verified_tokens: LRUCache[Dict[str, Any]] = LRUCache(
+    max_entries=settings.TOKEN_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.TOKEN_CACHE_TTL_SECONDS
+)
+
+
+def get_pwd_context():
+    """Get the shared passlib context"""
+    global _pwd_context
+    if _pwd_context is None:
+        from passlib.context import CryptContext
+        _pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    return _pwd_context
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash"""
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
     """Hash a password"""
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
+
+
+def signing_key(kid: Optional[str]) -> Optional[str]:
+    """Secret for a key id; tokens without a kid use SECRET_KEY until signing keys are configured"""
+    if kid is None:
+        return None if settings.JWT_SIGNING_KEYS else settings.SECRET_KEY
+    # The kid comes from an unverified header: anything but a string is forged
+    if not isinstance(kid, str):
+        return None
+    return settings.JWT_SIGNING_KEYS.get(kid)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -33,16 +74,42 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     else:
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    to_encode.update({"exp": expire, "jti": uuid.uuid4().hex})
+    
+    kid = settings.JWT_ACTIVE_KID
+    key = signing_key(kid)
+    if key is None:
+        raise RuntimeError(f"JWT_ACTIVE_KID {kid!r} must name an entry in JWT_SIGNING_KEYS")
+    encoded_jwt = jwt.encode(
+        to_encode, key, algorithm=settings.ALGORITHM, headers={"kid": kid} if kid else None
+    )
     
     return encoded_jwt
 
 
 def decode_access_token(token: str) -> Optional[dict]:
     """Decode and verify a JWT access token"""
+    payload = _verified_tokens.get(token)
+    if payload is not None:
+        return payload if payload.get("exp", float("inf")) > time.time() else None
+    
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
+        key = signing_key(jwt.get_unverified_header(token).get("kid"))
+        if key is None:
+            return None
+        payload = jwt.decode(token, key, algorithms=[settings.ALGORITHM])
     except JWTError:
         return None
+    
+    _verified_tokens.set(token, payload)
+    return payload
+
+
+def create_refresh_token() -> str:
+    """Create an opaque refresh token"""
+    return secrets.token_urlsafe(32)
+
+
+def hash_refresh_token(token: str) -> str:
+    """Keyed hash a refresh token is stored and looked up by"""
+    return hmac.new(settings.SECRET_KEY.encode(), token.encode(), hashlib.sha256).hexdigest()
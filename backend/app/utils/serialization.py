@@ -0,0 +1,56 @@
+"""
+Fast JSON serialization for list responses
+
+Returning ORM objects with `response_model=` makes FastAPI validate them and,
+on older releases this project still supports, walk the result with
+jsonable_encoder before encoding. Routes on hot paths instead validate once
+into their response schema and return model_response(), which encodes the
+model straight to bytes with pydantic-core. Plain dicts and row tuples (which
+have no schema to encode them) go through orjson when it is installed.
+
+`python -m benchmarks.serialization` compares the paths.
+"""
+import json
+from datetime import date, datetime
+from typing import Any, Optional
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; plain data falls back to the json module
+    orjson = None
+
+
+def dump_json(payload: Any) -> bytes:
+    """Encode a response model or plain JSON-compatible data to bytes"""
+    if isinstance(payload, BaseModel):
+        # pydantic-core writes JSON directly; dumping to dicts first for orjson is slower
+        return payload.model_dump_json().encode()
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, default=_json_default, separators=(",", ":")).encode()
+
+
+def _json_default(value: Any) -> str:
+    """Match Pydantic's JSON for the non-native types rows contain"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response that encodes content without jsonable_encoder"""
+
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
+
+
+def model_response(
+    payload: Any,
+    status_code: int = 200,
+    headers: Optional[dict] = None
+) -> FastJSONResponse:
+    """Respond with an already-validated response model (or plain data)"""
+    return FastJSONResponse(content=payload, status_code=status_code, headers=headers)
@@ -0,0 +1,77 @@
+"""
+Request coalescing (single-flight) for hot read paths
+
+Concurrent callers asking for the same key share one in-flight awaitable and
+its result instead of each running an identical database query. Coalescing is
+per worker process; per-key counters record how many callers were served by
+another caller's query.
+"""
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class FlightStats:
+    """Counters for a single coalescing key"""
+    calls: int = 0
+    executions: int = 0
+    coalesced: int = 0
+
+
+class SingleFlight:
+    """Deduplicates concurrent calls that share a key"""
+
+    def __init__(self, max_tracked_keys: int = 1000):
+        self.max_tracked_keys = max_tracked_keys
+        self._in_flight: Dict[str, "asyncio.Future[Any]"] = {}
+        self._stats: "OrderedDict[str, FlightStats]" = OrderedDict()
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run fn once for all concurrent callers of key and share its result"""
+        stats = self._track(key)
+        stats.calls += 1
+
+        task = self._in_flight.get(key)
+        if task is None:
+            stats.executions += 1
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._forget(key, task))
+        else:
+            stats.coalesced += 1
+
+        # Shield so a cancelled caller doesn't cancel the query for everyone else
+        return await asyncio.shield(task)
+
+    def stats(self, key: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+        """Return counters for one key, or for every tracked key"""
+        if key is not None:
+            return {key: asdict(self._stats[key])} if key in self._stats else {}
+        return {name: asdict(value) for name, value in self._stats.items()}
+
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    def _track(self, key: str) -> FlightStats:
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = FlightStats()
+            while len(self._stats) > self.max_tracked_keys:
+                self._stats.popitem(last=False)
+        else:
+            self._stats.move_to_end(key)
+        return stats
+
+    def _forget(self, key: str, task: "asyncio.Future[Any]") -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Retrieve the exception so an unawaited failure isn't logged as never retrieved
+        if not task.cancelled():
+            task.exception()
+
+
+singleflight = SingleFlight()
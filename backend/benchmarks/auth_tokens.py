@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Access token verification checks
+
+Signs a token the normal way and a set of forged ones (unknown, non-string or
+missing kid headers, wrong key, expired) and checks that decode_access_token
+accepts only the first, returning None for the rest instead of raising. Then
+configures signing keys and checks that tokens without a kid, even ones signed
+with SECRET_KEY, stop verifying. Needs no database.
+
+Run from backend/:
+    python -m benchmarks.auth_tokens
+"""
+import sys
+import time
+
+from jose import jwt
+
+from app.config import get_settings
+from app.utils.security import create_access_token, decode_access_token
+
+settings = get_settings()
+
+SUBJECT = "00000000-0000-0000-0000-000000000001"
+
+
+def forged(headers: dict, key: str = "not-the-secret", exp_offset: int = 3600) -> str:
+    claims = {"sub": SUBJECT, "exp": int(time.time()) + exp_offset, "jti": "forged"}
+    return jwt.encode(claims, key, algorithm=settings.ALGORITHM, headers=headers)
+
+
+def check(cases) -> bool:
+    """Decode each (name, token, should_verify) case; return whether all passed"""
+    failed = False
+    for name, token, should_verify in cases:
+        try:
+            payload = decode_access_token(token)
+            # Decode twice: the second call goes through the verified-token cache
+            ok = (payload is not None) == should_verify and (decode_access_token(token) is not None) == should_verify
+            detail = "" if ok else f" (got {'payload' if payload else 'None'})"
+        except Exception as exc:
+            ok, detail = False, f" (raised {type(exc).__name__}: {exc})"
+        failed |= not ok
+        print(f"  {'✅' if ok else '❌'} {name}{detail}")
+    return not failed
+
+
+def main():
+    # Without signing keys, tokens carry no kid and use SECRET_KEY
+    settings.JWT_SIGNING_KEYS, settings.JWT_ACTIVE_KID = {}, None
+    cases = [
+        ("valid token", create_access_token({"sub": SUBJECT}), True),
+        ("kid is a list", forged({"kid": []}), False),
+        ("kid is a dict", forged({"kid": {"a": 1}}), False),
+        ("kid is a number", forged({"kid": 1}), False),
+        ("unknown kid", forged({"kid": "unknown"}), False),
+        ("no kid, wrong key", forged({}), False),
+        ("expired", forged({}, key=settings.SECRET_KEY, exp_offset=-60), False),
+        ("not a JWT", "garbage", False),
+    ]
+    print("Without signing keys:")
+    passed = check(cases)
+
+    # Signed before the switch but never decoded, so not in the verified-token
+    # cache: settings only change on restart, which empties it
+    legacy = forged({}, key=settings.SECRET_KEY)
+    settings.JWT_SIGNING_KEYS, settings.JWT_ACTIVE_KID = {"new": "rotated-secret"}, "new"
+    cases = [
+        ("valid token", create_access_token({"sub": SUBJECT}), True),
+        ("no kid, SECRET_KEY", legacy, False),
+        ("kid signed with SECRET_KEY", forged({"kid": "new"}, key=settings.SECRET_KEY), False),
+    ]
+    print("\nWith signing keys:")
+    passed &= check(cases)
+
+    if not passed:
+        sys.exit(1)
+    print("\n✅ Only the genuine token verified")
+
+
+if __name__ == "__main__":
+    main()
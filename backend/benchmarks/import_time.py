@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Import-time budget for worker startup
+
+Imports `app.main` in a fresh interpreter under `python -X importtime` (best of
+--repeat runs, since the first run also pays for writing .pyc files) and fails
+if it takes longer than --budget-ms or if it pulls in a module that must stay
+out of the API process: the extractor helpers and their scraping clients, or
+subsystems that are imported on first use (passlib, httpx).
+
+Run from backend/:
+    python -m benchmarks.import_time --budget-ms 1500
+"""
+import argparse
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# Top-level packages (or app modules) the API process must never import at startup
+FORBIDDEN_MODULES = (
+    "app.helpers",   # extractor CLIs, run as scripts
+    "requests",
+    "bs4",
+    "instaloader",
+    "discord",
+    "passlib",       # loaded by the first sign-in / registration
+    "httpx",         # loaded by the startup warm-up
+)
+
+
+def measure(target: str) -> Tuple[int, Dict[str, int]]:
+    """Import target in a fresh interpreter; return total and cumulative microseconds per module"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        sys.exit(f"Importing {target} failed:\n{result.stderr}")
+
+    cumulative: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, self_us, total_us, name = (part.strip() for part in line.replace("import time:", "|", 1).split("|"))
+        if total_us.isdigit():
+            cumulative[name] = int(total_us)
+    return cumulative.get(target, 0), cumulative
+
+
+def forbidden(modules: List[str]) -> List[str]:
+    return sorted(
+        name for name in modules
+        if any(name == banned or name.startswith(banned + ".") for banned in FORBIDDEN_MODULES)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fail if importing the app exceeds its startup budget")
+    parser.add_argument("--target", default="app.main")
+    parser.add_argument("--budget-ms", type=float, default=1500)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=15, help="Slowest packages to list")
+    args = parser.parse_args()
+
+    runs = [measure(args.target) for _ in range(args.repeat)]
+    total_us, modules = min(runs, key=lambda run: run[0])
+
+    # Report top-level packages and app modules, which is where a fix would go
+    interesting = {
+        name: us for name, us in modules.items()
+        if "." not in name or name.startswith("app.")
+    }
+    print(f"import {args.target}: {total_us / 1000:.0f} ms (best of {args.repeat}, budget {args.budget_ms:.0f} ms)")
+    for name, us in sorted(interesting.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {us / 1000:8.1f} ms  {name}")
+
+    failed = False
+    banned = forbidden(list(modules))
+    if banned:
+        failed = True
+        print(f"\n❌ Imported at startup but must load lazily or not at all: {', '.join(banned)}")
+    if total_us / 1000 > args.budget_ms:
+        failed = True
+        print(f"\n❌ Startup imports took {total_us / 1000:.0f} ms, over the {args.budget_ms:.0f} ms budget")
+    if failed:
+        sys.exit(1)
+    print("\n✅ Startup imports within budget")
+
+
+if __name__ == "__main__":
+    main()
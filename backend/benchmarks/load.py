@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+HTTP load benchmark for the API hot paths
+
+Boots `app.main:app` under uvicorn (or targets --url) against a database
+seeded with benchmarks.seed, drives scripted workloads at a fixed concurrency
+and reports p50/p95/p99 latency, throughput and errors per route. Results are
+saved as JSON so two commits can be compared:
+
+    python -m benchmarks.load --output before.json
+    git checkout other-branch
+    python -m benchmarks.load --output after.json --compare before.json
+
+--compare exits non-zero when any route's p95 regresses by more than
+--max-regression percent.
+
+Workloads:
+    feed_scroll     GET /api/content, pages 1..5 in order (one scroll session)
+    trending        GET /api/content/trending at a random page
+    prompt_search   GET /api/prompts?search=<word>
+    like_storm      POST /api/content/{hot}/like from many signed-in users
+    view_storm      POST /api/content/{hot}/view
+    login_burst     POST /api/auth/login for random seeded users
+"""
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+# Credentials of users created by benchmarks.seed
+SEED_PASSWORD = "password123"
+SEED_EMAIL = "user{}@example.com"
+
+SEARCH_TERMS = ["golden", "neon", "portrait", "city", "cinematic", "dragon", "forest", "studio"]
+
+# Statuses that are an expected outcome rather than an error for a route
+EXPECTED_STATUSES = {"like": {201, 400}}
+
+
+@dataclass
+class Context:
+    """Shared state prepared once before the workloads run"""
+    users: int
+    hot_content_ids: List[str] = field(default_factory=list)
+    tokens: List[str] = field(default_factory=list)
+    rng: random.Random = field(default_factory=lambda: random.Random(0))
+
+
+@dataclass
+class RouteStats:
+    latencies_ms: List[float] = field(default_factory=list)
+    errors: int = 0
+    statuses: Dict[int, int] = field(default_factory=dict)
+
+
+class Recorder:
+    """Collects latency and status per route label"""
+
+    def __init__(self):
+        self.routes: Dict[str, RouteStats] = {}
+
+    async def request(self, client: httpx.AsyncClient, route: str, method: str, url: str, **kwargs) -> httpx.Response:
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+            status = response.status_code
+        except httpx.HTTPError:
+            response, status = None, 0
+        elapsed = (time.perf_counter() - started) * 1000
+
+        stats = self.routes.setdefault(route, RouteStats())
+        stats.latencies_ms.append(elapsed)
+        stats.statuses[status] = stats.statuses.get(status, 0) + 1
+        if status not in EXPECTED_STATUSES.get(route, ()) and not 200 <= status < 300:
+            stats.errors += 1
+        return response
+
+
+Workload = Callable[[httpx.AsyncClient, Recorder, Context], Awaitable[None]]
+
+
+async def feed_scroll(client: httpx.AsyncClient, recorder: Recorder, ctx: Context) -> None:
+    for page in range(1, 6):
+        await recorder.request(client, "content_list", "GET", "/api/content", params={"page": page, "page_size": 20})
+
+
+async def trending(client: httpx.AsyncClient, recorder: Recorder, ctx: Context) -> None:
+    await recorder.request(client, "trending", "GET", "/api/content/trending", params={"page": ctx.rng.randint(1, 5)})
+
+
+async def prompt_search(client: httpx.AsyncClient, recorder: Recorder, ctx: Context) -> None:
+    await recorder.request(client, "prompt_search", "GET", "/api/prompts", params={"search": ctx.rng.choice(SEARCH_TERMS)})
+
+
+async def like_storm(client: httpx.AsyncClient, recorder: Recorder, ctx: Context) -> None:
+    token = ctx.rng.choice(ctx.tokens)
+    await recorder.request(
+        client, "like", "POST", f"/api/content/{ctx.rng.choice(ctx.hot_content_ids)}/like",
+        headers={"Authorization": f"Bearer {token}"}
+    )
+
+
+async def view_storm(client: httpx.AsyncClient, recorder: Recorder, ctx: Context) -> None:
+    await recorder.request(client, "view", "POST", f"/api/content/{ctx.rng.choice(ctx.hot_content_ids)}/view")
+
+
+async def login_burst(client: httpx.AsyncClient, recorder: Recorder, ctx: Context) -> None:
+    email = SEED_EMAIL.format(ctx.rng.randrange(ctx.users))
+    await recorder.request(client, "login", "POST", "/api/auth/login", json={"email": email, "password": SEED_PASSWORD})
+
+
+WORKLOADS: Dict[str, Workload] = {
+    "feed_scroll": feed_scroll,
+    "trending": trending,
+    "prompt_search": prompt_search,
+    "like_storm": like_storm,
+    "view_storm": view_storm,
+    "login_burst": login_burst,
+}
+
+
+async def prepare(client: httpx.AsyncClient, ctx: Context, token_count: int) -> None:
+    """Pick hot content and sign in a pool of users for authenticated workloads"""
+    response = await client.get("/api/content/trending", params={"page_size": 10})
+    response.raise_for_status()
+    ctx.hot_content_ids = [item["id"] for item in response.json()["items"]]
+    if not ctx.hot_content_ids:
+        sys.exit("No content found: seed the database with `python -m benchmarks.seed` first")
+
+    for i in range(min(token_count, ctx.users)):
+        response = await client.post(
+            "/api/auth/login", json={"email": SEED_EMAIL.format(i), "password": SEED_PASSWORD}
+        )
+        if response.status_code == 200:
+            ctx.tokens.append(response.json()["access_token"])
+    if not ctx.tokens:
+        sys.exit("Could not sign in any seeded user; was the database seeded with benchmarks.seed?")
+
+
+async def run_workload(
+    base_url: str,
+    workload: Workload,
+    ctx: Context,
+    concurrency: int,
+    duration: float
+) -> Recorder:
+    """Run one workload with `concurrency` looping clients for `duration` seconds"""
+    recorder = Recorder()
+    deadline = time.perf_counter() + duration
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        async def worker():
+            while time.perf_counter() < deadline:
+                await workload(client, recorder, ctx)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return recorder
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(recorder: Recorder, duration: float) -> Dict[str, dict]:
+    summary = {}
+    for route, stats in sorted(recorder.routes.items()):
+        latencies = sorted(stats.latencies_ms)
+        summary[route] = {
+            "requests": len(latencies),
+            "throughput_rps": round(len(latencies) / duration, 2),
+            "errors": stats.errors,
+            "statuses": {str(code): count for code, count in sorted(stats.statuses.items())},
+            "mean_ms": round(statistics.fmean(latencies), 2),
+            "p50_ms": round(percentile(latencies, 50), 2),
+            "p95_ms": round(percentile(latencies, 95), 2),
+            "p99_ms": round(percentile(latencies, 99), 2),
+            "max_ms": round(latencies[-1], 2),
+        }
+    return summary
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: dict, baseline: dict, max_regression: float) -> bool:
+    """Print p95 deltas against a baseline; return False if any route regressed too far"""
+    ok = True
+    print(f"\nCompared with {baseline.get('commit') or 'baseline'} (p95, max regression {max_regression:.0f}%):")
+    for workload, routes in results["workloads"].items():
+        for route, current in routes.items():
+            previous = baseline.get("workloads", {}).get(workload, {}).get(route)
+            if not previous or not previous["p95_ms"]:
+                continue
+            change = (current["p95_ms"] - previous["p95_ms"]) / previous["p95_ms"] * 100
+            regressed = change > max_regression
+            ok = ok and not regressed
+            print(
+                f"  {'❌' if regressed else '  '} {workload:14} {route:14} "
+                f"{previous['p95_ms']:8.2f} -> {current['p95_ms']:8.2f} ms ({change:+.1f}%)"
+            )
+    return ok
+
+
+class ServerThread(threading.Thread):
+    """Runs app.main:app under uvicorn in a background thread"""
+
+    def __init__(self, host: str, port: int):
+        super().__init__(daemon=True)
+        import uvicorn
+
+        self.server = uvicorn.Server(uvicorn.Config("app.main:app", host=host, port=port, log_level="warning"))
+
+    def run(self):
+        self.server.run()
+
+    def __enter__(self):
+        self.start()
+        while not self.server.started:
+            if not self.is_alive():
+                sys.exit("Server failed to start")
+            time.sleep(0.05)
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.should_exit = True
+        self.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the API hot paths over HTTP")
+    parser.add_argument("--url", help="Target a running server instead of booting app.main:app")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workloads", default=",".join(WORKLOADS), help="Comma-separated subset to run")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=20, help="Seconds per workload")
+    parser.add_argument("--users", type=int, default=5000, help="Seeded users to draw logins from")
+    parser.add_argument("--tokens", type=int, default=200, help="Signed-in users for like_storm")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write results JSON here")
+    parser.add_argument("--compare", help="Baseline results JSON to compare against")
+    parser.add_argument("--max-regression", type=float, default=10.0, help="Allowed p95 increase in percent")
+    args = parser.parse_args()
+
+    names = [name.strip() for name in args.workloads.split(",") if name.strip()]
+    unknown = set(names) - set(WORKLOADS)
+    if unknown:
+        parser.error(f"Unknown workloads: {', '.join(sorted(unknown))}")
+
+    async def run_all(base_url: str) -> dict:
+        ctx = Context(users=args.users, rng=random.Random(args.seed))
+        async with httpx.AsyncClient(base_url=base_url, timeout=30) as client:
+            await prepare(client, ctx, args.tokens)
+
+        workloads = {}
+        for name in names:
+            recorder = await run_workload(base_url, WORKLOADS[name], ctx, args.concurrency, args.duration)
+            workloads[name] = summarize(recorder, args.duration)
+            for route, stats in workloads[name].items():
+                print(
+                    f"  {name:14} {route:14} {stats['throughput_rps']:8.1f} req/s  "
+                    f"p50 {stats['p50_ms']:7.2f}  p95 {stats['p95_ms']:7.2f}  p99 {stats['p99_ms']:7.2f} ms  "
+                    f"errors {stats['errors']}"
+                )
+        return workloads
+
+    print(f"⏱  concurrency={args.concurrency} duration={args.duration}s per workload")
+    if args.url:
+        workloads = asyncio.run(run_all(args.url))
+    else:
+        with ServerThread("127.0.0.1", args.port):
+            workloads = asyncio.run(run_all(f"http://127.0.0.1:{args.port}"))
+
+    results = {
+        "commit": git_commit(),
+        "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "python": platform.python_version(),
+        "config": {
+            "concurrency": args.concurrency, "duration": args.duration,
+            "seed": args.seed, "url": args.url or "in-process"
+        },
+        "workloads": workloads,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"💾 Saved results to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if not compare(results, baseline, args.max_regression):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+N+1 regression check for list endpoints
+
+Calls each list endpoint at the smallest and largest page size, anonymously
+and signed in, inside assert_max_queries() with the endpoint's statement
+budget. Related rows load with a fixed number of statements per request, so a
+relationship that starts loading per row blows the budget at the large page
+size. Exits non-zero, listing the offending SQL, if any budget is exceeded.
+
+Run from backend/ against a database with seed data loaded:
+    python -m benchmarks.query_budgets
+"""
+import asyncio
+import os
+import sys
+from typing import Dict, List, Tuple
+
+# Budgets count database statements, not response cache hits
+os.environ["CACHE_ENABLED"] = "False"
+
+import asyncpg
+import httpx
+
+from app.config import get_settings
+from app.main import app
+from app.utils.query_counter import assert_max_queries
+from app.utils.security import create_access_token
+
+settings = get_settings()
+
+# Signed-in callers of endpoints that annotate viewer state add the user lookup
+# and the liked/saved queries
+VIEWER_STATEMENTS = 3
+
+# (path, page size parameter, largest page size, anonymous budget, signed-in budget)
+BUDGETS = (
+    ("/api/prompts", "page_size", 100, 4, 4 + VIEWER_STATEMENTS),  # count, page, tag relations, tags
+    ("/api/prompts?fields=card", "page_size", 100, 2, 2 + VIEWER_STATEMENTS),
+    ("/api/content", "page_size", 100, 2, 2 + VIEWER_STATEMENTS),
+    ("/api/content?fields=card", "page_size", 100, 2, 2 + VIEWER_STATEMENTS),
+    ("/api/content/trending", "page_size", 100, 2, 2 + VIEWER_STATEMENTS),
+    ("/api/collections", "page_size", 100, 3, 3),  # count, page, cover thumbnails
+    ("/api/content/{content_id}/comments", "page_size", 100, 2, 2),
+    ("/api/collections/{collection_id}/items", "limit", 200, 4, 5),  # collection, items, content, prompts
+)
+
+
+async def sample_ids() -> Dict[str, str]:
+    """Pick real ids so every endpoint returns rows"""
+    conn = await asyncpg.connect(settings.DATABASE_URL.replace("+asyncpg", ""))
+    try:
+        row = await conn.fetchrow(
+            "SELECT "
+            "(SELECT id FROM users ORDER BY created_at LIMIT 1) AS user_id, "
+            "(SELECT content_id FROM comments GROUP BY content_id ORDER BY count(*) DESC LIMIT 1) AS content_id, "
+            "(SELECT collection_id FROM collection_items ci JOIN collections c ON c.id = ci.collection_id "
+            " WHERE c.is_public GROUP BY collection_id ORDER BY count(*) DESC LIMIT 1) AS collection_id"
+        )
+    finally:
+        await conn.close()
+    if row is None or None in row.values():
+        sys.exit("Need users, comments and public collection items: load seed data first")
+    return {key: str(value) for key, value in row.items()}
+
+
+async def check(client: httpx.AsyncClient, path: str, budget: int, headers: Dict[str, str]) -> Tuple[int, str]:
+    """Call path within budget; return (statements, failure message or "")"""
+    failure = ""
+    try:
+        with assert_max_queries(budget) as counter:
+            response = await client.get(path, headers=headers)
+    except AssertionError as exc:
+        failure = str(exc)
+    if response.status_code != 200:
+        sys.exit(f"{path} returned {response.status_code}: {response.text}")
+    return counter.count, failure
+
+
+async def run() -> List[str]:
+    ids = await sample_ids()
+    callers = (
+        ("anonymous", {}),
+        ("signed in", {"Authorization": f"Bearer {create_access_token({'sub': ids['user_id']})}"}),
+    )
+
+    failures: List[str] = []
+    # One event loop for every request, so pooled connections are reused; the
+    # lifespan isn't run, so no background service queries get counted
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://budgets") as client:
+        # The first connection runs the dialect's setup statements; keep them out of the counts
+        await client.get("/api/content?page_size=1")
+
+        for template, size_param, max_size, anonymous_budget, signed_in_budget in BUDGETS:
+            path = template.format(**ids)
+            separator = "&" if "?" in path else "?"
+            for caller, headers in callers:
+                budget = signed_in_budget if headers else anonymous_budget
+                for size in (1, max_size):
+                    url = f"{path}{separator}{size_param}={size}"
+                    count, failure = await check(client, url, budget, headers)
+                    print(f"  {'ok' if not failure else 'OVER':4} {count:>3}/{budget:<3} {caller:9} {url}")
+                    if failure:
+                        failures.append(f"{caller} {url}\n{failure}")
+    return failures
+
+
+def main():
+    failures = asyncio.run(run())
+    if failures:
+        print("\n❌ Query budgets exceeded:")
+        for failure in failures:
+            print(f"\n{failure}")
+        sys.exit(1)
+    print("\n✅ Every list endpoint stays within its query budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Query-plan regression check for list endpoints
+
+Calls each list endpoint against a seeded database, captures every SQL
+statement it issues, and runs EXPLAIN on each with sequential scans disabled.
+On a small development database the planner would pick sequential scans
+anyway, so with `enable_seqscan = off` any Seq Scan left in a plan means no
+index can serve that query shape. Exits non-zero if one appears.
+
+Run from backend/ against a database with schema.sql (or all migrations) and
+seed data loaded:
+    python -m benchmarks.query_plans
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+from typing import Any, Dict, Iterator, List, Tuple
+
+# Plans must reflect the database, not the response cache
+os.environ["CACHE_ENABLED"] = "False"
+
+import asyncpg
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.config import get_settings
+from app.database import engine
+from app.main import app
+
+settings = get_settings()
+
+# Small lookup tables that are legitimately read in full
+DEFAULT_ALLOWED_TABLES = ("prompt_categories",)
+
+
+async def sample_ids() -> Dict[str, str]:
+    """Pick real ids so filtered endpoints exercise their filters"""
+    conn = await asyncpg.connect(settings.DATABASE_URL.replace("+asyncpg", ""))
+    try:
+        row = await conn.fetchrow(
+            "SELECT c.id AS content_id, c.user_id, "
+            "(SELECT id FROM prompt_categories ORDER BY display_order LIMIT 1) AS category_id "
+            "FROM content c WHERE c.is_public AND c.user_id IS NOT NULL LIMIT 1"
+        )
+    finally:
+        await conn.close()
+    if row is None:
+        sys.exit("No public content found: load seed data first")
+    return {key: str(value) for key, value in row.items()}
+
+
+def endpoints(ids: Dict[str, str]) -> List[str]:
+    return [
+        "/api/prompts",
+        "/api/prompts?type=image",
+        f"/api/prompts?category_id={ids['category_id']}",
+        "/api/prompts?search=portrait",
+        "/api/prompts?fields=card",
+        "/api/content",
+        "/api/content?type=video",
+        f"/api/content?user_id={ids['user_id']}",
+        "/api/content?fields=card",
+        "/api/content/trending",
+        "/api/collections",
+        f"/api/collections?user_id={ids['user_id']}",
+        f"/api/content/{ids['content_id']}/comments",
+    ]
+
+
+def capture_statements(paths: List[str]) -> List[Tuple[str, str, Tuple[Any, ...]]]:
+    """Call each endpoint and record (path, sql, parameters) for every statement"""
+    captured = []
+    current = {"path": None}
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        captured.append((current["path"], statement, tuple(parameters or ())))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", on_execute)
+    try:
+        client = TestClient(app)
+        for path in paths:
+            current["path"] = path
+            response = client.get(path)
+            if response.status_code != 200:
+                sys.exit(f"{path} returned {response.status_code}: {response.text}")
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", on_execute)
+    return captured
+
+
+def seq_scans(plan: Dict[str, Any]) -> Iterator[str]:
+    """Yield the relation of every Seq Scan node in a JSON plan"""
+    if plan.get("Node Type") == "Seq Scan":
+        yield plan.get("Relation Name", "?")
+    for child in plan.get("Plans", ()):
+        yield from seq_scans(child)
+
+
+async def explain_all(statements, allowed_tables) -> List[str]:
+    conn = await asyncpg.connect(settings.DATABASE_URL.replace("+asyncpg", ""))
+    failures = []
+    try:
+        await conn.execute("SET enable_seqscan = off")
+        seen = set()
+        for path, statement, parameters in statements:
+            if statement in seen:
+                continue
+            seen.add(statement)
+            result = await conn.fetchval(f"EXPLAIN (FORMAT JSON) {statement}", *parameters)
+            plan = json.loads(result)[0]["Plan"]
+            tables = sorted(set(seq_scans(plan)) - set(allowed_tables))
+            status = "SEQ SCAN on " + ", ".join(tables) if tables else "ok"
+            print(f"  {status:40} {path}\n      {' '.join(statement.split())[:160]}")
+            if tables:
+                failures.append(f"{path}: {', '.join(tables)}")
+    finally:
+        await conn.close()
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fail if a list endpoint's SQL needs a sequential scan")
+    parser.add_argument(
+        "--allow", action="append", default=list(DEFAULT_ALLOWED_TABLES),
+        help="Table that may be sequentially scanned (repeatable)"
+    )
+    args = parser.parse_args()
+
+    paths = endpoints(asyncio.run(sample_ids()))
+    statements = capture_statements(paths)
+    print(f"Explaining {len(statements)} statements from {len(paths)} endpoints")
+    failures = asyncio.run(explain_all(statements, args.allow))
+
+    if failures:
+        print("\n❌ Sequential scans found:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("\n✅ Every list query is served by an index")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Worker scaling benchmark for the production server
+
+Starts gunicorn with gunicorn.conf.py at 1, 2, 4, ... workers (up to the CPU
+count), waits until every worker reports ready, drives the same request from
+several client processes and reports throughput, speedup over one worker and
+scaling efficiency (speedup / workers; 1.0 is linear).
+
+The load generator runs on the same host, so keep some cores free for it
+(e.g. --max-workers 8 on a 12-core machine) or the numbers flatten early.
+Run from backend/ against a database seeded with benchmarks.seed:
+
+    python -m benchmarks.scaling --path "/api/content?page_size=20" --min-efficiency 0.8
+
+--min-efficiency exits non-zero if the largest worker count scales worse.
+The response cache is disabled for the servers so every request does real work.
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+import httpx
+
+from .load import percentile
+
+
+def worker_counts(max_workers: int) -> List[int]:
+    counts, n = [], 1
+    while n < max_workers:
+        counts.append(n)
+        n *= 2
+    return counts + [max_workers]
+
+
+def start_server(workers: int, port: int) -> subprocess.Popen:
+    env = {**os.environ, "CACHE_ENABLED": "False", "DEBUG": "False"}
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py",
+            "--workers", str(workers), "--bind", f"127.0.0.1:{port}", "--log-level", "warning"
+        ],
+        env=env
+    )
+
+
+def wait_until_ready(base_url: str, ready_path: str, workers: int, timeout: float = 60) -> None:
+    """Poll readiness until it has succeeded several times per worker (each probe may hit a different one)"""
+    deadline = time.monotonic() + timeout
+    ready = 0
+    with httpx.Client(base_url=base_url, timeout=5) as client:
+        while ready < workers * 3:
+            if time.monotonic() > deadline:
+                sys.exit(f"Server with {workers} workers did not become ready")
+            try:
+                ready = ready + 1 if client.get(ready_path).status_code == 200 else 0
+            except httpx.HTTPError:
+                ready = 0
+            time.sleep(0.05)
+
+
+def client_process(args: Tuple[str, str, int, float]) -> Tuple[int, int, List[float]]:
+    """Send requests from one process for `duration` seconds; return (ok, errors, latencies_ms)"""
+    base_url, path, connections, duration = args
+
+    async def run():
+        ok, errors, latencies = 0, 0, []
+        deadline = time.perf_counter() + duration
+        limits = httpx.Limits(max_connections=connections, max_keepalive_connections=connections)
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+            async def worker():
+                nonlocal ok, errors
+                while time.perf_counter() < deadline:
+                    started = time.perf_counter()
+                    try:
+                        response = await client.get(path)
+                        success = response.status_code == 200
+                    except httpx.HTTPError:
+                        success = False
+                    latencies.append((time.perf_counter() - started) * 1000)
+                    if success:
+                        ok += 1
+                    else:
+                        errors += 1
+
+            await asyncio.gather(*(worker() for _ in range(connections)))
+        return ok, errors, latencies
+
+    return asyncio.run(run())
+
+
+def drive(base_url: str, path: str, clients: int, connections: int, duration: float):
+    with multiprocessing.Pool(clients) as pool:
+        results = pool.map(client_process, [(base_url, path, connections, duration)] * clients)
+    ok = sum(result[0] for result in results)
+    errors = sum(result[1] for result in results)
+    latencies = sorted(latency for result in results for latency in result[2])
+    return ok / duration, errors, latencies
+
+
+def main():
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="Measure throughput scaling across gunicorn worker counts")
+    parser.add_argument("--path", default="/api/content/trending?page_size=20")
+    parser.add_argument("--max-workers", type=int, default=cpus)
+    parser.add_argument("--clients", type=int, default=max(1, cpus // 4), help="Load generator processes")
+    parser.add_argument("--connections", type=int, default=64, help="Connections per client process")
+    parser.add_argument("--duration", type=float, default=15)
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--ready-path", default="/health/ready", help="Probe that must pass before measuring")
+    parser.add_argument("--min-efficiency", type=float, help="Fail below this efficiency at --max-workers")
+    args = parser.parse_args()
+
+    base_url = f"http://127.0.0.1:{args.port}"
+    print(f"{args.path}  cpus={cpus} clients={args.clients}x{args.connections} duration={args.duration}s")
+    print(f"  {'workers':>7} {'req/s':>9} {'speedup':>8} {'efficiency':>10} {'p50 ms':>8} {'p99 ms':>8} {'errors':>6}")
+
+    baseline = efficiency = None
+    for workers in worker_counts(args.max_workers):
+        server = start_server(workers, args.port)
+        try:
+            wait_until_ready(base_url, args.ready_path, workers)
+            drive(base_url, args.path, args.clients, args.connections, 2)  # warm every worker
+            rps, errors, latencies = drive(base_url, args.path, args.clients, args.connections, args.duration)
+        finally:
+            server.terminate()
+            server.wait()
+
+        baseline = baseline or rps
+        speedup = rps / baseline
+        efficiency = speedup / workers
+        print(
+            f"  {workers:>7} {rps:>9.1f} {speedup:>7.2f}x {efficiency:>10.2f} "
+            f"{percentile(latencies, 50):>8.2f} {percentile(latencies, 99):>8.2f} {errors:>6}"
+        )
+
+    if args.min_efficiency is not None and efficiency < args.min_efficiency:
+        print(f"\n❌ Efficiency {efficiency:.2f} at {args.max_workers} workers is below {args.min_efficiency:.2f}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
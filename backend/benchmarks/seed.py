@@ -0,0 +1,657 @@
+#!/usr/bin/env python3
+"""
+Synthetic large-scale seed data for load and benchmark environments
+
+Generates every table in app/models with production-like skew: a handful of
+mega-creators author most content, popularity (views, likes, comments,
+followers) follows a Zipf distribution, comment threads nest several levels
+deep, and content_views dominates the row count. Rows are streamed into
+PostgreSQL with binary COPY from a pool of worker processes.
+
+Output depends only on --seed and the sizes: every chunk draws from its own
+RNG seeded with (seed, table, chunk start) and ids are derived from row
+indexes, so runs are repeatable regardless of worker count or scheduling.
+Denormalized counters (view/like/comment/follower counts, item counts,
+trending tables) are recomputed from the generated rows at the end.
+
+Run from backend/ against a database created from db/schema.sql:
+    python -m benchmarks.seed --scale small --truncate
+    python -m benchmarks.seed --scale large --workers 16 --seed 7
+    python -m benchmarks.seed --scale large --dry-run      # generate only, no database
+"""
+import argparse
+import asyncio
+import ipaddress
+import json
+import os
+import random
+import time
+import uuid
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import accumulate
+from typing import Callable, Dict, Iterator, List, NamedTuple, Sequence, Tuple
+
+# Row counts per preset; "large" is the production-scale target
+SCALES = {
+    "small": dict(
+        users=5_000, prompts=20_000, content=20_000, views=200_000, comments=50_000,
+        content_likes=100_000, prompt_likes=50_000, follows=50_000, collections=2_000
+    ),
+    "medium": dict(
+        users=50_000, prompts=200_000, content=100_000, views=2_000_000, comments=400_000,
+        content_likes=1_000_000, prompt_likes=500_000, follows=500_000, collections=20_000
+    ),
+    "large": dict(
+        users=200_000, prompts=1_000_000, content=500_000, views=10_000_000, comments=2_000_000,
+        content_likes=5_000_000, prompt_likes=3_000_000, follows=2_000_000, collections=100_000
+    ),
+}
+
+# All generated timestamps fall in the year before this instant
+EPOCH_END = datetime(2026, 1, 1)
+EPOCH_SPAN_SECONDS = 365 * 24 * 3600
+
+# bcrypt of "password123" with a fixed salt, so user rows are deterministic too
+PASSWORD_HASH = "$2b$10$viralpromptseedsaltxxuUNi46HAOOec/27lgxwCXvYiI7bkvRjO"
+
+# Rows (or parent entities) per COPY chunk
+CHUNK_ROWS = 50_000
+
+# Spacing between collection item display_order values (routers.collections.ORDER_GAP)
+ORDER_GAP = 1024
+
+MAX_COMMENT_DEPTH = 8
+
+CATEGORIES = [
+    (1, "Image", "image", "Prompts for AI image generation (Midjourney, DALL-E, Stable Diffusion)", "bi-image", "#4facfe"),
+    (2, "Video", "video", "Prompts for AI video generation (Sora, Runway, Pika)", "bi-camera-video", "#ec4899"),
+    (3, "Music", "music", "Prompts for AI music generation (Suno, Udio)", "bi-music-note-beamed", "#22c55e"),
+    (4, "Caption", "caption", "Social media captions and hooks", "bi-chat-quote", "#fbbf24"),
+    (5, "Script", "script", "Video scripts and storytelling prompts", "bi-file-earmark-text", "#a78bfa"),
+    (6, "AI Art", "ai-art", "Artistic and creative AI prompts", "bi-stars", "#f472b6"),
+]
+CATEGORY_PROMPT_TYPES = {1: "image", 2: "video", 3: "music", 4: "caption", 5: "script", 6: "image"}
+
+TAG_WORDS = [
+    "portrait", "cinematic", "landscape", "fantasy", "aesthetic", "viral", "lofi", "trending",
+    "hooks", "nature", "cyberpunk", "anime", "realistic", "abstract", "documentary", "product",
+    "commercial", "motivation", "chill", "dreamy",
+]
+TAG_COUNT = 200
+
+CONTENT_TYPES = ["image", "video", "reel", "music", "ai_art"]
+AI_MODELS = ["midjourney-v6", "dall-e-3", "sdxl", "sora", "runway-gen3", "suno-v3", "udio"]
+USER_AGENTS = [
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 17_4 like Mac OS X) AppleWebKit/605.1.15 Mobile/15E148",
+    "Mozilla/5.0 (Linux; Android 14; Pixel 8) AppleWebKit/537.36 Chrome/124.0 Mobile Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/124.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_4) AppleWebKit/605.1.15 Version/17.4 Safari/605.1.15",
+]
+ADJECTIVES = [
+    "golden", "neon", "misty", "vivid", "silent", "electric", "velvet", "cosmic", "urban", "frozen",
+    "ancient", "dreamy", "bold", "soft", "wild", "hidden", "lucid", "radiant", "moody", "epic",
+]
+NOUNS = [
+    "portrait", "city", "forest", "ocean", "skyline", "desert", "garden", "robot", "dragon", "street",
+    "mountain", "studio", "galaxy", "river", "castle", "market", "temple", "harbor", "canyon", "meadow",
+]
+STYLES = [
+    "cinematic lighting", "85mm lens", "shallow depth of field", "volumetric fog", "golden hour",
+    "ultra detailed", "film grain", "isometric", "watercolor", "octane render", "soft pastel palette",
+    "high contrast", "anamorphic flare", "studio lighting", "wide angle", "macro shot",
+]
+
+
+@dataclass(frozen=True)
+class SeedConfig:
+    """Sizes, seed and connection for one generation run (picklable for workers)"""
+    seed: int
+    users: int
+    prompts: int
+    content: int
+    views: int
+    comments: int
+    content_likes: int
+    prompt_likes: int
+    follows: int
+    collections: int
+    dsn: str = ""
+    dry_run: bool = False
+
+    @property
+    def creators(self) -> int:
+        """Mega-creators at the head of the user popularity ranking"""
+        return max(10, self.users // 1000)
+
+    @property
+    def generation_jobs(self) -> int:
+        return self.users // 2
+
+    @property
+    def notifications(self) -> int:
+        return self.users * 2
+
+
+# ============================================
+# DISTRIBUTIONS AND IDS
+# ============================================
+
+GOLDEN = 0x9E3779B97F4A7C15
+MASK64 = (1 << 64) - 1
+ID_NAMESPACES = {
+    "users": 1, "prompts": 2, "content": 3, "comments": 4, "collections": 5,
+    "collection_items": 6, "content_views": 7, "generation_jobs": 8,
+    "credit_transactions": 9, "user_analytics": 10, "notifications": 11,
+}
+
+
+def make_id(seed: int, table: str, index: int) -> uuid.UUID:
+    """Deterministic, well-scattered UUID for row `index` of `table`"""
+    return uuid.UUID(int=((seed & 0xFFFF) << 112) | (ID_NAMESPACES[table] << 64) | ((index + 1) * GOLDEN & MASK64))
+
+
+@lru_cache(maxsize=None)
+def harmonic(n: int, s: float) -> float:
+    return sum(1 / k ** s for k in range(1, n + 1))
+
+
+@lru_cache(maxsize=None)
+def zipf_cum_weights(n: int, s: float) -> List[float]:
+    """Cumulative Zipf weights over ranks 0..n-1, for rng.choices / bisect"""
+    return list(accumulate(1 / k ** s for k in range(1, n + 1)))
+
+
+def zipf_index(rng: random.Random, n: int, s: float) -> int:
+    """Draw a rank in [0, n) where rank 0 is the most popular"""
+    weights = zipf_cum_weights(n, s)
+    return min(bisect_left(weights, rng.random() * weights[-1]), n - 1)
+
+
+def zipf_share(rng: random.Random, total: int, n: int, rank: int, s: float) -> int:
+    """Rank's share of `total` events under Zipf(s), randomly rounded"""
+    expected = total / harmonic(n, s) / (rank + 1) ** s
+    whole = int(expected)
+    return whole + (1 if rng.random() < expected - whole else 0)
+
+
+def random_time(rng: random.Random, after: datetime = None) -> datetime:
+    """Timestamp in the generated year, optionally no earlier than `after`"""
+    start = after or EPOCH_END - timedelta(seconds=EPOCH_SPAN_SECONDS)
+    span = max((EPOCH_END - start).total_seconds(), 1)
+    return start + timedelta(seconds=rng.random() * span)
+
+
+def words(rng: random.Random, count: int) -> str:
+    return " ".join(rng.choice(ADJECTIVES) + " " + rng.choice(NOUNS) for _ in range(count))
+
+
+def title(rng: random.Random) -> str:
+    return f"{rng.choice(ADJECTIVES).title()} {rng.choice(NOUNS).title()} {rng.choice(STYLES).title()}"
+
+
+def prompt_text(rng: random.Random) -> str:
+    styles = ", ".join(rng.sample(STYLES, rng.randint(3, 7)))
+    return f"A {words(rng, rng.randint(2, 6))}, {styles}, --ar {rng.choice(['16:9', '9:16', '1:1', '4:5'])}"
+
+
+# ============================================
+# TABLE GENERATORS
+# ============================================
+# Each generator yields COPY records for parent entities [start, stop)
+
+
+def gen_users(cfg: SeedConfig, rng: random.Random, start: int, stop: int) -> Iterator[tuple]:
+    for i in range(start, stop):
+        created = random_time(rng)
+        creator = i < cfg.creators
+        yield (
+            make_id(cfg.seed, "users", i), f"user{i}@example.com",
+            f"{rng.choice(ADJECTIVES)}_{rng.choice(NOUNS)}_{i}", PASSWORD_HASH,
+            f"{rng.choice(ADJECTIVES).title()} {rng.choice(NOUNS).title()}",
+            f"Creating {words(rng, 2)} every day" if rng.random() < 0.6 else None,
+            f"https://cdn.example.com/avatars/{i % 5000}.jpg" if rng.random() < 0.8 else None,
+            creator or rng.random() < 0.01, creator or rng.random() < 0.05,
+            rng.randint(0, 500), "creator" if creator or rng.random() < 0.1 else "user",
+            created if rng.random() < 0.9 else None, random_time(rng, created), created, created
+        )
+
+
+def gen_user_settings(cfg: SeedConfig, rng: random.Random, start: int, stop: int) -> Iterator[tuple]:
+    for i in range(start, stop):
+        yield (
+            make_id(cfg.seed, "users", i), rng.random() < 0.8, rng.random() < 0.6,
+            rng.random() < 0.5, rng.random() < 0.9, rng.random() < 0.05,
+            rng.choice(["dark", "dark", "light"]), rng.choice(["en", "en", "en", "es", "pt", "hi"]),
+            random_time(rng)
+        )
+
+
+def gen_user_followers(cfg: SeedConfig, rng: random.Random, start: int, stop: int) -> Iterator[tuple]:
+    for followed in range(start, stop):
+        count = min(zipf_share(rng, cfg.follows, cfg.users, followed, 1.05), cfg.users - 1)
+        following_id = make_id(cfg.seed, "users", followed)
+        for follower in rng.sample(range(cfg.users), min(count + 1, cfg.users)):
+            if follower != followed and count > 0:
+                count -= 1
+                yield make_id(cfg.seed, "users", follower), following_id, random_time(rng)
+
+
+def gen_prompts(cfg: SeedConfig, rng: random.Random, start: int, stop: int) -> Iterator[tuple]:
+    for i in range(start, stop):
+        created = random_time(rng)
+        category_id = zipf_index(rng, len(CATEGORIES), 0.8) + 1
+        yield (
+            make_id(cfg.seed, "prompts", i), make_id(cfg.seed, "users", zipf_index(rng, cfg.users, 1.1)),
+            category_id, title(rng), prompt_text(rng),
+            f"Great for {words(rng, 1)} shots" if rng.random() < 0.5 else None,
+            CATEGORY_PROMPT_TYPES[category_id],
+            f"https://cdn.example.com/previews/{i % 20000}.jpg" if rng.random() < 0.7 else None,
+            rng.random() < 0.01, rng.random() < 0.95,
+            zipf_share(rng, cfg.prompts * 20, cfg.prompts, i, 1.0), created, created
+        )
+
+
+def gen_prompt_tag_relations(cfg: SeedConfig, rng: random.Random, start: int, stop: int) -> Iterator[tuple]:
+    for i in range(start, stop):
+        prompt_id = make_id(cfg.seed, "prompts", i)
+        for tag_id in {zipf_index(rng, TAG_COUNT, 1.0) + 1 for _ in range(rng.randint(1, 4))}:
+            yield prompt_id, tag_id
+
+
+def gen_prompt_likes(cfg: SeedConfig, rng: random.Random, start: int, stop: int) -> Iterator[tuple]:
+    for i in range(start, stop):
+        count = min(zipf_share(rng, cfg.prompt_likes, cfg.prompts, i, 1.0), cfg.users)
+        prompt_id = make_id(cfg.seed, "prompts", i)
+        for user in rng.sample(range(cfg.users), count):
+            yield make_id(cfg.seed, "users", user), prompt_id, random_time(rng)
+
+
+def gen_prompt_saves(cfg: SeedConfig, rng: random.Random, start: int, stop: int) -> Iterator[tuple]:
+    for i in range(start, stop):
+        count = min(zipf_share(rng, cfg.prompt_likes // 4, cfg.prompts, i, 1.0), cfg.users)
+        prompt_id = make_id(cfg.seed, "prompts", i)
+        for user in rng.sample(range(cfg.users), count):
+            yield make_id(cfg.seed, "users", user), prompt_id, None, random_time(rng)
+
+
+def gen_content(cfg: SeedConfig, rng: random.Random, start: int, stop: int) -> Iterator[tuple]:
+    for i in range(start, stop):
+        created = random_time(rng)
+        content_type = rng.choice(CONTENT_TYPES)
+        timed = content_type in ("video", "reel", "music")
+        ai_generated = rng.random() < 0.7
+        portrait = content_type == "reel" or rng.random() < 0.3
+        settings = {"seed": rng.randint(0, 2 ** 31), "steps": rng.choice([20, 30, 50]), "style": rng.choice(STYLES)}
+        yield (
+            make_id(cfg.seed, "content", i), make_id(cfg.seed, "users", zipf_index(rng, cfg.users, 1.2)),
+            make_id(cfg.seed, "prompts", rng.randrange(cfg.prompts)) if rng.random() < 0.4 else None,
+            title(rng), f"{words(rng, rng.randint(3, 12))}" if rng.random() < 0.7 else None, content_type,
+            f"https://cdn.example.com/media/{i}.{'mp4' if timed else 'jpg'}",
+            f"https://cdn.example.com/thumbs/{i % 50000}.jpg",
+            rng.randint(5, 180) if timed else None,
+            1080 if portrait else 1920, 1920 if portrait else 1080, rng.randint(100_000, 80_000_000),
+            ai_generated, rng.choice(AI_MODELS) if ai_generated else None,
+            json.dumps(settings) if ai_generated else None,
+            rng.random() < 0.95, rng.random() < 0.01,
+            zipf_share(rng, cfg.content * 5, cfg.content, i, 1.0), created, created
+        )
+
+
+def gen_content_tags(cfg: SeedConfig, rng: random.Random, start: int, stop: int) -> Iterator[tuple]:
+    for i in range(start, stop):
+        content_id = make_id(cfg.seed, "content", i)
+        for tag_id in {zipf_index(rng, TAG_COUNT, 1.0) + 1 for _ in range(rng.randint(0, 3))}:
+            yield content_id, tag_id
+
+
+def gen_content_likes(cfg: SeedConfig, rng: random.Random, start: int, stop: int) -> Iterator[tuple]:
+    for i in range(start, stop):
+        count = min(zipf_share(rng, cfg.content_likes, cfg.content, i, 1.0), cfg.users)
+        content_id = make_id(cfg.seed, "content", i)
+        for user in rng.sample(range(cfg.users), count):
+            yield make_id(cfg.seed, "users", user), content_id, random_time(rng)
+
+
+def gen_content_views(cfg: SeedConfig, rng: random.Random, start: int, stop: int) -> Iterator[tuple]:
+    for i in range(start, stop):
+        signed_in = rng.random() < 0.4
+        yield (
+            make_id(cfg.seed, "content_views", i),
+            make_id(cfg.seed, "content", zipf_index(rng, cfg.content, 1.0)),
+            make_id(cfg.seed, "users", rng.randrange(cfg.users)) if signed_in else None,
+            ipaddress.IPv4Address(rng.getrandbits(32)), rng.choice(USER_AGENTS),
+            int(rng.expovariate(1 / 20)), random_time(rng)
+        )
+
+
+def gen_comments(cfg: SeedConfig, rng: random.Random, start: int, stop: int) -> Iterator[tuple]:
+    for i in range(start, stop):
+        count = min(zipf_share(rng, cfg.comments, cfg.content, i, 1.0), (1 << 24) - 1)
+        content_id = make_id(cfg.seed, "content", i)
+        created = random_time(rng)
+        thread: List[Tuple[uuid.UUID, uuid.UUID, str, int]] = []  # (id, root_id, path, depth)
+        for k in range(count):
+            comment_id = make_id(cfg.seed, "comments", (i << 24) | k)
+            created += timedelta(seconds=rng.expovariate(1 / 600))
+            micros = (created - datetime(1970, 1, 1)) // timedelta(microseconds=1)
+            # Same layout as models.content.comment_path_segment; generated ids share
+            # their high bits, so the tie-breaker comes from the scrambled low bits
+            segment = f"{micros:014x}{comment_id.hex[-6:]}"
+
+            # Replies favour recent comments, which builds deep back-and-forth threads
+            parent = thread[rng.randrange(max(0, len(thread) - 8), len(thread))] if thread and rng.random() < 0.6 else None
+            if parent is not None and parent[3] < MAX_COMMENT_DEPTH:
+                parent_id, root_id, path, depth = parent[0], parent[1], f"{parent[2]}.{segment}", parent[3] + 1
+            else:
+                parent_id, root_id, path, depth = None, comment_id, segment, 0
+            thread.append((comment_id, root_id, path, depth))
+
+            yield (
+                comment_id, content_id, make_id(cfg.seed, "users", rng.randrange(cfg.users)),
+                parent_id, root_id, path, depth, f"{rng.choice(['Love', 'Wow', 'Nice', 'How'])} {words(rng, 2)}",
+                int(rng.paretovariate(1.5)) - 1, rng.random() < 0.03, created, created
+            )
+
+
+def gen_collections(cfg: SeedConfig, rng: random.Random, start: int, stop: int) -> Iterator[tuple]:
+    for i in range(start, stop):
+        created = random_time(rng)
+        yield (
+            make_id(cfg.seed, "collections", i), make_id(cfg.seed, "users", rng.randrange(cfg.users)),
+            f"{rng.choice(ADJECTIVES).title()} {rng.choice(NOUNS)}s", None,
+            rng.random() < 0.85, rng.random() < 0.01, created, created
+        )
+
+
+def gen_collection_items(cfg: SeedConfig, rng: random.Random, start: int, stop: int) -> Iterator[tuple]:
+    for i in range(start, stop):
+        collection_id = make_id(cfg.seed, "collections", i)
+        added = random_time(rng)
+        for k in range(min(int(rng.paretovariate(1.2) * 3), 500)):
+            added += timedelta(seconds=rng.expovariate(1 / 86400))
+            is_content = rng.random() < 0.6
+            yield (
+                make_id(cfg.seed, "collection_items", (i << 16) | k), collection_id,
+                make_id(cfg.seed, "content", zipf_index(rng, cfg.content, 1.0)) if is_content else None,
+                None if is_content else make_id(cfg.seed, "prompts", zipf_index(rng, cfg.prompts, 1.0)),
+                (k + 1) * ORDER_GAP, added
+            )
+
+
+def gen_generation_jobs(cfg: SeedConfig, rng: random.Random, start: int, stop: int) -> Iterator[tuple]:
+    for i in range(start, stop):
+        created = random_time(rng)
+        status = rng.choices(["completed", "failed", "processing", "pending"], weights=[85, 5, 5, 5])[0]
+        finished = created + timedelta(seconds=rng.randint(5, 600))
+        yield (
+            make_id(cfg.seed, "generation_jobs", i), make_id(cfg.seed, "users", zipf_index(rng, cfg.users, 1.0)),
+            rng.choice(["image", "video", "music", "caption", "script"]), prompt_text(rng),
+            json.dumps({"quality": rng.choice(["standard", "hd"])}), status,
+            100 if status == "completed" else rng.randint(0, 99),
+            make_id(cfg.seed, "content", rng.randrange(cfg.content)) if status == "completed" and rng.random() < 0.3 else None,
+            rng.choice([1, 2, 5, 10]), "Generation timed out" if status == "failed" else None,
+            None if status == "pending" else created, finished if status in ("completed", "failed") else None, created
+        )
+
+
+def gen_credit_transactions(cfg: SeedConfig, rng: random.Random, start: int, stop: int) -> Iterator[tuple]:
+    for i in range(start, stop):
+        credits = rng.choice([1, 2, 5, 10])
+        yield (
+            make_id(cfg.seed, "credit_transactions", i), make_id(cfg.seed, "users", rng.randrange(cfg.users)),
+            -credits, "usage", "AI generation", make_id(cfg.seed, "generation_jobs", i),
+            rng.randint(0, 500), random_time(rng)
+        )
+
+
+def gen_user_analytics(cfg: SeedConfig, rng: random.Random, start: int, stop: int) -> Iterator[tuple]:
+    last_day = EPOCH_END.date() - timedelta(days=1)
+    for user in range(start, stop):
+        scale = cfg.views / cfg.users * 30 / (user + 1) ** 0.8
+        for day in range(30):
+            views = int(scale * rng.uniform(0.5, 1.5))
+            yield (
+                make_id(cfg.seed, "user_analytics", user * 30 + day), make_id(cfg.seed, "users", user),
+                last_day - timedelta(days=day), views, views // 12, views // 80, views // 150,
+                int(rng.expovariate(1 / max(scale / 50, 1))), views // 5
+            )
+
+
+def gen_notifications(cfg: SeedConfig, rng: random.Random, start: int, stop: int) -> Iterator[tuple]:
+    for i in range(start, stop):
+        kind = rng.choice(["like", "comment", "follow", "generation_complete"])
+        yield (
+            make_id(cfg.seed, "notifications", i), make_id(cfg.seed, "users", zipf_index(rng, cfg.users, 1.0)),
+            kind, f"New {kind.replace('_', ' ')}", None,
+            json.dumps({"actor": f"user{rng.randrange(cfg.users)}"}), rng.random() < 0.7, random_time(rng)
+        )
+
+
+class TableSpec(NamedTuple):
+    """How to generate one table: stage, parent entity count and COPY columns"""
+    stage: int
+    entities: Callable[[SeedConfig], int]
+    rows_per_entity: float  # rough, only used to size chunks
+    generate: Callable[[SeedConfig, random.Random, int, int], Iterator[tuple]]
+    columns: Sequence[str]
+
+
+TABLES: Dict[str, TableSpec] = {
+    "users": TableSpec(1, lambda c: c.users, 1, gen_users, (
+        "id", "email", "username", "password_hash", "display_name", "bio", "avatar_url",
+        "is_verified", "is_premium", "credits_balance", "role", "email_verified_at",
+        "last_login_at", "created_at", "updated_at")),
+    "user_settings": TableSpec(2, lambda c: c.users, 1, gen_user_settings, (
+        "user_id", "email_notifications", "push_notifications", "weekly_digest",
+        "show_activity_status", "private_profile", "theme", "language", "updated_at")),
+    "user_followers": TableSpec(2, lambda c: c.users, 10, gen_user_followers, (
+        "follower_id", "following_id", "created_at")),
+    "prompts": TableSpec(2, lambda c: c.prompts, 1, gen_prompts, (
+        "id", "user_id", "category_id", "title", "prompt_text", "description", "type",
+        "preview_image_url", "is_featured", "is_public", "use_count", "created_at", "updated_at")),
+    "prompt_tag_relations": TableSpec(3, lambda c: c.prompts, 2, gen_prompt_tag_relations, (
+        "prompt_id", "tag_id")),
+    "prompt_likes": TableSpec(3, lambda c: c.prompts, 3, gen_prompt_likes, (
+        "user_id", "prompt_id", "created_at")),
+    "prompt_saves": TableSpec(3, lambda c: c.prompts, 1, gen_prompt_saves, (
+        "user_id", "prompt_id", "collection_id", "created_at")),
+    "content": TableSpec(3, lambda c: c.content, 1, gen_content, (
+        "id", "user_id", "prompt_id", "title", "description", "type", "media_url", "thumbnail_url",
+        "duration_seconds", "width", "height", "file_size_bytes", "is_ai_generated", "ai_model",
+        "generation_settings", "is_public", "is_featured", "share_count", "created_at", "updated_at")),
+    "content_tags": TableSpec(4, lambda c: c.content, 1.5, gen_content_tags, ("content_id", "tag_id")),
+    "content_likes": TableSpec(4, lambda c: c.content, 10, gen_content_likes, (
+        "user_id", "content_id", "created_at")),
+    "content_views": TableSpec(4, lambda c: c.views, 1, gen_content_views, (
+        "id", "content_id", "user_id", "ip_address", "user_agent", "watch_duration_seconds", "created_at")),
+    "comments": TableSpec(4, lambda c: c.content, 4, gen_comments, (
+        "id", "content_id", "user_id", "parent_id", "root_id", "path", "depth", "body",
+        "like_count", "is_edited", "created_at", "updated_at")),
+    "collections": TableSpec(4, lambda c: c.collections, 1, gen_collections, (
+        "id", "user_id", "name", "description", "is_public", "is_featured", "created_at", "updated_at")),
+    "generation_jobs": TableSpec(4, lambda c: c.generation_jobs, 1, gen_generation_jobs, (
+        "id", "user_id", "type", "prompt_text", "settings", "status", "progress_percent",
+        "result_content_id", "credits_used", "error_message", "started_at", "completed_at", "created_at")),
+    "user_analytics": TableSpec(4, lambda c: c.creators, 30, gen_user_analytics, (
+        "id", "user_id", "date", "views", "likes", "shares", "comments", "new_followers", "profile_views")),
+    "notifications": TableSpec(4, lambda c: c.notifications, 1, gen_notifications, (
+        "id", "user_id", "type", "title", "body", "data", "is_read", "created_at")),
+    "collection_items": TableSpec(5, lambda c: c.collections, 10, gen_collection_items, (
+        "id", "collection_id", "content_id", "prompt_id", "display_order", "added_at")),
+    "credit_transactions": TableSpec(5, lambda c: c.generation_jobs, 1, gen_credit_transactions, (
+        "id", "user_id", "amount", "type", "description", "job_id", "balance_after", "created_at")),
+}
+
+
+# ============================================
+# LOADING
+# ============================================
+
+
+def connect(dsn: str):
+    import asyncpg  # imported lazily so --dry-run works without a database driver
+    return asyncpg.connect(dsn)
+
+
+def run_chunk(table: str, start: int, stop: int, cfg: SeedConfig) -> Tuple[str, int]:
+    """Worker entry point: generate one chunk and COPY it in"""
+    spec = TABLES[table]
+    rng = random.Random(f"{cfg.seed}:{table}:{start}")
+    records = list(spec.generate(cfg, rng, start, stop))
+
+    if not cfg.dry_run and records:
+        async def copy():
+            conn = await connect(cfg.dsn)
+            try:
+                await conn.copy_records_to_table(table, records=records, columns=list(spec.columns))
+            finally:
+                await conn.close()
+
+        asyncio.run(copy())
+    return table, len(records)
+
+
+def chunks(cfg: SeedConfig, table: str) -> Iterator[Tuple[int, int]]:
+    spec = TABLES[table]
+    total = spec.entities(cfg)
+    step = max(1, int(CHUNK_ROWS / spec.rows_per_entity))
+    for start in range(0, total, step):
+        yield start, min(start + step, total)
+
+
+FINALIZE_SQL = [
+    # Denormalized counters from the generated rows
+    """UPDATE content c SET view_count = s.n FROM (
+        SELECT content_id, COUNT(*) AS n FROM content_views GROUP BY content_id) s WHERE c.id = s.content_id""",
+    """UPDATE content c SET like_count = s.n FROM (
+        SELECT content_id, COUNT(*) AS n FROM content_likes GROUP BY content_id) s WHERE c.id = s.content_id""",
+    """UPDATE content c SET comment_count = s.n FROM (
+        SELECT content_id, COUNT(*) AS n FROM comments GROUP BY content_id) s WHERE c.id = s.content_id""",
+    """UPDATE prompts p SET like_count = s.n FROM (
+        SELECT prompt_id, COUNT(*) AS n FROM prompt_likes GROUP BY prompt_id) s WHERE p.id = s.prompt_id""",
+    """UPDATE prompts p SET save_count = s.n FROM (
+        SELECT prompt_id, COUNT(*) AS n FROM prompt_saves GROUP BY prompt_id) s WHERE p.id = s.prompt_id""",
+    """UPDATE users u SET follower_count = s.n FROM (
+        SELECT following_id, COUNT(*) AS n FROM user_followers GROUP BY following_id) s WHERE u.id = s.following_id""",
+    """UPDATE users u SET following_count = s.n FROM (
+        SELECT follower_id, COUNT(*) AS n FROM user_followers GROUP BY follower_id) s WHERE u.id = s.follower_id""",
+    """UPDATE collections c SET item_count = s.n FROM (
+        SELECT collection_id, COUNT(*) AS n FROM collection_items GROUP BY collection_id) s WHERE c.id = s.collection_id""",
+    """UPDATE prompt_tags t SET use_count = s.n FROM (
+        SELECT tag_id, COUNT(*) AS n FROM (
+            SELECT tag_id FROM prompt_tag_relations UNION ALL SELECT tag_id FROM content_tags) r
+        GROUP BY tag_id) s WHERE t.id = s.tag_id""",
+    # Leaderboards from recent views
+    """INSERT INTO trending_content (content_id, rank_position, period, score)
+        SELECT content_id, r, period, LEAST(n, 99999999)
+        FROM (
+            SELECT v.content_id, p.period, COUNT(*) AS n,
+                   ROW_NUMBER() OVER (PARTITION BY p.period ORDER BY COUNT(*) DESC, v.content_id) AS r
+            FROM content_views v
+            JOIN (VALUES ('daily', INTERVAL '1 day'), ('weekly', INTERVAL '7 days'),
+                         ('monthly', INTERVAL '30 days'), ('all_time', INTERVAL '100 years')) p(period, span)
+              ON v.created_at >= TIMESTAMP '{end}' - p.span
+            GROUP BY v.content_id, p.period
+        ) ranked WHERE r <= 100""",
+    """INSERT INTO trending_hashtags (tag_id, rank_position, period, mention_count, is_hot)
+        SELECT id, ROW_NUMBER() OVER (PARTITION BY period ORDER BY use_count DESC, id), period,
+               use_count, ROW_NUMBER() OVER (PARTITION BY period ORDER BY use_count DESC, id) <= 5
+        FROM prompt_tags CROSS JOIN (VALUES ('daily'), ('weekly'), ('monthly')) p(period)""",
+    "SELECT setval('prompt_categories_id_seq', (SELECT MAX(id) FROM prompt_categories))",
+    "SELECT setval('prompt_tags_id_seq', (SELECT MAX(id) FROM prompt_tags))",
+    "ANALYZE",
+]
+
+
+async def prepare(cfg: SeedConfig, truncate: bool) -> None:
+    """Check the target is empty (or truncate it) and load lookup tables"""
+    conn = await connect(cfg.dsn)
+    try:
+        if truncate:
+            await conn.execute("TRUNCATE users, prompt_categories, prompt_tags RESTART IDENTITY CASCADE")
+        elif await conn.fetchval("SELECT EXISTS (SELECT 1 FROM users)"):
+            raise SystemExit("Database already has users; pass --truncate to replace all data")
+
+        await conn.copy_records_to_table(
+            "prompt_categories",
+            records=[(*category, position) for position, category in enumerate(CATEGORIES, 1)],
+            columns=["id", "name", "slug", "description", "icon", "color", "display_order"]
+        )
+        tags = [
+            (i + 1, name, name)
+            for i, name in enumerate(TAG_WORDS + [f"{ADJECTIVES[i % 20]}-{NOUNS[i // 20 % 20]}-{i}" for i in range(TAG_COUNT - len(TAG_WORDS))])
+        ]
+        await conn.copy_records_to_table("prompt_tags", records=tags, columns=["id", "name", "slug"])
+    finally:
+        await conn.close()
+
+
+async def finalize(cfg: SeedConfig) -> None:
+    conn = await connect(cfg.dsn)
+    try:
+        for statement in FINALIZE_SQL:
+            await conn.execute(statement.format(end=EPOCH_END.isoformat(sep=" ")))
+    finally:
+        await conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate production-scale synthetic data")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4)
+    parser.add_argument("--truncate", action="store_true", help="Delete all existing data first")
+    parser.add_argument("--dry-run", action="store_true", help="Generate rows without a database")
+    parser.add_argument("--dsn", help="PostgreSQL DSN (defaults to DATABASE_URL from settings)")
+    for name in SCALES["small"]:
+        parser.add_argument(f"--{name.replace('_', '-')}", type=int, help=f"Override the preset's {name}")
+    args = parser.parse_args()
+
+    sizes = dict(SCALES[args.scale])
+    sizes.update({name: getattr(args, name) for name in sizes if getattr(args, name) is not None})
+
+    dsn = args.dsn
+    if not dsn and not args.dry_run:
+        from app.config import get_settings
+        dsn = get_settings().DATABASE_URL.replace("+asyncpg", "")
+    cfg = SeedConfig(seed=args.seed, dsn=dsn or "", dry_run=args.dry_run, **sizes)
+
+    print(f"🌱 Seeding scale={args.scale} seed={cfg.seed} workers={args.workers}")
+    print("   " + ", ".join(f"{name}={value:,}" for name, value in sizes.items()))
+    started = time.perf_counter()
+
+    if not cfg.dry_run:
+        asyncio.run(prepare(cfg, args.truncate))
+
+    totals: Dict[str, int] = {}
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for stage in sorted({spec.stage for spec in TABLES.values()}):
+            stage_started = time.perf_counter()
+            futures = [
+                pool.submit(run_chunk, table, start, stop, cfg)
+                for table, spec in TABLES.items() if spec.stage == stage
+                for start, stop in chunks(cfg, table)
+            ]
+            for future in as_completed(futures):
+                table, rows = future.result()
+                totals[table] = totals.get(table, 0) + rows
+            tables = [table for table, spec in TABLES.items() if spec.stage == stage]
+            print(
+                f"   stage {stage} ({time.perf_counter() - stage_started:6.1f}s): "
+                + ", ".join(f"{table}={totals.get(table, 0):,}" for table in tables)
+            )
+
+    if not cfg.dry_run:
+        finalize_started = time.perf_counter()
+        asyncio.run(finalize(cfg))
+        print(f"   counters, leaderboards and ANALYZE ({time.perf_counter() - finalize_started:6.1f}s)")
+
+    print(f"✅ {sum(totals.values()):,} rows in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark: list response serialization
+
+Compares FastAPI's default path (return ORM objects and let `response_model=`
+validate and encode them) with the fast path (validate once into the schema and
+return model_response()) for a page of prompts with embedded author, category
+and tags, end to end and per encoder. The jsonable_encoder row is what older
+FastAPI releases do after validation.
+
+Run from backend/:
+    python -m benchmarks.serialization --page-size 100
+"""
+import argparse
+import json
+import statistics
+import time
+import timeit
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from fastapi.testclient import TestClient
+
+from app.models.prompt import Prompt, PromptCategory, PromptTag, PromptTagRelation
+from app.models.user import User
+from app.schemas.prompt import PromptListResponse
+from app.utils.serialization import dump_json, model_response, orjson
+
+
+def make_prompts(count: int):
+    """Build detached ORM prompts shaped like an eagerly loaded list page"""
+    now = datetime(2024, 1, 1)
+    category = PromptCategory(id=1, name="Photography", slug="photography")
+    tags = [PromptTag(id=i, name=f"tag-{i}", slug=f"tag-{i}") for i in range(3)]
+    prompts = []
+    for i in range(count):
+        author = User(
+            id=uuid.uuid4(), username=f"creator{i}", display_name=f"Creator {i}",
+            avatar_url=f"https://cdn.example.com/avatars/{i}.png", is_verified=i % 2 == 0
+        )
+        prompt = Prompt(
+            id=uuid.uuid4(), user_id=author.id, category_id=category.id,
+            title=f"Cinematic portrait #{i}", prompt_text="A cinematic portrait, golden hour, 85mm " * 8,
+            description="Moody lighting with shallow depth of field", type="image",
+            preview_image_url=f"https://cdn.example.com/previews/{i}.jpg",
+            is_featured=False, is_public=True, use_count=i * 7, like_count=i * 3, save_count=i,
+            created_at=now - timedelta(minutes=i), updated_at=now
+        )
+        prompt.user = author
+        prompt.category = category
+        prompt.tags = [PromptTagRelation(tag=tag) for tag in tags]
+        prompts.append(prompt)
+    return prompts
+
+
+def build_app(prompts) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/default", response_model=PromptListResponse)
+    async def default_path():
+        return {"items": prompts, "total": len(prompts), "page": 1, "page_size": len(prompts)}
+
+    @app.get("/fast", response_model=PromptListResponse)
+    async def fast_path():
+        return model_response(PromptListResponse(
+            items=prompts, total=len(prompts), page=1, page_size=len(prompts)
+        ))
+
+    return app
+
+
+def measure(client: TestClient, path: str, iterations: int):
+    client.get(path)  # warm up
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        response = client.get(path)
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings, len(response.content)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark list response serialization")
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    prompts = make_prompts(args.page_size)
+    client = TestClient(build_app(prompts))
+
+    print(f"page_size={args.page_size} iterations={args.iterations} orjson={'yes' if orjson else 'no'}")
+    results = {}
+    for name in ("default", "fast"):
+        timings, size = measure(client, f"/{name}", args.iterations)
+        results[name] = statistics.median(timings)
+        print(
+            f"  {name:8} median {statistics.median(timings):7.2f} ms"
+            f"  p95 {sorted(timings)[int(len(timings) * 0.95) - 1]:7.2f} ms  body {size} bytes"
+        )
+    print(f"  speedup  {results['default'] / results['fast']:.2f}x")
+
+    payload = PromptListResponse(items=prompts, total=len(prompts), page=1, page_size=len(prompts))
+    rows = payload.model_dump()
+    encoders = {
+        "validate from ORM": lambda: PromptListResponse(
+            items=prompts, total=len(prompts), page=1, page_size=len(prompts)
+        ),
+        "jsonable_encoder + json": lambda: json.dumps(jsonable_encoder(payload)).encode(),
+        "dump_json(model)": lambda: dump_json(payload),
+        "dump_json(dicts)": lambda: dump_json(rows)
+    }
+    print("per call:")
+    for name, encode in encoders.items():
+        best = min(timeit.repeat(encode, number=20, repeat=5)) / 20 * 1000
+        print(f"  {name:24} {best:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Production server configuration
+
+    gunicorn -c gunicorn.conf.py
+
+Runs app.main:app under gunicorn with one uvicorn worker (one event loop) per
+available CPU. The app is imported once in the master and forked, so modules,
+compiled templates and other read-only state are shared copy-on-write; workers
+are recycled after MAX_REQUESTS (+ jitter) requests to bound memory growth,
+and on shutdown each worker stops accepting connections, finishes in-flight
+requests and runs the lifespan shutdown (stopping background services and
+flushing metrics) within GRACEFUL_TIMEOUT.
+
+Environment overrides: BIND, WEB_CONCURRENCY, MAX_REQUESTS, MAX_REQUESTS_JITTER,
+GRACEFUL_TIMEOUT, TIMEOUT, KEEPALIVE.
+"""
+import gc
+import os
+import shutil
+import tempfile
+
+from app.config import Settings
+
+
+def available_cpus() -> int:
+    """CPUs this process may run on (respects affinity / container cpusets)"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+wsgi_app = "app.main:app"
+worker_class = "uvicorn.workers.UvicornWorker"
+bind = os.environ.get("BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("WEB_CONCURRENCY", available_cpus()))
+
+preload_app = True
+max_requests = int(os.environ.get("MAX_REQUESTS", 10000))
+# Stagger recycling so workers don't all restart at once
+max_requests_jitter = int(os.environ.get("MAX_REQUESTS_JITTER", max_requests // 10))
+graceful_timeout = int(os.environ.get("GRACEFUL_TIMEOUT", 30))
+timeout = int(os.environ.get("TIMEOUT", 60))
+keepalive = int(os.environ.get("KEEPALIVE", 5))
+
+
+def metrics_directory() -> str:
+    """Where workers exchange metrics snapshots (see app/utils/metrics.py)"""
+    return Settings().METRICS_MULTIPROC_DIR or os.path.join(tempfile.gettempdir(), "viralprompt-metrics")
+
+
+def when_ready(server):
+    """Finish loading shared state in the master, then freeze it for copy-on-write"""
+    from app.routers.pages import templates
+    from app.services.warmup import WarmupService
+    from app.utils.metrics import registry
+
+    if Settings().DEBUG:
+        server.log.warning("DEBUG is enabled: SQL echo and /docs are on; set DEBUG=False in production")
+
+    # Start from an empty directory so a previous run's counters aren't merged
+    directory = metrics_directory()
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory, exist_ok=True)
+    registry.multiprocess_dir = directory
+
+    WarmupService.compile_templates(templates)
+    # Objects created so far are never collected, so the collector's bookkeeping
+    # doesn't write to (and un-share) their pages in every worker
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    """Drop pool state inherited from the master; each worker opens its own connections"""
+    from app.database import engine
+
+    engine.sync_engine.dispose(close=False)
@@ -0,0 +1,13 @@
+-- Migration 001: denormalized follower/following counts on users
+-- Apply to databases created before these columns were added to schema.sql
+
+ALTER TABLE users ADD COLUMN IF NOT EXISTS follower_count INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE users ADD COLUMN IF NOT EXISTS following_count INTEGER NOT NULL DEFAULT 0;
+
+-- Reverse lookups ("who follows X") use following_id; the primary key covers follower_id
+CREATE INDEX IF NOT EXISTS idx_user_followers_following_id ON user_followers(following_id);
+
+-- Backfill from the existing follow graph
+UPDATE users u SET
+    follower_count = (SELECT COUNT(*) FROM user_followers f WHERE f.following_id = u.id),
+    following_count = (SELECT COUNT(*) FROM user_followers f WHERE f.follower_id = u.id);
@@ -0,0 +1,37 @@
+-- Migration 002: materialized path for threaded comments
+-- Each comment stores its top-level ancestor (root_id), its depth and a path of
+-- fixed-width segments (14 hex digits of epoch microseconds + 6 hex digits of
+-- the id, joined with '.'), so a subtree is one index range scan.
+
+ALTER TABLE comments ADD COLUMN IF NOT EXISTS root_id UUID;
+ALTER TABLE comments ADD COLUMN IF NOT EXISTS path TEXT COLLATE "C";
+ALTER TABLE comments ADD COLUMN IF NOT EXISTS depth INTEGER NOT NULL DEFAULT 0;
+
+WITH RECURSIVE tree AS (
+    SELECT id, id AS root_id, 0 AS depth,
+           lpad(to_hex((extract(epoch FROM created_at) * 1000000)::bigint), 14, '0')
+               || substr(replace(id::text, '-', ''), 1, 6) AS path
+    FROM comments
+    WHERE parent_id IS NULL
+    UNION ALL
+    SELECT c.id, t.root_id, t.depth + 1,
+           t.path || '.' || lpad(to_hex((extract(epoch FROM c.created_at) * 1000000)::bigint), 14, '0')
+               || substr(replace(c.id::text, '-', ''), 1, 6)
+    FROM comments c
+    JOIN tree t ON c.parent_id = t.id
+)
+UPDATE comments c
+SET root_id = tree.root_id, depth = tree.depth, path = tree.path
+FROM tree
+WHERE c.id = tree.id;
+
+ALTER TABLE comments ALTER COLUMN root_id SET NOT NULL;
+ALTER TABLE comments ALTER COLUMN path SET NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_comments_content_path ON comments(content_id, path);
+CREATE INDEX IF NOT EXISTS idx_comments_root_path ON comments(root_id, path);
+CREATE INDEX IF NOT EXISTS idx_comments_content_top_level
+    ON comments(content_id, created_at DESC) WHERE parent_id IS NULL;
+
+-- Resync denormalized counts
+UPDATE content ct SET comment_count = (SELECT COUNT(*) FROM comments c WHERE c.content_id = ct.id);
@@ -0,0 +1,16 @@
+-- Migration 003: keyset ordering for collection items
+-- Apply to databases created before idx_collection_items_order was added to schema.sql
+
+-- Serves "WHERE collection_id = ? AND (display_order, id) > (?, ?) ORDER BY display_order, id"
+CREATE INDEX IF NOT EXISTS idx_collection_items_order ON collection_items(collection_id, display_order, id);
+
+-- Spread existing items 1024 apart (ORDER_GAP in routers/collections.py) so
+-- moves can take the midpoint of their neighbours without renumbering
+UPDATE collection_items ci SET display_order = ordered.position * 1024
+FROM (
+    SELECT id, ROW_NUMBER() OVER (
+        PARTITION BY collection_id ORDER BY display_order, added_at, id
+    ) AS position
+    FROM collection_items
+) ordered
+WHERE ordered.id = ci.id;
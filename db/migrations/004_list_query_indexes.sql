@@ -0,0 +1,48 @@
+-- Migration 004: composite and partial indexes matching the list query shapes
+-- Public listings filter "is_public = true" (plus type / category_id / user_id)
+-- and order by created_at DESC, so each index below returns a page in order
+-- without a sort, and the partial predicate keeps private rows out of it.
+--
+-- CREATE INDEX CONCURRENTLY cannot run inside a transaction block: apply with
+-- plain `psql -f` (autocommit), not `psql -1`.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Prompts: GET /api/prompts [?type=] [?category_id=] [?search=], feed snapshot
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_prompts_public_created ON prompts(created_at DESC) WHERE is_public;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_prompts_public_type_created ON prompts(type, created_at DESC) WHERE is_public;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_prompts_public_category_created ON prompts(category_id, created_at DESC) WHERE is_public;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_prompts_public_use_count ON prompts(use_count DESC) WHERE is_public;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_prompts_user_created ON prompts(user_id, created_at DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_prompts_title_trgm ON prompts USING gin (title gin_trgm_ops);
+
+-- Content: GET /api/content [?type=] [?user_id=], GET /api/content/trending, feed snapshot
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_content_public_created ON content(created_at DESC) WHERE is_public;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_content_public_type_created ON content(type, created_at DESC) WHERE is_public;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_content_public_trending ON content(view_count DESC, like_count DESC) WHERE is_public;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_content_user_created ON content(user_id, created_at DESC);
+
+-- Collections: GET /api/collections [?user_id=], GET /api/collections/me
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_collections_public_created ON collections(created_at DESC) WHERE is_public;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_collections_user_created ON collections(user_id, created_at DESC);
+
+-- Viewer "saved" state looks collection items up by content / prompt
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_collection_items_content_id ON collection_items(content_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_collection_items_prompt_id ON collection_items(prompt_id);
+
+-- Single-column indexes now covered by the composites above
+DROP INDEX CONCURRENTLY IF EXISTS idx_prompts_user_id;
+DROP INDEX CONCURRENTLY IF EXISTS idx_prompts_type;
+DROP INDEX CONCURRENTLY IF EXISTS idx_prompts_category_id;
+DROP INDEX CONCURRENTLY IF EXISTS idx_prompts_created_at;
+DROP INDEX CONCURRENTLY IF EXISTS idx_prompts_use_count;
+DROP INDEX CONCURRENTLY IF EXISTS idx_content_user_id;
+DROP INDEX CONCURRENTLY IF EXISTS idx_content_type;
+DROP INDEX CONCURRENTLY IF EXISTS idx_content_created_at;
+DROP INDEX CONCURRENTLY IF EXISTS idx_content_view_count;
+DROP INDEX CONCURRENTLY IF EXISTS idx_collections_user_id;
+
+ANALYZE prompts;
+ANALYZE content;
+ANALYZE collections;
+ANALYZE collection_items;
@@ -0,0 +1,14 @@
+-- Migration 005: revoked access tokens
+-- Logout records the token's jti here until the token would have expired; each
+-- API worker keeps a bloom filter of the unexpired rows (rebuilt periodically)
+-- and only looks a jti up when the filter reports a possible match. Expired
+-- rows are purged by the sync, so the table stays small.
+
+CREATE TABLE IF NOT EXISTS revoked_tokens (
+    jti VARCHAR(64) PRIMARY KEY,
+    user_id UUID REFERENCES users(id) ON DELETE CASCADE,
+    expires_at TIMESTAMP NOT NULL,
+    revoked_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_revoked_tokens_expires_at ON revoked_tokens(expires_at);
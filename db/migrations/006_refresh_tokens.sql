@@ -0,0 +1,17 @@
+-- Migration 006: refresh tokens
+-- Only a keyed hash of each token is stored. Tokens of one login share a
+-- family_id; a used token is kept (used_at set) until it expires so that
+-- presenting it again revokes the whole family. Expired rows are purged by
+-- the API workers' revocation sync.
+
+CREATE TABLE IF NOT EXISTS refresh_tokens (
+    token_hash VARCHAR(64) PRIMARY KEY,
+    user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    family_id UUID NOT NULL,
+    expires_at TIMESTAMP NOT NULL,
+    used_at TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_refresh_tokens_family_id ON refresh_tokens(family_id);
+CREATE INDEX IF NOT EXISTS idx_refresh_tokens_expires_at ON refresh_tokens(expires_at);
@@ -3,6 +3,7 @@
 
 -- Enable UUID extension
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
 
 -- ============================================
 -- USERS & AUTHENTICATION
@@ -22,6 +23,8 @@ CREATE TABLE users (
     is_premium BOOLEAN DEFAULT FALSE,
     credits_balance INTEGER DEFAULT 50,
     role VARCHAR(20) DEFAULT 'user' CHECK (role IN ('user', 'creator', 'admin')),
+    follower_count INTEGER NOT NULL DEFAULT 0,
+    following_count INTEGER NOT NULL DEFAULT 0,
     email_verified_at TIMESTAMP,
     last_login_at TIMESTAMP,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -47,6 +50,29 @@ CREATE TABLE user_settings (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Access tokens revoked before expiry (logout); rows past expires_at are purged
+CREATE TABLE revoked_tokens (
+    jti VARCHAR(64) PRIMARY KEY,
+    user_id UUID REFERENCES users(id) ON DELETE CASCADE,
+    expires_at TIMESTAMP NOT NULL,
+    revoked_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX idx_revoked_tokens_expires_at ON revoked_tokens(expires_at);
+
+-- Refresh tokens, stored by keyed hash; one family per login, rotated on each use
+CREATE TABLE refresh_tokens (
+    token_hash VARCHAR(64) PRIMARY KEY,
+    user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    family_id UUID NOT NULL,
+    expires_at TIMESTAMP NOT NULL,
+    used_at TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX idx_refresh_tokens_family_id ON refresh_tokens(family_id);
+CREATE INDEX idx_refresh_tokens_expires_at ON refresh_tokens(expires_at);
+
 -- ============================================
 -- PROMPTS
 -- ============================================
@@ -167,6 +193,9 @@ CREATE TABLE comments (
     content_id UUID REFERENCES content(id) ON DELETE CASCADE,
     user_id UUID REFERENCES users(id) ON DELETE CASCADE,
     parent_id UUID REFERENCES comments(id) ON DELETE CASCADE,
+    root_id UUID NOT NULL,
+    path TEXT COLLATE "C" NOT NULL,
+    depth INTEGER NOT NULL DEFAULT 0,
     body TEXT NOT NULL,
     like_count INTEGER DEFAULT 0,
     is_edited BOOLEAN DEFAULT FALSE,
@@ -294,18 +323,29 @@ CREATE TABLE notifications (
 
 CREATE INDEX idx_users_username ON users(username);
 CREATE INDEX idx_users_email ON users(email);
-CREATE INDEX idx_prompts_user_id ON prompts(user_id);
-CREATE INDEX idx_prompts_type ON prompts(type);
-CREATE INDEX idx_prompts_category_id ON prompts(category_id);
-CREATE INDEX idx_prompts_created_at ON prompts(created_at DESC);
-CREATE INDEX idx_prompts_use_count ON prompts(use_count DESC);
-CREATE INDEX idx_content_user_id ON content(user_id);
-CREATE INDEX idx_content_type ON content(type);
-CREATE INDEX idx_content_created_at ON content(created_at DESC);
-CREATE INDEX idx_content_view_count ON content(view_count DESC);
+CREATE INDEX idx_user_followers_following_id ON user_followers(following_id);
+-- List queries filter is_public (plus type / category_id / user_id) and order
+-- by created_at DESC; these composites return a page in order without a sort
+CREATE INDEX idx_prompts_public_created ON prompts(created_at DESC) WHERE is_public;
+CREATE INDEX idx_prompts_public_type_created ON prompts(type, created_at DESC) WHERE is_public;
+CREATE INDEX idx_prompts_public_category_created ON prompts(category_id, created_at DESC) WHERE is_public;
+CREATE INDEX idx_prompts_public_use_count ON prompts(use_count DESC) WHERE is_public;
+CREATE INDEX idx_prompts_user_created ON prompts(user_id, created_at DESC);
+CREATE INDEX idx_prompts_title_trgm ON prompts USING gin (title gin_trgm_ops);
+CREATE INDEX idx_content_public_created ON content(created_at DESC) WHERE is_public;
+CREATE INDEX idx_content_public_type_created ON content(type, created_at DESC) WHERE is_public;
+CREATE INDEX idx_content_public_trending ON content(view_count DESC, like_count DESC) WHERE is_public;
+CREATE INDEX idx_content_user_created ON content(user_id, created_at DESC);
 CREATE INDEX idx_content_views_content_id ON content_views(content_id);
 CREATE INDEX idx_content_views_created_at ON content_views(created_at);
-CREATE INDEX idx_collections_user_id ON collections(user_id);
+CREATE INDEX idx_comments_content_path ON comments(content_id, path);
+CREATE INDEX idx_comments_root_path ON comments(root_id, path);
+CREATE INDEX idx_comments_content_top_level ON comments(content_id, created_at DESC) WHERE parent_id IS NULL;
+CREATE INDEX idx_collections_public_created ON collections(created_at DESC) WHERE is_public;
+CREATE INDEX idx_collections_user_created ON collections(user_id, created_at DESC);
+CREATE INDEX idx_collection_items_order ON collection_items(collection_id, display_order, id);
+CREATE INDEX idx_collection_items_content_id ON collection_items(content_id);
+CREATE INDEX idx_collection_items_prompt_id ON collection_items(prompt_id);
 CREATE INDEX idx_generation_jobs_user_id ON generation_jobs(user_id);
 CREATE INDEX idx_generation_jobs_status ON generation_jobs(status);
 CREATE INDEX idx_notifications_user_id ON notifications(user_id);